@@ -0,0 +1,29 @@
+"""Add version to tickets
+
+Revision ID: 9d3f6b7c2e15
+Revises: 5c1e8a2f9b47
+Create Date: 2026-10-19 11:40:02.571934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6b7c2e15'
+down_revision: Union[str, Sequence[str], None] = '5c1e8a2f9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Constant server default: no table rewrite on PostgreSQL 11+
+    op.add_column('tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickets', 'version')
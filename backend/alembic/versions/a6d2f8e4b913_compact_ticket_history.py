@@ -0,0 +1,265 @@
+"""Compact ticket history: native id refs, comment refs and text patches
+
+Revision ID: a6d2f8e4b913
+Revises: f3c9a2b71e48
+Create Date: 2026-10-20 00:31:07.228416
+
+"""
+import json
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2f8e4b913'
+down_revision: Union[str, Sequence[str], None] = 'f3c9a2b71e48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# History rows rewritten per statement
+BATCH_SIZE = 5000
+# Tickets whose description history is rewritten per round trip
+TICKET_BATCH_SIZE = 500
+# Same value as in app.crud.history_log at the time of this migration
+DIFF_MIN_LENGTH = 200
+# Every this many rows of a ticket's description history keeps both texts,
+# so each patch is a bounded walk away from a full text
+SNAPSHOT_INTERVAL = 20
+
+UUID_RE = '^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+# Rows whose values are ids
+ID_ROWS = """
+    (field_name IN ('column_id', 'assignee_id', 'created_by_id')
+     OR action_type IN ('WATCHER_ADDED', 'WATCHER_REMOVED'))
+"""
+
+history_encoding = postgresql.ENUM('PATCH', name='historyencoding', create_type=False)
+
+# Text not known at this point of a ticket's history
+UNKNOWN = object()
+
+
+# Copies of app.core.textpatch at the time of this migration: [start, end, text, removed] ops
+
+def _diff(old: str, new: str) -> list:
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return [[prefix, len(old) - suffix, new[prefix:len(new) - suffix], old[prefix:len(old) - suffix]]]
+
+
+def _apply(text: str, ops: list):
+    """The text after the ops, or None if they don't fit it."""
+    parts = []
+    position = 0
+    for start, end, insert, removed in sorted(ops, key=lambda op: (op[0], op[1])):
+        if start < position or end > len(text) or text[start:end] != removed:
+            return None
+        parts += [text[position:start], insert]
+        position = end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+
+def _revert(text: str, ops: list):
+    """The text before the ops, or None if they don't fit it."""
+    inverse = []
+    shift = 0
+    for start, end, insert, removed in sorted(ops, key=lambda op: (op[0], op[1])):
+        inverse.append([start + shift, start + shift + len(insert), removed, insert])
+        shift += len(insert) - (end - start)
+    return _apply(text, inverse)
+
+
+def _ticket_batches(conn):
+    """Ids of tickets with description history, in batches."""
+    last_id = None
+    while True:
+        ticket_ids = conn.execute(
+            sa.text("""
+                SELECT DISTINCT ticket_id FROM ticket_history
+                WHERE field_name = 'description'
+                  AND (CAST(:last_id AS uuid) IS NULL OR ticket_id > CAST(:last_id AS uuid))
+                ORDER BY ticket_id LIMIT :batch
+            """),
+            {'last_id': last_id, 'batch': TICKET_BATCH_SIZE}
+        ).scalars().all()
+        if not ticket_ids:
+            return
+        yield ticket_ids
+        last_id = ticket_ids[-1]
+
+
+def _description_rows(conn, ticket_ids: list):
+    rows = conn.execute(
+        sa.text("""
+            SELECT id, ticket_id, action_type, old_value, new_value, encoding FROM ticket_history
+            WHERE ticket_id = ANY(:ticket_ids) AND field_name = 'description'
+            ORDER BY ticket_id, created_at, id
+        """),
+        {'ticket_ids': ticket_ids}
+    ).all()
+    return groupby(rows, key=lambda row: row.ticket_id)
+
+
+def _compact_descriptions(conn) -> None:
+    # A long edit becomes a patch only when its old text is the previous row's new text,
+    # i.e. when it can be rebuilt from the full row before it. Rows of an earlier run
+    # are followed through, so an interrupted upgrade resumes where it stopped.
+    for ticket_ids in _ticket_batches(conn):
+        patches = []
+        for _, rows in _description_rows(conn, ticket_ids):
+            text = UNKNOWN
+            since_full = 0
+            for row in rows:
+                if row.encoding == 'PATCH':
+                    new = None if text is UNKNOWN else _apply(text, json.loads(row.new_value))
+                    text = UNKNOWN if new is None else new
+                    since_full += 1
+                    continue
+                long = max(len(row.old_value or ''), len(row.new_value or '')) > DIFF_MIN_LENGTH
+                if (long and text is not UNKNOWN and row.old_value is not None and row.new_value is not None
+                        and row.old_value == text and since_full < SNAPSHOT_INTERVAL - 1):
+                    patches.append({'id': row.id, 'patch': json.dumps(_diff(row.old_value, row.new_value))})
+                    since_full += 1
+                else:
+                    since_full = 0
+                text = row.new_value if row.new_value is not None else UNKNOWN
+        if patches:
+            conn.execute(
+                sa.text("""
+                    UPDATE ticket_history SET old_value = NULL, new_value = :patch, encoding = 'PATCH'
+                    WHERE id = :id AND encoding IS NULL
+                """),
+                patches
+            )
+
+
+def _expand_descriptions(conn) -> None:
+    # Rebuild both texts of every patch, forwards from the full rows and the creation
+    # snapshot, then backwards from the ticket's current description for the rest.
+    # A patch is only trusted where its removed (or inserted) text fits.
+    for ticket_ids in _ticket_batches(conn):
+        current = dict(conn.execute(
+            sa.text("SELECT id, description FROM tickets WHERE id = ANY(:ticket_ids)"),
+            {'ticket_ids': ticket_ids}
+        ).all())
+        texts = []
+        for ticket_id, rows in _description_rows(conn, ticket_ids):
+            rows = list(rows)
+            resolved = {}
+            text = UNKNOWN
+            for row in rows:
+                if row.encoding != 'PATCH':
+                    text = row.new_value or ''
+                    continue
+                new = None if text is UNKNOWN else _apply(text, json.loads(row.new_value))
+                if new is not None:
+                    resolved[row.id] = (text, new)
+                text = UNKNOWN if new is None else new
+            text = current.get(ticket_id) or ''
+            for row in reversed(rows):
+                if row.encoding != 'PATCH':
+                    # No old text: the description was empty, or this is an unmarked patch
+                    text = UNKNOWN if row.action_type == 'TICKET_CREATED' or row.old_value is None else row.old_value
+                    continue
+                if row.id in resolved:
+                    text = resolved[row.id][0]
+                    continue
+                old = None if text is UNKNOWN else _revert(text, json.loads(row.new_value))
+                if old is not None:
+                    resolved[row.id] = (old, text)
+                text = UNKNOWN if old is None else old
+            texts += [{'id': id_, 'old': old, 'new': new} for id_, (old, new) in resolved.items()]
+        if texts:
+            conn.execute(
+                sa.text("""
+                    UPDATE ticket_history SET old_value = :old, new_value = :new, encoding = NULL
+                    WHERE id = :id AND encoding = 'PATCH'
+                """),
+                texts
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    history_encoding.create(op.get_bind(), checkfirst=True)
+    # IF NOT EXISTS: the columns are committed before the batches below, so a failed
+    # run leaves them behind without stamping the revision
+    op.execute("ALTER TABLE ticket_history ADD COLUMN IF NOT EXISTS old_ref UUID")
+    op.execute("ALTER TABLE ticket_history ADD COLUMN IF NOT EXISTS new_ref UUID")
+    op.execute("ALTER TABLE ticket_history ADD COLUMN IF NOT EXISTS comment_id UUID")
+    op.execute("ALTER TABLE ticket_history ADD COLUMN IF NOT EXISTS encoding historyencoding")
+
+    # Rewrite existing rows in batches, each statement committing on its own, so the
+    # largest table is never locked or held in one transaction as a whole.
+    # Every statement only touches rows not rewritten yet, so a rerun picks up the rest.
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        last_id = None
+        while True:
+            ids = conn.execute(
+                sa.text("""
+                    SELECT id FROM ticket_history
+                    WHERE (CAST(:last_id AS uuid) IS NULL OR id > CAST(:last_id AS uuid))
+                    ORDER BY id LIMIT :batch
+                """),
+                {'last_id': last_id, 'batch': BATCH_SIZE}
+            ).scalars().all()
+            if not ids:
+                break
+            conn.execute(sa.text(f"""
+                UPDATE ticket_history SET
+                    old_ref = CASE WHEN old_value ~ :uuid_re THEN old_value::uuid END,
+                    new_ref = CASE WHEN new_value ~ :uuid_re THEN new_value::uuid END,
+                    old_value = CASE WHEN old_value ~ :uuid_re THEN NULL ELSE old_value END,
+                    new_value = CASE WHEN new_value ~ :uuid_re THEN NULL ELSE new_value END
+                WHERE id = ANY(:ids) AND {ID_ROWS}
+                  AND (old_value ~ :uuid_re OR new_value ~ :uuid_re)
+            """), {'ids': ids, 'uuid_re': UUID_RE})
+            # Best match for old rows: a comment of that ticket by the same author with that
+            # content. The row keeps its text, which stays the comment as it was posted.
+            conn.execute(sa.text("""
+                UPDATE ticket_history SET comment_id = comments.id
+                FROM comments
+                WHERE ticket_history.id = ANY(:ids)
+                  AND ticket_history.action_type = 'COMMENT_ADDED'
+                  AND ticket_history.comment_id IS NULL
+                  AND comments.ticket_id = ticket_history.ticket_id
+                  AND comments.author_id = ticket_history.actor_id
+                  AND comments.content = ticket_history.new_value
+            """), {'ids': ids})
+            last_id = ids[-1]
+        _compact_descriptions(conn)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        _expand_descriptions(op.get_bind())
+    # Patches that fit neither neighbour (history edited by hand) keep their ops
+    op.execute("""
+        UPDATE ticket_history SET
+            old_value = coalesce(old_value, old_ref::text),
+            new_value = coalesce(new_value, new_ref::text)
+        WHERE old_ref IS NOT NULL OR new_ref IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE ticket_history SET new_value = comments.content
+        FROM comments
+        WHERE ticket_history.comment_id = comments.id
+          AND ticket_history.action_type = 'COMMENT_ADDED'
+          AND ticket_history.new_value IS NULL
+    """)
+    op.drop_column('ticket_history', 'encoding')
+    op.drop_column('ticket_history', 'comment_id')
+    op.drop_column('ticket_history', 'new_ref')
+    op.drop_column('ticket_history', 'old_ref')
+    history_encoding.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,42 @@
+"""Add ticket updated_at filter indexes
+
+Revision ID: b3f7d91c4a26
+Revises: e2a9c64f1d07
+Create Date: 2026-10-20 03:12:45.671093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f7d91c4a26'
+down_revision: Union[str, Sequence[str], None] = 'e2a9c64f1d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Filtered listings sorted by updated_at; the created_at ones come with c58e1b7a2d94
+LISTING_INDEXES = [
+    ('ix_tickets_column_id_updated_at', ['column_id', 'updated_at', 'id']),
+    ('ix_tickets_board_id_assignee_id_updated_at', ['board_id', 'assignee_id', 'updated_at', 'id']),
+    ('ix_tickets_board_id_created_by_id_updated_at', ['board_id', 'created_by_id', 'updated_at', 'id']),
+    ('ix_tickets_board_id_priority_updated_at', ['board_id', 'priority', 'updated_at', 'id']),
+]
+LIVE = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps tickets writable while the indexes build; it can't run in a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in LISTING_INDEXES:
+            op.create_index(name, 'tickets', columns, unique=False, postgresql_where=LIVE,
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(LISTING_INDEXES):
+        op.drop_index(name, table_name='tickets')
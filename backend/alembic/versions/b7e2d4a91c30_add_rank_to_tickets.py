@@ -0,0 +1,41 @@
+"""Add rank to tickets
+
+Revision ID: b7e2d4a91c30
+Revises: 9d3f6b7c2e15
+Create Date: 2026-10-19 20:05:41.318260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a91c30'
+down_revision: Union[str, Sequence[str], None] = '9d3f6b7c2e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('rank', sa.String(collation='C'), nullable=True))
+    # Existing tickets keep their creation order. Fixed-width keys compare like the numbers;
+    # the "V" suffix keeps them from ending in "0" so cards can be placed right before any of them.
+    op.execute("""
+        UPDATE tickets SET rank = lpad(ordered.position::text, 10, '0') || 'V'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY column_id ORDER BY created_at, id) AS position
+            FROM tickets
+        ) AS ordered
+        WHERE tickets.id = ordered.id
+    """)
+    op.alter_column('tickets', 'rank', nullable=False)
+    op.create_index('ix_tickets_column_id_rank', 'tickets', ['column_id', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_column_id_rank', table_name='tickets')
+    op.drop_column('tickets', 'rank')
@@ -0,0 +1,51 @@
+"""Add ticket listing indexes
+
+Revision ID: c58e1b7a2d94
+Revises: a6d2f8e4b913
+Create Date: 2026-10-20 01:14:52.970318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58e1b7a2d94'
+down_revision: Union[str, Sequence[str], None] = 'a6d2f8e4b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partial on live tickets; each ends in the listing's sort column and id
+LISTING_INDEXES = [
+    ('ix_tickets_board_id_created_at', ['board_id', 'created_at', 'id']),
+    ('ix_tickets_board_id_updated_at', ['board_id', 'updated_at', 'id']),
+    ('ix_tickets_column_id_created_at', ['column_id', 'created_at', 'id']),
+    ('ix_tickets_board_id_assignee_id', ['board_id', 'assignee_id', 'created_at', 'id']),
+    ('ix_tickets_board_id_created_by_id', ['board_id', 'created_by_id', 'created_at', 'id']),
+    ('ix_tickets_board_id_priority', ['board_id', 'priority', 'created_at', 'id']),
+]
+LIVE = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps tickets writable while the indexes build; it can't run in a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in LISTING_INDEXES:
+            op.create_index(name, 'tickets', columns, unique=False, postgresql_where=LIVE,
+                            postgresql_concurrently=True, if_not_exists=True)
+        # Rank order ties are broken by id
+        op.create_index('ix_tickets_column_id_rank_id', 'tickets', ['column_id', 'rank', 'id'], unique=False,
+                        postgresql_where=LIVE, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_tickets_column_id_rank', table_name='tickets', postgresql_concurrently=True)
+        op.execute('ALTER INDEX ix_tickets_column_id_rank_id RENAME TO ix_tickets_column_id_rank')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_column_id_rank', table_name='tickets')
+    op.create_index('ix_tickets_column_id_rank', 'tickets', ['column_id', 'rank'], unique=False, postgresql_where=LIVE)
+    for name, _ in reversed(LISTING_INDEXES):
+        op.drop_index(name, table_name='tickets')
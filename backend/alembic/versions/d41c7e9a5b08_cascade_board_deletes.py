@@ -0,0 +1,51 @@
+"""Cascade board deletes in the database and soft-delete boards
+
+Revision ID: d41c7e9a5b08
+Revises: b7e2d4a91c30
+Create Date: 2026-10-19 21:12:09.604187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c7e9a5b08'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4a91c30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table) of the foreign keys that now cascade
+CASCADED_FKS = [
+    ('columns', 'board_id', 'boards'),
+    ('tickets', 'board_id', 'boards'),
+    ('board_users', 'board_id', 'boards'),
+]
+
+
+def _recreate_fks(ondelete: Union[str, None]) -> None:
+    for table, column, referred in CASCADED_FKS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_fks('CASCADE')
+    # The cascades look children up by these columns
+    op.create_index(op.f('ix_columns_board_id'), 'columns', ['board_id'], unique=False)
+    op.create_index(op.f('ix_tickets_board_id'), 'tickets', ['board_id'], unique=False)
+    op.create_index(op.f('ix_comments_ticket_id'), 'comments', ['ticket_id'], unique=False)
+    op.add_column('boards', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('boards', 'deleted_at')
+    op.drop_index(op.f('ix_comments_ticket_id'), table_name='comments')
+    op.drop_index(op.f('ix_tickets_board_id'), table_name='tickets')
+    op.drop_index(op.f('ix_columns_board_id'), table_name='columns')
+    _recreate_fks(None)
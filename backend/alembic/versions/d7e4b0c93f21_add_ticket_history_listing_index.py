@@ -0,0 +1,34 @@
+"""Add ticket history listing index
+
+Revision ID: d7e4b0c93f21
+Revises: c58e1b7a2d94
+Create Date: 2026-10-20 02:03:41.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e4b0c93f21'
+down_revision: Union[str, Sequence[str], None] = 'c58e1b7a2d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps history writable while the index builds; it can't run in a transaction.
+    # The new index leads with ticket_id, so the single-column one is redundant.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_ticket_history_ticket_id_created_at', 'ticket_history', ['ticket_id', 'created_at', 'id'],
+                        unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_ticket_history_ticket_id', table_name='ticket_history', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_ticket_history_ticket_id', 'ticket_history', ['ticket_id'], unique=False)
+    op.drop_index('ix_ticket_history_ticket_id_created_at', table_name='ticket_history')
@@ -0,0 +1,34 @@
+"""Add comment listing index
+
+Revision ID: e2a9c64f1d07
+Revises: d7e4b0c93f21
+Create Date: 2026-10-20 02:37:19.804562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9c64f1d07'
+down_revision: Union[str, Sequence[str], None] = 'd7e4b0c93f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps comments writable while the index builds; it can't run in a transaction.
+    # The new index leads with ticket_id, so the single-column one is redundant.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_comments_ticket_id_created_at', 'comments', ['ticket_id', 'created_at', 'id'],
+                        unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_comments_ticket_id', table_name='comments', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_comments_ticket_id', 'comments', ['ticket_id'], unique=False)
+    op.drop_index('ix_comments_ticket_id_created_at', table_name='comments')
@@ -0,0 +1,43 @@
+"""Soft-delete tickets
+
+Revision ID: e8a3f15c7d62
+Revises: d41c7e9a5b08
+Create Date: 2026-10-19 22:03:27.145830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a3f15c7d62'
+down_revision: Union[str, Sequence[str], None] = 'd41c7e9a5b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    # Rank lookups only concern live tickets
+    op.drop_index('ix_tickets_column_id_rank', table_name='tickets')
+    op.create_index('ix_tickets_column_id_rank', 'tickets', ['column_id', 'rank'], unique=False,
+                    postgresql_where=sa.text('deleted_at IS NULL'))
+    op.create_index('ix_tickets_deleted_at', 'tickets', ['deleted_at'], unique=False,
+                    postgresql_where=sa.text('deleted_at IS NOT NULL'))
+
+    # Postgres doesn't allow ALTER TYPE ... ADD VALUE to run inside a transaction block
+    # We commit the current transaction before adding values
+    op.execute("COMMIT")
+    op.execute("ALTER TYPE ticketactiontype ADD VALUE IF NOT EXISTS 'TICKET_RESTORED'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Enum values cannot be easily removed in Postgres
+    op.drop_index('ix_tickets_deleted_at', table_name='tickets')
+    op.drop_index('ix_tickets_column_id_rank', table_name='tickets')
+    op.create_index('ix_tickets_column_id_rank', 'tickets', ['column_id', 'rank'], unique=False)
+    op.drop_column('tickets', 'deleted_at')
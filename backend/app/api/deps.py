@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from app.core import security
 from app.core.config import settings
-from app.db.base import get_db
+from app.db.base import get_db, SessionLocal
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
@@ -41,3 +41,32 @@ def get_current_active_user(
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+def decode_token_subject(token: str) -> Optional[str]:
+    """
+    Validate a bearer token and return its subject (the user id), or None if it is invalid.
+    """
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+        token_data = schemas.user.TokenPayload(**payload)
+    except (JWTError, ValidationError):
+        return None
+    return token_data.sub
+
+def get_active_user_by_id(user_id: str) -> Optional[models.User]:
+    """
+    Load an active user outside of the request-scoped session.
+    Used by long-lived connections (WebSocket, SSE) so they never pin a DB connection.
+    """
+    with SessionLocal() as db:
+        user = db.query(models.User).filter(models.User.id == user_id).first()
+        if not user or not user.is_active:
+            return None
+        db.expunge(user)
+        return user
+
+def get_user_by_token(token: str) -> Optional[models.User]:
+    user_id = decode_token_subject(token)
+    return get_active_user_by_id(user_id) if user_id else None
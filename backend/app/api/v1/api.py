@@ -1,11 +1,14 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import users, auth, boards, tickets, comments, websockets, columns, watchers, members
+from app.api.v1.endpoints import users, auth, boards, tickets, comments, websockets, columns, watchers, members, events, board_tickets, templates
 
 api_router = APIRouter()
 api_router.include_router(auth.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(boards.router, prefix="/boards", tags=["boards"])
 api_router.include_router(members.router, prefix="/boards", tags=["members"])
+api_router.include_router(events.router, prefix="/boards", tags=["events"])
+api_router.include_router(board_tickets.router, prefix="/boards", tags=["tickets"])
+api_router.include_router(templates.router, prefix="/templates", tags=["templates"])
 api_router.include_router(columns.router, tags=["columns"])
 api_router.include_router(tickets.router, prefix="/tickets", tags=["tickets"])
 api_router.include_router(websockets.router, prefix="/ws", tags=["websockets"])
@@ -84,7 +84,6 @@ async def login_google(
         user.avatar_url = payload.get("picture")
         db.add(user)
         db.commit()
-        db.refresh(user)
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
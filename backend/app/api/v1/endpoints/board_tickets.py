@@ -0,0 +1,371 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app import crud, models, schemas
+from app.api import deps
+from app.api.v1.endpoints.tickets import schedule_rank_rebalance
+from app.core.encoding import negotiate
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, CursorError, decode_cursor, encode_cursor
+from app.core.ticket_import import RecordError, detect_format, iter_records
+from app.crud.outbox import publish_board_event
+from app.schemas.ticket import SortOrder, TicketBulkAction, TicketBulkOperation, TicketBulkStatus, TicketPriority, TicketSort
+
+router = APIRouter()
+
+# How each sort option's value is read back from a cursor
+TICKET_CURSOR_TYPES = {
+    TicketSort.CREATED_AT: datetime.fromisoformat,
+    TicketSort.UPDATED_AT: datetime.fromisoformat,
+    TicketSort.RANK: str,
+}
+
+@router.get("/{id}/tickets", response_model=List[schemas.Ticket])
+def list_board_tickets(
+    *,
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    id: UUID,
+    column_id: Optional[UUID] = None,
+    assignee_id: Optional[UUID] = None,
+    priority: Optional[TicketPriority] = None,
+    created_by_id: Optional[UUID] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    sort: TicketSort = TicketSort.CREATED_AT,
+    order: Optional[SortOrder] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    List the board's tickets, filtered and sorted (newest first by default; rank order
+    lists one column: it needs column_id and takes no other filter). Paginated with
+    cursors: when more tickets follow, the
+    X-Next-Cursor header holds the cursor to pass for the next page.
+    """
+    board = crud.board.get(db=db, id=id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not crud.board.has_access(db=db, board_id=id, user_id=current_user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if sort == TicketSort.RANK and column_id is None:
+        raise HTTPException(status_code=400, detail="Sorting by rank needs column_id")
+    if sort == TicketSort.RANK and any(
+        value is not None for value in (assignee_id, priority, created_by_id, updated_after, updated_before)
+    ):
+        raise HTTPException(status_code=400, detail="Sorting by rank takes no filter but column_id")
+
+    if order is None:
+        order = SortOrder.ASC if sort == TicketSort.RANK else SortOrder.DESC
+    cursor_key = f"{sort.value}:{order.value}"
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, cursor_key, [TICKET_CURSOR_TYPES[sort], UUID])
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    # One extra row tells whether there is a next page
+    tickets = crud.ticket.get_multi_by_board(
+        db=db,
+        board_id=id,
+        column_id=column_id,
+        assignee_id=assignee_id,
+        priority=priority,
+        created_by_id=created_by_id,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        sort=sort.value,
+        descending=order == SortOrder.DESC,
+        after=after,
+        limit=limit + 1
+    )
+    headers = {}
+    if len(tickets) > limit:
+        tickets = tickets[:limit]
+        last = tickets[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(cursor_key, [getattr(last, sort.value), last.id])
+
+    result = negotiate(request, schemas.Ticket, tickets, many=True)
+    (result if isinstance(result, Response) else response).headers.update(headers)
+    return result
+
+# Ticket field written by each set-style bulk action, named as on the operation
+BULK_FIELDS = {
+    TicketBulkAction.MOVE: "column_id",
+    TicketBulkAction.ASSIGN: "assignee_id",
+    TicketBulkAction.SET_PRIORITY: "priority",
+}
+
+def validate_bulk_operation(
+    op: TicketBulkOperation, *, column_ids: Set[UUID], member_ids: Set[UUID], ticket_ids: Set[UUID]
+) -> Optional[str]:
+    if not op.ticket_ids:
+        return "ticket_ids is required"
+    if op.action == TicketBulkAction.MOVE and op.column_id not in column_ids:
+        return "column_id is required and must belong to this board"
+    if op.action == TicketBulkAction.ASSIGN and op.assignee_id is not None and op.assignee_id not in member_ids:
+        return "Assignee must be a member of this board"
+    if op.action == TicketBulkAction.SET_PRIORITY and op.priority is None:
+        return "priority is required"
+    missing = [str(id) for id in op.ticket_ids if id not in ticket_ids]
+    if missing:
+        return f"Tickets not found on this board: {', '.join(missing)}"
+    return None
+
+def apply_bulk_operation(db: Session, board_id: UUID, op: TicketBulkOperation, actor_id: UUID) -> List[UUID]:
+    if op.action == TicketBulkAction.DELETE:
+        return crud.ticket.bulk_remove(db=db, board_id=board_id, ticket_ids=op.ticket_ids, actor_id=actor_id)
+    field = BULK_FIELDS[op.action]
+    return crud.ticket.bulk_set(
+        db=db, board_id=board_id, ticket_ids=op.ticket_ids, field=field, value=getattr(op, field), actor_id=actor_id
+    )
+
+@router.post("/{id}/tickets/bulk", response_model=schemas.TicketBulkResult)
+def bulk_update_tickets(
+    *,
+    db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
+    id: UUID,
+    bulk_in: schemas.TicketBulkRequest,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Apply move / assign / set_priority / delete operations to many tickets of a board.
+    Each operation is one set-based statement; history is written as one batch and
+    the board gets a single TICKETS_BULK_UPDATED event.
+
+    With atomic=true (default) nothing is written unless every operation succeeds, and a
+    failure answers 422 with per-operation results. With atomic=false each operation runs
+    in its own savepoint: failed ones are reported and the rest are committed.
+    A request holds at most 20 operations of at most 500 tickets each (422 otherwise).
+    """
+    board = crud.board.get(db=db, id=id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not crud.board.has_access(db=db, board_id=id, user_id=current_user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    # Lookups for validation, one query each
+    column_ids = {column.id for column in board.columns}
+    member_ids = set(db.scalars(select(models.BoardUser.user_id).where(models.BoardUser.board_id == id)))
+    requested = {ticket_id for op in bulk_in.operations for ticket_id in op.ticket_ids}
+    ticket_ids = set(db.scalars(
+        select(models.Ticket.id).where(
+            models.Ticket.board_id == id, models.Ticket.id.in_(requested), models.Ticket.deleted_at.is_(None)
+        )
+    )) if requested else set()
+
+    # Validate everything up front; a ticket deleted by an earlier operation is gone for later ones
+    results = []
+    for index, op in enumerate(bulk_in.operations):
+        detail = validate_bulk_operation(op, column_ids=column_ids, member_ids=member_ids, ticket_ids=ticket_ids)
+        results.append(schemas.ticket.TicketBulkOperationResult(
+            index=index,
+            action=op.action,
+            status=TicketBulkStatus.FAILED if detail else TicketBulkStatus.APPLIED,
+            detail=detail
+        ))
+        if not detail and op.action == TicketBulkAction.DELETE:
+            ticket_ids -= set(op.ticket_ids)
+
+    def rolled_back_response():
+        for result in results:
+            if result.status == TicketBulkStatus.APPLIED:
+                result.status = TicketBulkStatus.ROLLED_BACK
+                result.ticket_ids = []
+        body = schemas.TicketBulkResult(committed=False, results=results)
+        return JSONResponse(status_code=422, content=jsonable_encoder(body))
+
+    if bulk_in.atomic and any(result.status == TicketBulkStatus.FAILED for result in results):
+        return rolled_back_response()
+
+    updated: Set[UUID] = set()
+    deleted: Set[UUID] = set()
+    for op, result in zip(bulk_in.operations, results):
+        if result.status == TicketBulkStatus.FAILED:
+            continue
+        try:
+            if bulk_in.atomic:
+                changed = apply_bulk_operation(db, board.id, op, current_user.id)
+            else:
+                with db.begin_nested():
+                    changed = apply_bulk_operation(db, board.id, op, current_user.id)
+        except SQLAlchemyError:
+            result.status = TicketBulkStatus.FAILED
+            result.detail = "Operation could not be applied"
+            if bulk_in.atomic:
+                db.rollback()
+                return rolled_back_response()
+            continue
+        result.ticket_ids = changed
+        (deleted if op.action == TicketBulkAction.DELETE else updated).update(changed)
+
+    if updated or deleted:
+        publish_board_event(db, board.id, {
+            "type": "TICKETS_BULK_UPDATED",
+            "ticket_ids": [str(ticket_id) for ticket_id in updated - deleted],
+            "deleted_ticket_ids": [str(ticket_id) for ticket_id in deleted],
+        })
+    db.commit()
+    schedule_rank_rebalance(background_tasks, db)
+    return schemas.TicketBulkResult(committed=True, results=results)
+
+# Rows written per INSERT batch and per commit during an import
+IMPORT_BATCH_SIZE = 1000
+# Errors reported back in full; the rest are only counted
+MAX_IMPORT_ERRORS = 100
+
+class ImportLookups:
+    """
+    Everything needed to resolve an import row, loaded once per import:
+    columns by name or id, members by email or id, and the fallback column.
+    """
+    def __init__(self, db: Session, board: models.Board):
+        self.columns: Dict[str, UUID] = {}
+        for column in board.columns:
+            self.columns[str(column.id)] = column.id
+            self.columns.setdefault(column.name.strip().lower(), column.id)
+        self.default_column_id = board.columns[0].id if board.columns else None
+
+        self.members: Dict[str, UUID] = {}
+        for user_id, email in db.execute(
+            select(models.User.id, models.User.email)
+            .join(models.BoardUser, models.BoardUser.user_id == models.User.id)
+            .where(models.BoardUser.board_id == board.id)
+        ):
+            self.members[str(user_id)] = user_id
+            self.members[email.lower()] = user_id
+
+def _import_value(record: Dict[str, Any], *keys: str) -> Optional[str]:
+    for key in keys:
+        value = record.get(key)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return None
+
+def resolve_import_row(record: Dict[str, Any], lookups: ImportLookups) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Turn one import record into ticket values, or explain why it can't be imported.
+    Columns are given by name or id ("column"/"status"), assignees by email or id.
+    """
+    title = _import_value(record, "title")
+    if not title:
+        return None, "title is required"
+
+    priority = _import_value(record, "priority")
+    if priority:
+        try:
+            priority = TicketPriority(priority.lower())
+        except ValueError:
+            return None, f"Unknown priority: {priority}"
+
+    column = _import_value(record, "column", "column_id", "status")
+    if column:
+        column_id = lookups.columns.get(column.lower())
+        if not column_id:
+            return None, f"Unknown column: {column}"
+    else:
+        column_id = lookups.default_column_id
+        if not column_id:
+            return None, "Board has no columns"
+
+    assignee = _import_value(record, "assignee", "assignee_email", "assignee_id")
+    assignee_id = None
+    if assignee:
+        assignee_id = lookups.members.get(assignee.lower())
+        if not assignee_id:
+            return None, f"Assignee is not a member of this board: {assignee}"
+
+    return {
+        "title": title,
+        "description": _import_value(record, "description"),
+        "priority": priority,
+        "column_id": column_id,
+        "assignee_id": assignee_id,
+    }, None
+
+def _load_import_board(db: Session, board_id: UUID, user: models.User) -> ImportLookups:
+    board = crud.board.get(db=db, id=board_id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not crud.board.has_access(db=db, board_id=board_id, user_id=user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return ImportLookups(db, board)
+
+def _write_import_batch(
+    db: Session, board_id: UUID, rows: List[dict], creator_id: UUID, result: schemas.TicketImportResult, done: bool
+) -> None:
+    if rows:
+        crud.ticket.create_many(db=db, board_id=board_id, rows=rows, creator_id=creator_id)
+        result.imported += len(rows)
+    if rows or (done and result.imported):
+        # Progress for the board's clients; also tells them to refetch
+        publish_board_event(db, board_id, {
+            "type": "TICKETS_IMPORTED",
+            "imported": result.imported,
+            "failed": result.failed,
+            "done": done,
+        })
+    db.commit()
+
+@router.post("/{id}/tickets/import", response_model=schemas.TicketImportResult)
+async def import_tickets(
+    *,
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
+    id: UUID,
+    format: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Import tickets from a streamed JSON-lines or CSV body (Content-Type
+    application/x-ndjson or text/csv, or ?format=ndjson|csv).
+
+    Fields: title (required), description, priority, column (name or id,
+    defaults to the first column) and assignee (member email or id).
+    The body is read incrementally and written in batches of IMPORT_BATCH_SIZE,
+    each committed on its own, so memory stays bounded whatever the file size.
+    Invalid rows are skipped and reported; board clients get a TICKETS_IMPORTED
+    progress event per batch.
+    """
+    fmt = detect_format(request.headers.get("content-type"), format)
+    if not fmt:
+        raise HTTPException(status_code=415, detail="Send application/x-ndjson or text/csv, or pass ?format=ndjson|csv")
+
+    lookups = await run_in_threadpool(_load_import_board, db, id, current_user)
+    result = schemas.TicketImportResult(imported=0, failed=0)
+    batch: List[dict] = []
+    try:
+        async for line, record, error in iter_records(request.stream(), fmt):
+            if record is not None:
+                row, error = resolve_import_row(record, lookups)
+            if error:
+                result.failed += 1
+                if len(result.errors) < MAX_IMPORT_ERRORS:
+                    result.errors.append(schemas.ticket.TicketImportError(line=line, detail=error))
+                else:
+                    result.errors_truncated = True
+                continue
+            batch.append(row)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await run_in_threadpool(_write_import_batch, db, id, batch, current_user.id, result, False)
+                batch = []
+    except RecordError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{e}. {result.imported} tickets were imported before the error"
+        )
+    await run_in_threadpool(_write_import_batch, db, id, batch, current_user.id, result, True)
+    schedule_rank_rebalance(background_tasks, db)
+    return result
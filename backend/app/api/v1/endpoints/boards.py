@@ -1,14 +1,17 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app import crud, models, schemas
 from app.api import deps
-from app.websockets import manager
+from app.core.encoding import negotiate
+from app.crud.crud_board import DEFAULT_COLUMNS
+from app.purge import purge_board
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Board])
 def read_boards(
+    request: Request,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
@@ -18,17 +21,18 @@ def read_boards(
     Retrieve boards.
     """
     boards = crud.board.get_multi_for_user(db=db, user_id=str(current_user.id), skip=skip, limit=limit)
-    return boards
+    return negotiate(request, schemas.Board, boards, many=True)
 
 @router.get("/{id}", response_model=schemas.Board)
 def get_board_by_id(
     *,
+    request: Request,
     db: Session = Depends(deps.get_db),
     id: str,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get board by ID.
+    Get board by ID. Served as MessagePack when the Accept header asks for it.
     """
     board = crud.board.get(db=db, id=id)
     if not board:
@@ -44,7 +48,7 @@ def get_board_by_id(
     if not (is_owner or is_member):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return board
+    return negotiate(request, schemas.Board, board)
 
 @router.post("/", response_model=schemas.Board)
 def create_board(
@@ -54,35 +58,104 @@ def create_board(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Create new board with default columns.
+    Create new board with default columns, or with the columns and seed tickets
+    of one of the user's templates.
     """
+    template = None
+    if board_in.template_id:
+        template = crud.template.get(db=db, id=board_in.template_id)
+        if not template or template.owner_id != current_user.id:
+            raise HTTPException(status_code=404, detail="Template not found")
+
     board = crud.board.create_with_owner(db=db, obj_in=board_in, owner_id=current_user.id)
+    column_ids = crud.board.add_columns(
+        db=db, board=board, names=template.columns if template else DEFAULT_COLUMNS
+    )
+    if template and template.tickets:
+        rows = [
+            {
+                "title": ticket["title"],
+                "description": ticket.get("description"),
+                "priority": models.TicketPriority(ticket.get("priority", "medium")),
+                "column_id": column_ids[ticket["column"]]
+            }
+            for ticket in template.tickets
+        ]
+        crud.ticket.create_many(db=db, board_id=board.id, rows=rows, creator_id=current_user.id)
+    db.commit()
     
-    # Create default columns
-    default_columns = [
-        {"name": "Backlog", "order": 0},
-        {"name": "Ready for Dev", "order": 1},
-        {"name": "In Development", "order": 2},
-        {"name": "In QA", "order": 3},
-        {"name": "Done", "order": 4}
-    ]
-    
-    from app.models.board import Column
-    for col_data in default_columns:
-        column = Column(
+    return board
+
+@router.post("/{id}/clone", response_model=schemas.Board)
+def clone_board(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: str,
+    clone_in: schemas.BoardClone,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Copy a board, owned by the current user: its columns, its tickets unless
+    include_tickets is false, and its members if include_members is set.
+    Each part is copied by a single INSERT ... SELECT, whatever the board's size.
+    """
+    source = crud.board.get(db=db, id=id)
+    if not source:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not crud.board.has_access(db=db, board_id=id, user_id=str(current_user.id)):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if clone_in.include_members and source.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Only the owner can copy the members")
+
+    board = crud.board.create_with_owner(
+        db=db,
+        obj_in=schemas.BoardCreate(name=clone_in.name or f"{source.name} (copy)", description=source.description),
+        owner_id=current_user.id
+    )
+    column_map = crud.board.copy_columns(db=db, source=source, board=board)
+    if clone_in.include_members:
+        crud.board.copy_members(db=db, source=source, board=board)
+    if clone_in.include_tickets:
+        crud.ticket.copy_from_board(
+            db=db,
+            source_board_id=source.id,
             board_id=board.id,
-            name=col_data["name"],
-            order=col_data["order"]
+            column_map=column_map,
+            creator_id=current_user.id,
+            keep_assignees=clone_in.include_members
         )
-        db.add(column)
-    
     db.commit()
-    db.refresh(board)
-    
     return board
 
+@router.post("/{id}/template", response_model=schemas.BoardTemplate)
+def save_board_as_template(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: str,
+    template_in: schemas.BoardTemplateFromBoard,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Save the board's columns, and its tickets if include_tickets is set, as a template.
+    """
+    board = crud.board.get(db=db, id=id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not crud.board.has_access(db=db, board_id=id, user_id=str(current_user.id)):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    template = crud.template.create_from_board(
+        db=db,
+        board=board,
+        name=template_in.name,
+        description=template_in.description,
+        include_tickets=template_in.include_tickets,
+        owner_id=current_user.id
+    )
+    db.commit()
+    return template
+
 @router.put("/{id}", response_model=schemas.Board)
-async def update_board(
+def update_board(
     *,
     db: Session = Depends(deps.get_db),
     id: str,
@@ -98,19 +171,21 @@ async def update_board(
     if board.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     board = crud.board.update(db=db, db_obj=board, obj_in=board_in)
-    # Broadcast to board
-    await manager.broadcast_to_board(str(board.id), {"type": "BOARD_UPDATED"})
+    db.commit()
     return board
 
 @router.delete("/{id}", response_model=schemas.Board)
-async def delete_board(
+def delete_board(
     *,
     db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
     id: str,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Delete a board.
+    The board is hidden immediately; its columns, tickets and members are purged
+    in batches after the response is sent.
     """
     board = crud.board.get(db=db, id=id)
     if not board:
@@ -118,6 +193,14 @@ async def delete_board(
     if board.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     board = crud.board.remove(db=db, id=id)
-    # Broadcast to board before connection is lost
-    await manager.broadcast_to_board(str(id), {"type": "BOARD_DELETED"})
-    return board
+    db.commit()
+    background_tasks.add_task(purge_board, board.id)
+    # Columns are left out: loading them and their tickets is what the purge avoids
+    return schemas.Board(
+        id=board.id,
+        name=board.name,
+        description=board.description,
+        owner_id=board.owner_id,
+        created_at=board.created_at,
+        updated_at=board.updated_at
+    )
@@ -1,8 +1,10 @@
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app import crud, models, schemas
 from app.api import deps
+from app.api.v1.endpoints.tickets import schedule_rank_rebalance
+from app.crud.outbox import publish_board_event
 from uuid import UUID
 
 router = APIRouter()
@@ -43,9 +45,33 @@ def create_column(
     )
     db.add(new_column)
     db.commit()
-    db.refresh(board)
     return board
 
+@router.put("/boards/{id}/columns/order", response_model=schemas.ColumnOrder)
+def reorder_columns(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: UUID,
+    order_in: schemas.ColumnOrder,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Reorder all columns of a board at once.
+    Takes every column id in the new order; applied in one statement and one commit,
+    with a single COLUMNS_REORDERED broadcast.
+    """
+    board = crud.board.get(db=db, id=id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    if board.owner_id != current_user.id:
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+
+    if not crud.board.reorder_columns(db=db, board=board, column_ids=order_in.column_ids):
+        raise HTTPException(status_code=400, detail="column_ids must list every column of the board exactly once")
+    db.commit()
+    return order_in
+
 @router.put("/columns/{column_id}", response_model=schemas.Column)
 def update_column(
     *,
@@ -82,18 +108,21 @@ def update_column(
     column.order = column_in.order
     db.add(column)
     db.commit()
-    db.refresh(column)
     return column
 
 @router.delete("/columns/{column_id}", response_model=schemas.Board)
 def delete_column(
     *,
     db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
     column_id: str,
+    target_column_id: Optional[UUID] = None,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Delete a column.
+    A column that still has tickets needs target_column_id: its tickets are moved to the
+    bottom of that column in one statement, in the same transaction as the delete.
     """
     from app.models.board import Column
     
@@ -105,7 +134,28 @@ def delete_column(
     if not board or board.owner_id != current_user.id:
         raise HTTPException(status_code=400, detail="Not enough permissions")
 
+    moved = []
+    if target_column_id is not None:
+        target = db.query(Column).filter(Column.id == target_column_id).first()
+        if not target or target.board_id != column.board_id or target.id == column.id:
+            raise HTTPException(status_code=400, detail="Target column must be another column of this board")
+        moved = crud.ticket.move_column_tickets(
+            db=db, column_id=column.id, target_column_id=target.id, actor_id=current_user.id
+        )
+    else:
+        # Deleted tickets count too: they can still be restored into the column
+        has_tickets = db.query(models.Ticket.id).filter(models.Ticket.column_id == column.id).first() is not None
+        if has_tickets:
+            raise HTTPException(status_code=400, detail="Column has tickets, pass target_column_id to move them")
+
+    publish_board_event(db, board.id, {
+        "type": "COLUMN_DELETED",
+        "column_id": str(column.id),
+        "target_column_id": str(target_column_id) if target_column_id else None,
+        "ticket_ids": [str(ticket_id) for ticket_id in moved]
+    })
     db.delete(column)
     db.commit()
-    db.refresh(board)
+    db.expire(board, ["columns"])
+    schedule_rank_rebalance(background_tasks, db)
     return board
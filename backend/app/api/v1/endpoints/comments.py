@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Any
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Any, Optional
 from uuid import UUID
 from datetime import datetime
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, CursorError, after, decode_cursor, encode_cursor
 from app.core.utils import utcnow
 from app.crud.crud_watcher import crud_watcher
 
@@ -10,23 +11,32 @@ from app.db.base import get_db
 from app.models import Comment, Ticket, User, TicketPriority
 from app.api.deps import get_current_user
 from app.schemas.comment import CommentCreate, CommentUpdate, CommentResponse
+from app.schemas.ticket import SortOrder
 from app.models.history import TicketActionType
 from app.crud.history_log import log_ticket_history
-from app.websockets import manager
+from app.crud.outbox import publish_board_event
 
 router = APIRouter()
 
 @router.get("/tickets/{ticket_id}/comments", response_model=List[CommentResponse])
 def read_comments(
     ticket_id: UUID,
+    response: Response,
+    order: SortOrder = SortOrder.ASC,
+    latest: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """
-    Retrieve comments for a specific ticket.
+    Retrieve comments for a specific ticket, oldest first by default.
     Enforces board access.
+    Paginated with cursors: when more comments follow, the X-Next-Cursor header holds
+    the cursor to pass for the next page. With latest, pages go from the newest
+    comments back (as with order=desc) but each page is still oldest first.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.deleted_at.is_(None)).first()
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,11 +57,41 @@ def read_comments(
             detail="Not enough permissions to view comments on this board"
         )
 
-    comments = db.query(Comment).filter(Comment.ticket_id == ticket_id).order_by(Comment.created_at.asc()).all()
+    descending = latest or order == SortOrder.DESC
+    # latest walks the same ordering as order=desc, so their cursors are interchangeable
+    cursor_key = f"created_at:{'desc' if descending else 'asc'}"
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    # Authors and their preferences load in one query each for the whole page
+    query = db.query(Comment).options(
+        selectinload(Comment.author).selectinload(User.preferences)
+    ).filter(Comment.ticket_id == ticket_id)
+    if cursor:
+        try:
+            values = decode_cursor(cursor, cursor_key, [datetime.fromisoformat, UUID])
+        except CursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.filter(after((Comment.created_at, Comment.id), values, descending))
+    if descending:
+        query = query.order_by(Comment.created_at.desc(), Comment.id.desc())
+    else:
+        query = query.order_by(Comment.created_at.asc(), Comment.id.asc())
+    # One extra row tells whether there is a next page
+    comments = query.limit(limit + 1).all()
+
+    if len(comments) > limit:
+        comments = comments[:limit]
+        last = comments[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(cursor_key, [last.created_at, last.id])
+    if latest:
+        comments.reverse()
     return comments
 
 @router.post("/tickets/{ticket_id}/comments", response_model=CommentResponse)
-async def create_comment(
+def create_comment(
     ticket_id: UUID,
     comment_in: CommentCreate,
     db: Session = Depends(get_db),
@@ -60,7 +100,7 @@ async def create_comment(
     """
     Create a new comment.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.deleted_at.is_(None)).first()
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,15 +120,16 @@ async def create_comment(
         author_id=current_user.id
     )
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    db.flush()
 
-    # Log history
+    # Log history; the content is read from the comment itself
     log_ticket_history(
         db=db,
         ticket_id=ticket_id,
         actor_id=current_user.id,
         action_type=TicketActionType.COMMENT_ADDED,
+        comment_id=comment.id,
+        # The text as posted: edits and deletion are logged separately
         new_value=comment.content
     )
     
@@ -100,18 +141,17 @@ async def create_comment(
             ticket_id=ticket_id,
             actor_id=current_user.id,
             action_type=TicketActionType.WATCHER_ADDED,
-            new_value=str(current_user.id)
+            new_value=current_user.id
         )
     
+    # Broadcast to board once committed
+    publish_board_event(db, ticket.board_id, {"type": "COMMENT_ADDED", "ticket_id": str(ticket_id)})
     db.commit()
 
-    # Broadcast to board
-    await manager.broadcast_to_board(str(ticket.board_id), {"type": "COMMENT_ADDED", "ticket_id": str(ticket_id)})
-
     return comment
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
-async def update_comment(
+def update_comment(
     comment_id: UUID,
     comment_in: CommentUpdate,
     db: Session = Depends(get_db),
@@ -137,16 +177,14 @@ async def update_comment(
     board_id = str(comment.ticket.board_id)
     comment.content = comment_in.content
     ...
+    # Broadcast to board once committed
+    publish_board_event(db, board_id, {"type": "COMMENT_UPDATED", "ticket_id": str(comment.ticket_id)})
     db.commit()
-    db.refresh(comment)
-
-    # Broadcast to board
-    await manager.broadcast_to_board(board_id, {"type": "COMMENT_UPDATED", "ticket_id": str(comment.ticket_id)})
 
     return comment
 
 @router.delete("/comments/{comment_id}")
-async def delete_comment(
+def delete_comment(
     comment_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -176,13 +214,13 @@ async def delete_comment(
         ticket_id=comment.ticket_id,
         actor_id=current_user.id,
         action_type=TicketActionType.COMMENT_DELETED,
+        comment_id=comment.id,
         old_value=comment.content
     )
     
     db.delete(comment)
+    # Broadcast to board once committed
+    publish_board_event(db, board_id, {"type": "COMMENT_DELETED", "ticket_id": ticket_id})
     db.commit()
 
-    # Broadcast to board
-    await manager.broadcast_to_board(board_id, {"type": "COMMENT_DELETED", "ticket_id": ticket_id})
-
     return {"message": "Comment deleted successfully"}
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Optional, Tuple
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from app import crud
+from app.api import deps
+from app.core.config import settings
+from app.core.encoding import dumps_json
+from app.db.base import SessionLocal
+from app.websockets import MEMBER_REMOVED, manager
+
+router = APIRouter()
+
+def format_sse(event_id: Optional[int], message: dict) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    # Same encoding as the WebSocket JSON frames
+    lines.append(f"data: {dumps_json(message)}")
+    return "\n".join(lines) + "\n\n"
+
+def authorize_stream(token: Optional[str], board_id: str) -> Tuple[str, str]:
+    """
+    Check the token and the user's access to the board; returns the board's canonical id
+    and the user's id.
+    Blocking, so the async endpoint runs it in the threadpool.
+    """
+    user = deps.get_user_by_token(token) if token else None
+    if not user:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+
+    with SessionLocal() as db:
+        board = crud.board.get(db=db, id=board_id)
+        if not board:
+            raise HTTPException(status_code=404, detail="Board not found")
+        if not crud.board.has_access(db=db, board_id=board_id, user_id=str(user.id)):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+        return str(board.id), str(user.id)
+
+@router.get("/{id}/events")
+async def stream_board_events(
+    *,
+    request: Request,
+    id: str,
+    token: Optional[str] = Query(None),
+    authorization: Optional[str] = Header(None),
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of board events, fed by the same broadcasts as the WebSockets.
+    EventSource cannot set headers, so the token may also be passed as a query parameter.
+    Reconnecting clients resume from Last-Event-ID; if the backlog no longer covers it they
+    receive a RESYNC event and should refetch the board.
+    """
+    if not token and authorization and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    id, user_id = await run_in_threadpool(authorize_stream, token, id)
+
+    # Register before reading the backlog so no event can fall between replay and live delivery
+    stream = manager.open_event_stream(id)
+    replay = []
+    if last_event_id:
+        try:
+            missed = manager.events_since(id, int(last_event_id))
+        except ValueError:
+            missed = None
+        replay = missed if missed is not None else [(None, {"type": "RESYNC", "board_id": id})]
+    replayed_up_to = max((event_id for event_id, _ in replay if event_id is not None), default=0)
+
+    async def event_generator():
+        try:
+            yield "retry: 3000\n\n"
+            for event_id, message in replay:
+                yield format_sse(event_id, message)
+            while True:
+                try:
+                    event_id, message = await asyncio.wait_for(stream.get(), timeout=settings.SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                if event_id is not None and event_id <= replayed_up_to:
+                    continue
+                yield format_sse(event_id, message)
+                if message.get("type") == MEMBER_REMOVED and message.get("user_id") == user_id:
+                    break  # no longer a member: end the stream after telling the client
+        finally:
+            manager.close_event_stream(stream)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
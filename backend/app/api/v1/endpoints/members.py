@@ -3,6 +3,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app import crud, models, schemas
 from app.api import deps
+from app.crud.outbox import publish_board_event
+from app.websockets import MEMBER_REMOVED
 
 router = APIRouter()
 
@@ -71,6 +73,7 @@ def add_member(
         raise HTTPException(status_code=400, detail="Owner is already a member")
 
     board = crud.board.add_member(db=db, board=board, user_id=user_to_add.id)
+    db.commit()
     return board
 
 
@@ -101,4 +104,7 @@ def remove_member(
         raise HTTPException(status_code=400, detail="Cannot remove owner")
 
     board = crud.board.remove_member(db=db, board=board, user_id=user_id)
+    # Every worker drops the user's subscriptions to this board when it delivers the event
+    publish_board_event(db, board.id, {"type": MEMBER_REMOVED, "user_id": user_id})
+    db.commit()
     return board
@@ -0,0 +1,55 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app import crud, models, schemas
+from app.api import deps
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.BoardTemplate])
+def read_templates(
+    db: Session = Depends(deps.get_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the current user's board templates.
+    """
+    return crud.template.get_multi_by_owner(db=db, owner_id=str(current_user.id), skip=skip, limit=limit)
+
+@router.post("/", response_model=schemas.BoardTemplate)
+def create_template(
+    *,
+    db: Session = Depends(deps.get_db),
+    template_in: schemas.BoardTemplateCreate,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Create a board template: column names in order and optional seed tickets,
+    each placed in a column by its index.
+    """
+    if not template_in.columns:
+        raise HTTPException(status_code=400, detail="A template needs at least one column")
+    if any(not 0 <= ticket.column < len(template_in.columns) for ticket in template_in.tickets):
+        raise HTTPException(status_code=400, detail="Ticket column index is out of range")
+    template = crud.template.create_with_owner(db=db, obj_in=template_in, owner_id=current_user.id)
+    db.commit()
+    return template
+
+@router.delete("/{id}", response_model=schemas.BoardTemplate)
+def delete_template(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: str,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Delete a board template. Boards created from it are not affected.
+    """
+    template = crud.template.get(db=db, id=id)
+    if not template or template.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Template not found")
+    template = crud.template.remove(db=db, db_obj=template)
+    db.commit()
+    return template
@@ -1,18 +1,42 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, List, Optional, Set
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session, selectinload
 from app import crud, models, schemas
 from app.api import deps
+from app.core.encoding import negotiate
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, CursorError, after, decode_cursor, encode_cursor
+from app.core.textpatch import PatchError, check_ops
+from app.crud.crud_ticket import REBALANCE_COLUMNS_KEY
+from app.db.base import SessionLocal
 from app.models import TicketHistory
 from app.schemas.history import TicketHistory as TicketHistorySchema
-from app.websockets import manager
+from app.schemas.ticket import SortOrder
 
 router = APIRouter()
 
+def rebalance_columns(column_ids: Set[UUID]) -> None:
+    for column_id in column_ids:
+        # One short transaction per column, so moves elsewhere aren't held up
+        with SessionLocal() as db:
+            crud.ticket.rebalance_column(db, column_id)
+            db.commit()
+
+def schedule_rank_rebalance(background_tasks: BackgroundTasks, db: Session) -> None:
+    """
+    Renumber, after the response is sent, the columns whose rank keys grew too long
+    during this request.
+    """
+    column_ids = db.info.pop(REBALANCE_COLUMNS_KEY, None)
+    if column_ids:
+        background_tasks.add_task(rebalance_columns, column_ids)
+
 @router.post("/", response_model=schemas.Ticket)
-async def create_ticket(
+def create_ticket(
     *,
     db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
     ticket_in: schemas.TicketCreate,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
@@ -40,16 +64,14 @@ async def create_ticket(
         board_id=ticket_in.board_id,
         creator_id=str(current_user.id)
     )
-    db.add(ticket)
     db.commit()
-    db.refresh(ticket)
-    # Broadcast to board - MUST AWAIT
-    await manager.broadcast_to_board(str(ticket.board_id), {"type": "TICKET_CREATED", "ticket_id": str(ticket.id)})
+    schedule_rank_rebalance(background_tasks, db)
     return ticket
 
 @router.get("/{id}", response_model=schemas.Ticket)
 def get_ticket(
     *,
+    request: Request,
     db: Session = Depends(deps.get_db),
     id: str,
     current_user: models.User = Depends(deps.get_current_active_user),
@@ -76,18 +98,20 @@ def get_ticket(
     if not (is_owner or is_member):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return ticket
+    return negotiate(request, schemas.Ticket, ticket)
 
 @router.put("/{id}", response_model=schemas.Ticket)
-async def update_ticket(
+def update_ticket(
     *,
     db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
     id: str,
     ticket_in: schemas.TicketUpdate,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Update a ticket (move column, change status details etc). Owner or members can update.
+    Send the ticket's current version to reject the update with 409 if it changed meanwhile.
     """
     ticket = crud.ticket.get(db=db, id=id)
     if not ticket:
@@ -109,12 +133,110 @@ async def update_ticket(
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
     ticket = crud.ticket.update(db=db, db_obj=ticket, obj_in=ticket_in, actor_id=str(current_user.id))
-    # Broadcast to board
-    await manager.broadcast_to_board(str(ticket.board_id), {"type": "TICKET_UPDATED", "ticket_id": str(ticket.id)})
+    if not ticket:
+        raise HTTPException(status_code=409, detail="Ticket was changed by someone else, reload it and try again")
+    db.commit()
+    schedule_rank_rebalance(background_tasks, db)
+    return ticket
+
+def apply_ticket_move(db: Session, ticket: models.Ticket, move_in: schemas.TicketMove, actor_id: str) -> models.Ticket:
+    """
+    Place the ticket at move_in's position (shared by the REST and WebSocket moves).
+    Raises HTTPException for an invalid target or a conflicting concurrent change.
+    """
+    column = db.query(models.Column).filter(models.Column.id == move_in.column_id).first()
+    if not column or column.board_id != ticket.board_id:
+        raise HTTPException(status_code=400, detail="Column does not belong to this board")
+    if move_in.after_id is not None and move_in.before_id is not None:
+        raise HTTPException(status_code=400, detail="Give after_id or before_id, not both")
+    if ticket.id in (move_in.after_id, move_in.before_id):
+        raise HTTPException(status_code=400, detail="A ticket can't be placed next to itself")
+
+    rank = crud.ticket.rank_between_neighbours(
+        db=db,
+        ticket_id=ticket.id,
+        column_id=column.id,
+        after_id=move_in.after_id,
+        before_id=move_in.before_id
+    )
+    if rank is None:
+        raise HTTPException(status_code=409, detail="Neighbour ticket is no longer in this column, reload and try again")
+
+    ticket = crud.ticket.move(
+        db=db,
+        db_obj=ticket,
+        column_id=column.id,
+        rank=rank,
+        expected_version=move_in.version,
+        actor_id=actor_id
+    )
+    if not ticket:
+        raise HTTPException(status_code=409, detail="Ticket was changed by someone else, reload it and try again")
+    return ticket
+
+@router.post("/{id}/move", response_model=schemas.Ticket)
+def move_ticket(
+    *,
+    db: Session = Depends(deps.get_db),
+    background_tasks: BackgroundTasks,
+    id: str,
+    move_in: schemas.TicketMove,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Move a ticket to a position in a column (drag and drop).
+    The new rank is computed between the given neighbour and the ticket next to it,
+    so only the moved row is written however long the column is.
+    """
+    ticket = crud.ticket.get(db=db, id=id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if not crud.board.has_access(db=db, board_id=str(ticket.board_id), user_id=str(current_user.id)):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    ticket = apply_ticket_move(db, ticket, move_in, str(current_user.id))
+    db.commit()
+    schedule_rank_rebalance(background_tasks, db)
+    return ticket
+
+@router.patch("/{id}/description", response_model=schemas.Ticket)
+def patch_ticket_description(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: str,
+    patch_in: schemas.TicketDescriptionPatch,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Edit the description with text ops computed against patch_in.version,
+    instead of sending the whole text. 409 if the ticket has changed since.
+    """
+    ticket = crud.ticket.get(db=db, id=id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if not crud.board.has_access(db=db, board_id=str(ticket.board_id), user_id=str(current_user.id)):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if ticket.version != patch_in.version:
+        raise HTTPException(status_code=409, detail="Ticket was changed by someone else, reload it and try again")
+
+    try:
+        # The loaded row has the expected version, so its description is the base text
+        ops = check_ops([(op.start, op.end, op.text) for op in patch_in.ops], len(ticket.description or ""))
+    except PatchError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not ops:
+        return ticket
+
+    ticket = crud.ticket.patch_description(
+        db=db, db_obj=ticket, ops=ops, expected_version=patch_in.version, actor_id=str(current_user.id)
+    )
+    if not ticket:
+        raise HTTPException(status_code=409, detail="Ticket was changed by someone else, reload it and try again")
+    db.commit()
     return ticket
 
 @router.delete("/{id}", response_model=schemas.Ticket)
-async def delete_ticket(
+def delete_ticket(
     *,
     db: Session = Depends(deps.get_db),
     id: str,
@@ -122,6 +244,8 @@ async def delete_ticket(
 ) -> Any:
     """
     Delete a ticket. Owner or members can delete.
+    The ticket is soft-deleted and can be restored until it is purged
+    (TICKET_RETENTION_DAYS later).
     """
     ticket = crud.ticket.get(db=db, id=id)
     if not ticket:
@@ -142,24 +266,50 @@ async def delete_ticket(
     if not (is_owner or is_member):
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    # Eagerly load assignee relationship before deletion to avoid DetachedInstanceError
-    _ = ticket.assignee  # This triggers the lazy load while still in session
-    
     ticket = crud.ticket.remove(db=db, id=id, actor_id=str(current_user.id))
-    # Broadcast to board
-    await manager.broadcast_to_board(str(board.id), {"type": "TICKET_DELETED", "ticket_id": id})
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    db.commit()
+    return ticket
+
+@router.post("/{id}/restore", response_model=schemas.Ticket)
+def restore_ticket(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: str,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Restore a deleted ticket. Owner or members can restore.
+    """
+    ticket = crud.ticket.get(db=db, id=id, include_deleted=True)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if not crud.board.has_access(db=db, board_id=str(ticket.board_id), user_id=str(current_user.id)):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    ticket = crud.ticket.restore(db=db, id=id, actor_id=str(current_user.id))
+    if not ticket:
+        raise HTTPException(status_code=400, detail="Ticket is not deleted")
+    db.commit()
     return ticket
 
 @router.get("/{ticket_id}/history", response_model=List[TicketHistorySchema])
 def read_ticket_history(
     ticket_id: str,
+    response: Response,
+    order: SortOrder = SortOrder.DESC,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
     db: Session = Depends(deps.get_db),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get ticket history.
+    Get ticket history, newest first by default. Still available for deleted tickets until
+    they are purged. Paginated with cursors: when more records follow, the X-Next-Cursor
+    header holds the cursor to pass for the next page.
     """
-    ticket = crud.ticket.get(db=db, id=ticket_id)
+    ticket = crud.ticket.get(db=db, id=ticket_id, include_deleted=True)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
         
@@ -177,8 +327,33 @@ def read_ticket_history(
     if not (is_owner or is_member):
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    history = db.query(TicketHistory).filter(
+    cursor_key = f"created_at:{order.value}"
+    descending = order == SortOrder.DESC
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    # Actors (with the preferences their schema includes) and comments load in one
+    # query each for the whole page instead of one per record
+    query = db.query(TicketHistory).options(
+        selectinload(TicketHistory.actor).selectinload(models.User.preferences),
+        selectinload(TicketHistory.comment)
+    ).filter(
         TicketHistory.ticket_id == ticket_id
-    ).order_by(TicketHistory.created_at.asc()).all()
-    
+    )
+    if cursor:
+        try:
+            values = decode_cursor(cursor, cursor_key, [datetime.fromisoformat, UUID])
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.filter(after((TicketHistory.created_at, TicketHistory.id), values, descending))
+    if descending:
+        query = query.order_by(TicketHistory.created_at.desc(), TicketHistory.id.desc())
+    else:
+        query = query.order_by(TicketHistory.created_at.asc(), TicketHistory.id.asc())
+    # One extra row tells whether there is a next page
+    history = query.limit(limit + 1).all()
+
+    if len(history) > limit:
+        history = history[:limit]
+        last = history[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(cursor_key, [last.created_at, last.id])
     return history
@@ -22,6 +22,7 @@ def create_user(
             detail="The user with this username already exists in the system.",
         )
     user = crud.user.create(db, obj_in=user_in)
+    db.commit()
     return user
 
 @router.get("/me", response_model=schemas.user.User)
@@ -34,12 +35,12 @@ def read_user_me(
     """
     # Ensure preferences exist
     if not current_user.preferences:
-        crud.preferences.create(
+        current_user.preferences = crud.preferences.create(
             db, 
             obj_in=schemas.user.UserPreferencesCreate(), 
             user_id=current_user.id
         )
-        db.refresh(current_user)
+        db.commit()
     return current_user
 
 @router.put("/me", response_model=schemas.user.User)
@@ -53,6 +54,7 @@ def update_user_me(
     Update own profile.
     """
     user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
+    db.commit()
     return user
 
 @router.get("/me/preferences", response_model=schemas.user.UserPreferences)
@@ -70,6 +72,7 @@ def read_user_preferences_me(
             obj_in=schemas.user.UserPreferencesCreate(), 
             user_id=current_user.id
         )
+        db.commit()
     return prefs
 
 @router.put("/me/preferences", response_model=schemas.user.UserPreferences)
@@ -90,4 +93,5 @@ def update_user_preferences_me(
             user_id=current_user.id
         )
     prefs = crud.preferences.update(db, db_obj=prefs, obj_in=prefs_in)
+    db.commit()
     return prefs
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 
 from app.db.base import get_db
-from app.models import Ticket, User, Board
+from app.models import Ticket, User, Board, BoardUser
 from app.models.ticket_watcher import TicketWatcher
 from app.api.deps import get_current_user
-from app.schemas.watcher import WatcherCreate, WatcherResponse
+from app.schemas.watcher import WatcherCreate, WatcherResponse, WatcherBulkUpdate, WatcherBulkResult
 from app.crud.crud_watcher import crud_watcher
 from app.models.history import TicketActionType
 from app.crud.history_log import log_ticket_history
@@ -24,7 +25,7 @@ def get_watchers(
     Get all watchers for a ticket.
     Requires board membership.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.deleted_at.is_(None)).first()
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,7 +53,7 @@ def add_watcher(
     Add a watcher to a ticket.
     Anyone can add themselves or another board member.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.deleted_at.is_(None)).first()
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,7 +103,7 @@ def add_watcher(
         ticket_id=ticket_id,
         actor_id=current_user.id,
         action_type=TicketActionType.WATCHER_ADDED,
-        new_value=str(watcher_in.user_id)
+        new_value=watcher_in.user_id
     )
     db.commit()
     
@@ -119,7 +120,7 @@ def remove_watcher(
     Remove a watcher from a ticket.
     Users can remove themselves. Board owner can remove anyone.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.deleted_at.is_(None)).first()
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -160,8 +161,128 @@ def remove_watcher(
         ticket_id=ticket_id,
         actor_id=current_user.id,
         action_type=TicketActionType.WATCHER_REMOVED,
-        old_value=str(user_id)
+        old_value=user_id
     )
     db.commit()
     
     return {"message": "Watcher removed successfully"}
+
+def _check_bulk_watchers(db: Session, board_id: UUID, watchers_in: WatcherBulkUpdate, current_user: User) -> Board:
+    board = db.query(Board).filter(Board.id == board_id, Board.deleted_at.is_(None)).first()
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+
+    has_access = any(m.board_id == board.id for m in current_user.board_memberships)
+    if not has_access and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to modify watchers"
+        )
+
+    if not watchers_in.user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="user_ids is required"
+        )
+    if not watchers_in.ticket_ids and not watchers_in.column_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ticket_ids or column_id is required"
+        )
+    return board
+
+@router.post("/boards/{board_id}/watchers/bulk-add", response_model=WatcherBulkResult)
+def bulk_add_watchers(
+    board_id: UUID,
+    watchers_in: WatcherBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add many watchers to many tickets of a board in one statement,
+    e.g. "watch all tickets in this column". Already-watching pairs are skipped.
+    """
+    _check_bulk_watchers(db, board_id, watchers_in, current_user)
+
+    # All target users must have board access, as for a single watcher
+    user_ids = set(watchers_in.user_ids)
+    allowed = {
+        row[0] for row in db.query(User.id).outerjoin(
+            BoardUser, (BoardUser.user_id == User.id) & (BoardUser.board_id == board_id)
+        ).filter(
+            User.id.in_(user_ids),
+            or_(BoardUser.user_id.isnot(None), User.is_superuser)
+        )
+    }
+    if allowed != user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot add non-board-member as watcher"
+        )
+
+    added = crud_watcher.add_watchers(
+        db=db,
+        board_id=board_id,
+        user_ids=list(user_ids),
+        added_by=current_user.id,
+        ticket_ids=watchers_in.ticket_ids,
+        column_id=watchers_in.column_id
+    )
+
+    # Log history
+    for ticket_id, user_id in added:
+        log_ticket_history(
+            db=db,
+            ticket_id=ticket_id,
+            actor_id=current_user.id,
+            action_type=TicketActionType.WATCHER_ADDED,
+            new_value=user_id
+        )
+    db.commit()
+
+    return {"count": len(added), "watchers": [{"ticket_id": t, "user_id": u} for t, u in added]}
+
+@router.post("/boards/{board_id}/watchers/bulk-remove", response_model=WatcherBulkResult)
+def bulk_remove_watchers(
+    board_id: UUID,
+    watchers_in: WatcherBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Remove many watchers from many tickets of a board in one statement.
+    Users can remove themselves. Board owner can remove anyone.
+    """
+    board = _check_bulk_watchers(db, board_id, watchers_in, current_user)
+
+    is_owner = board.owner_id == current_user.id
+    is_self_removal = set(watchers_in.user_ids) <= {current_user.id}
+    if not is_self_removal and not is_owner and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only board owner can remove other watchers"
+        )
+
+    removed = crud_watcher.remove_watchers(
+        db=db,
+        board_id=board_id,
+        user_ids=watchers_in.user_ids,
+        ticket_ids=watchers_in.ticket_ids,
+        column_id=watchers_in.column_id
+    )
+
+    # Log history
+    for ticket_id, user_id in removed:
+        log_ticket_history(
+            db=db,
+            ticket_id=ticket_id,
+            actor_id=current_user.id,
+            action_type=TicketActionType.WATCHER_REMOVED,
+            old_value=user_id
+        )
+    db.commit()
+
+    return {"count": len(removed), "watchers": [{"ticket_id": t, "user_id": u} for t, u in removed]}
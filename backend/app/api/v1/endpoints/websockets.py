@@ -1,59 +1,283 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
-from app.websockets import manager
+import logging
+import time
+from typing import Optional, Tuple, Union
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from app.websockets import manager, channel_name, BOARD_CHANNEL, TICKET_CHANNEL, USER_CHANNEL, HANDSHAKE_SECONDS
 from app.api import deps
-from jose import jwt, JWTError
-from app.core.config import settings
-from app import schemas, models
-from sqlalchemy.orm import Session
+from app import crud, schemas, models
+from app.db.base import SessionLocal
+from app.crud.crud_ticket import REBALANCE_COLUMNS_KEY
+from app.api.v1.endpoints.tickets import apply_ticket_move, rebalance_columns
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+def authorize_channel(user: models.User, kind: str, id: str) -> Optional[str]:
+    """
+    Check that the user may receive events published on a board or ticket channel.
+    Returns the id of the board the channel belongs to, or None when not allowed.
+    """
+    with SessionLocal() as db:
+        if kind == BOARD_CHANNEL:
+            board_id = id
+        elif kind == TICKET_CHANNEL:
+            ticket = crud.ticket.get(db=db, id=id)
+            if not ticket:
+                return None
+            board_id = str(ticket.board_id)
+        else:
+            return None
+        if not crud.board.has_access(db=db, board_id=board_id, user_id=str(user.id)):
+            return None
+        return board_id
+
+def load_board_access(user: models.User, board_id: str) -> Tuple[Optional[str], bool]:
+    """
+    The board's canonical id (None if it doesn't exist) and whether the user may access it.
+    """
+    with SessionLocal() as db:
+        board = crud.board.get(db=db, id=board_id)
+        if not board:
+            return None, False
+        return str(board.id), crud.board.has_access(db=db, board_id=board_id, user_id=str(user.id))
+
+class CommandContext:
+    """
+    Per-connection state for client commands. Board access is checked again for every
+    command, so a member removed from a board can't keep mutating it over an open socket.
+    """
+    def __init__(self, user: models.User):
+        self.user = user
+
+    def ensure_board_access(self, db, board_id: str):
+        if not crud.board.has_access(db=db, board_id=board_id, user_id=str(self.user.id)):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+
+def run_ticket_update(
+    ctx: CommandContext, ticket_id: str, ticket_in: Union[schemas.TicketUpdate, schemas.TicketMove]
+) -> dict:
+    with SessionLocal() as db:
+        ticket = crud.ticket.get(db=db, id=ticket_id)
+        if not ticket:
+            raise HTTPException(status_code=404, detail="Ticket not found")
+        ctx.ensure_board_access(db, str(ticket.board_id))
+        if isinstance(ticket_in, schemas.TicketMove):
+            # Ranked placement, as POST /tickets/{id}/move
+            ticket = apply_ticket_move(db, ticket, ticket_in, str(ctx.user.id))
+        else:
+            if ticket_in.status_column_id is not None:
+                column = db.query(models.Column).filter(models.Column.id == ticket_in.status_column_id).first()
+                if not column or column.board_id != ticket.board_id:
+                    raise HTTPException(status_code=400, detail="Column does not belong to this board")
+            ticket = crud.ticket.update(db=db, db_obj=ticket, obj_in=ticket_in, actor_id=str(ctx.user.id))
+            if not ticket:
+                raise HTTPException(status_code=409, detail="Ticket was changed by someone else, reload it and try again")
+        db.commit()
+        payload = schemas.Ticket.model_validate(ticket).model_dump(mode="json")
+        # Already off the event loop; renumber now if the move made the column's keys too long
+        column_ids = db.info.pop(REBALANCE_COLUMNS_KEY, None)
+    if column_ids:
+        rebalance_columns(column_ids)
+    return payload
+
+def run_column_reorder(ctx: CommandContext, board_id: str, column_ids: list) -> list:
+    with SessionLocal() as db:
+        board = crud.board.get(db=db, id=board_id)
+        if not board or board.owner_id != ctx.user.id:
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+        if not crud.board.reorder_columns(db=db, board=board, column_ids=column_ids):
+            raise HTTPException(status_code=400, detail="column_ids must list every column of the board exactly once")
+        db.commit()
+        return [str(column_id) for column_id in column_ids]
+
+async def handle_command(websocket: WebSocket, ctx: CommandContext, frame: dict):
+    """
+    Execute a client mutation and answer with an ACK or ERROR frame carrying the request_id:
+
+        {"action": "move_ticket", "request_id": "1", "ticket_id": "...", "column_id": "...", "after_id": "...", "version": 3}
+        {"action": "update_ticket", "request_id": "2", "ticket_id": "...", "fields": {...TicketUpdate}}
+        {"action": "reorder_columns", "request_id": "3", "board_id": "...", "column_ids": ["...", ...]}
+    """
+    action = frame.get("action")
+    request_id = frame.get("request_id")
+    try:
+        if action in ("move_ticket", "update_ticket"):
+            ticket_id = str(UUID(str(frame.get("ticket_id"))))
+            if action == "move_ticket":
+                if frame.get("column_id") is None:
+                    raise ValueError("column_id is required")
+                try:
+                    column_id = UUID(str(frame["column_id"]))
+                except ValueError:
+                    raise ValueError("column_id must be a UUID")
+                # after_id / before_id as in TicketMove; neither means the bottom of the column
+                ticket_in = schemas.TicketMove(
+                    column_id=column_id,
+                    after_id=frame.get("after_id"),
+                    before_id=frame.get("before_id"),
+                    version=frame.get("version")
+                )
+            else:
+                fields = frame.get("fields") or {}
+                if not isinstance(fields, dict):
+                    raise ValueError("fields must be an object")
+                ticket_in = schemas.TicketUpdate(**fields)
+            ticket = await run_in_threadpool(run_ticket_update, ctx, ticket_id, ticket_in)
+            await manager.send(websocket, {"type": "ACK", "request_id": request_id, "ticket": ticket})
+        elif action == "reorder_columns":
+            board_id = str(UUID(str(frame.get("board_id"))))
+            column_ids = frame.get("column_ids") or []
+            if not isinstance(column_ids, list):
+                raise ValueError("column_ids must be a list")
+            column_ids = [UUID(str(column_id)) for column_id in column_ids]
+            column_ids = await run_in_threadpool(run_column_reorder, ctx, board_id, column_ids)
+            await manager.send(websocket, {"type": "ACK", "request_id": request_id, "column_ids": column_ids})
+        else:
+            await manager.send(websocket, {"type": "ERROR", "request_id": request_id, "status": 400, "detail": f"Unknown action: {action}"})
+    except HTTPException as e:
+        await manager.send(websocket, {"type": "ERROR", "request_id": request_id, "status": e.status_code, "detail": e.detail})
+    except (ValidationError, ValueError) as e:
+        await manager.send(websocket, {"type": "ERROR", "request_id": request_id, "status": 422, "detail": str(e)})
+    except Exception:
+        # Database errors (SQLAlchemyError) and anything else unexpected: answer the command
+        # like an HTTP 500 instead of tearing down the socket
+        logger.exception("ws.command_failed action=%s user=%s", action, ctx.user.id)
+        await manager.send(websocket, {"type": "ERROR", "request_id": request_id, "status": 500, "detail": "Internal server error"})
+
+COMMAND_ACTIONS = {"move_ticket", "update_ticket", "reorder_columns"}
+
+@router.websocket("")
+async def multiplexed_websocket_endpoint(
+    websocket: WebSocket,
+    token: str = Query(...),
+):
+    """
+    Single per-user connection. After connecting the client manages its channels with frames:
+
+        {"action": "subscribe", "board_id": "..."}
+        {"action": "subscribe", "ticket_id": "..."}
+        {"action": "unsubscribe", "board_id": "..."}
+
+    Each subscription is authorized separately. The user's personal channel is joined automatically.
+    Board events carry a "board_id" so the client can route them. Mutations are sent as
+    commands (see handle_command). Requesting the "boardly.msgpack" subprotocol switches
+    both directions to MessagePack binary frames; JSON text frames are the default.
+    """
+    start = time.perf_counter()
+    user_id = deps.decode_token_subject(token)
+    auth_done = time.perf_counter()
+    # Blocking DB work runs in the threadpool so it never stalls the other sockets on this worker
+    user = await run_in_threadpool(deps.get_active_user_by_id, user_id) if user_id else None
+    db_done = time.perf_counter()
+    HANDSHAKE_SECONDS.observe(auth_done - start, endpoint="user", phase="auth")
+    HANDSHAKE_SECONDS.observe(db_done - auth_done, endpoint="user", phase="db")
+    if not user:
+        await websocket.close(code=1008)  # Policy Violation
+        return
+
+    ctx = CommandContext(user)
+    await manager.connect(websocket, user_id=str(user.id))
+    HANDSHAKE_SECONDS.observe(time.perf_counter() - db_done, endpoint="user", phase="accept")
+    HANDSHAKE_SECONDS.observe(time.perf_counter() - start, endpoint="user", phase="total")
+    manager.subscribe(websocket, channel_name(USER_CHANNEL, str(user.id)))
+    try:
+        while True:
+            try:
+                frame = await manager.receive(websocket)
+            except ValueError:
+                await manager.send(websocket, {"type": "ERROR", "detail": "Invalid JSON frame"})
+                continue
+            if isinstance(frame, dict) and frame.get("action") in COMMAND_ACTIONS:
+                await handle_command(websocket, ctx, frame)
+            else:
+                await handle_subscription_frame(websocket, user, frame)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # However the loop ended, never leave a dead socket in the channels and presence
+        manager.disconnect(websocket)
+
+async def handle_subscription_frame(websocket: WebSocket, user: models.User, frame: dict):
+    action = frame.get("action") if isinstance(frame, dict) else None
+    if action not in ("subscribe", "unsubscribe"):
+        await manager.send(websocket, {"type": "ERROR", "detail": f"Unknown action: {action}"})
+        return
+
+    try:
+        if frame.get("board_id"):
+            kind, id = BOARD_CHANNEL, str(UUID(str(frame["board_id"])))
+        elif frame.get("ticket_id"):
+            kind, id = TICKET_CHANNEL, str(UUID(str(frame["ticket_id"])))
+        else:
+            await manager.send(websocket, {"type": "ERROR", "detail": "board_id or ticket_id is required"})
+            return
+    except ValueError:
+        await manager.send(websocket, {"type": "ERROR", "detail": "Invalid id"})
+        return
+    channel = channel_name(kind, id)
+
+    if action == "unsubscribe":
+        manager.unsubscribe(websocket, channel)
+        await manager.send(websocket, {"type": "UNSUBSCRIBED", "channel": channel})
+        return
+
+    if not manager.is_subscribed(websocket, channel):
+        board_id = await run_in_threadpool(authorize_channel, user, kind, id)
+        if board_id is None:
+            await manager.send(websocket, {"type": "ERROR", "channel": channel, "detail": "Not enough permissions"})
+            return
+        manager.subscribe(websocket, channel, board_id=board_id)
+    await manager.send(websocket, {"type": "SUBSCRIBED", "channel": channel})
+    if kind == BOARD_CHANNEL:
+        await manager.send(websocket, manager.presence_snapshot(id))
+
 @router.websocket("/{board_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     board_id: str,
     token: str = Query(...),
-    db: Session = Depends(deps.get_db)
 ):
-    # Manual token validation for WebSocket (since Depends(deps.get_current_user) doesn't work easily with WS)
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = schemas.user.TokenPayload(**payload)
-        user = db.query(models.User).filter(models.User.id == token_data.sub).first()
-        if not user or not user.is_active:
-            await websocket.close(code=1008)  # Policy Violation
-            return
-    except (JWTError, Exception):
-        await websocket.close(code=1008)
+    start = time.perf_counter()
+    user_id = deps.decode_token_subject(token)
+    auth_done = time.perf_counter()
+    HANDSHAKE_SECONDS.observe(auth_done - start, endpoint="board", phase="auth")
+    user = await run_in_threadpool(deps.get_active_user_by_id, user_id) if user_id else None
+    if not user:
+        await websocket.close(code=1008)  # Policy Violation
         return
 
     # Check if user has access to this board
-    # (Optional: for simplicity in this MVP, we mostly check if board exists)
-    # But better to check membership
-    is_member = db.query(models.BoardUser).filter(
-        models.BoardUser.board_id == board_id,
-        models.BoardUser.user_id == user.id
-    ).first() is not None
-    
-    # Also check if user is owner
-    board = db.query(models.Board).filter(models.Board.id == board_id).first()
-    if not board:
+    found_board_id, has_access = await run_in_threadpool(load_board_access, user, board_id)
+    if found_board_id is None:
         await websocket.close(code=1007) # Invalid payload data (board not found)
         return
-        
-    is_owner = str(board.owner_id) == str(user.id)
-    
-    if not (is_owner or is_member):
+
+    db_done = time.perf_counter()
+    HANDSHAKE_SECONDS.observe(db_done - auth_done, endpoint="board", phase="db")
+    if not has_access:
         await websocket.close(code=1008)
         return
 
-    await manager.connect(websocket, board_id)
+    board_id = found_board_id
+    ctx = CommandContext(user)
+    await manager.connect(websocket, board_id, user_id=str(user.id))
+    HANDSHAKE_SECONDS.observe(time.perf_counter() - db_done, endpoint="board", phase="accept")
+    HANDSHAKE_SECONDS.observe(time.perf_counter() - start, endpoint="board", phase="total")
+    await manager.send(websocket, manager.presence_snapshot(board_id))
     try:
         while True:
-            # We mostly use WS for server -> client updates, 
-            # but we keep the connection alive
-            await websocket.receive_text()
+            # Mostly server -> client updates; anything that isn't a command is a keep-alive
+            try:
+                frame = await manager.receive(websocket)
+            except ValueError:
+                continue
+            if isinstance(frame, dict) and frame.get("action") in COMMAND_ACTIONS:
+                await handle_command(websocket, ctx, frame)
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, board_id)
@@ -18,6 +18,26 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # OBSERVABILITY
+    LOG_LEVEL: str = "INFO"
+
+    # REALTIME
+    SSE_BACKLOG_SIZE: int = 256  # events kept per board for Last-Event-ID resume
+    SSE_BACKLOG_BOARDS: int = 1000  # boards with a retained backlog, least recently active evicted first
+    SSE_QUEUE_SIZE: int = 256  # pending events per SSE client before it is told to resync
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+    OUTBOX_POLL_SECONDS: float = 1.0  # fallback poll; commits in this process wake the relay immediately
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_GAP_TIMEOUT_SECONDS: float = 10.0  # how long to wait for an id that committed out of order
+    OUTBOX_RETENTION_HOURS: int = 24
+    OUTBOX_CLEANUP_SECONDS: float = 300.0
+
+    BOARD_PURGE_BATCH_SIZE: int = 1000  # tickets deleted per transaction when purging a deleted board
+    TICKET_RETENTION_DAYS: int = 30  # deleted tickets can be restored for this long
+    TICKET_PURGE_BATCH_SIZE: int = 1000
+    TICKET_PURGE_INTERVAL_SECONDS: float = 3600.0
+    PRESENCE_COALESCE_SECONDS: float = 1.0  # presence changes within this window go out as one frame
+
     # GOOGLE AUTH
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
@@ -0,0 +1,96 @@
+import enum
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Optional, Type
+from uuid import UUID
+
+import msgpack
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+
+# WebSocket subprotocols. Clients that request none get JSON.
+JSON_SUBPROTOCOL = "boardly.json"
+MSGPACK_SUBPROTOCOL = "boardly.msgpack"
+
+# MessagePack extension type carrying a UUID as its 16 raw bytes
+UUID_EXT_TYPE = 1
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    Compact encodings for the types that dominate our payloads:
+    UUIDs become 16-byte extension values and datetimes native MessagePack timestamps.
+    """
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(UUID_EXT_TYPE, obj.bytes)
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return msgpack.Timestamp.from_datetime(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to MessagePack")
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == UUID_EXT_TYPE:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+def packb(payload: Any) -> bytes:
+    return msgpack.packb(payload, default=_msgpack_default, use_bin_type=True)
+
+def unpackb(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, timestamp=3, raw=False)
+
+def dumps_json(payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    True when the Accept header ranks MessagePack at least as high as JSON.
+    JSON stays the default for missing, wildcard or unparseable headers.
+    """
+    if not accept:
+        return False
+    msgpack_q = json_q = 0.0
+    for part in accept.split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if media_type.lower() in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type.lower() in (JSON_MEDIA_TYPE, "*/*", "application/*"):
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
+
+def negotiate(request: Request, schema: Type[BaseModel], obj: Any, many: bool = False) -> Any:
+    """
+    Return a MessagePack response when the client asks for one, otherwise hand the object
+    back unchanged so FastAPI serializes it through the route's response_model as JSON.
+    """
+    if not accepts_msgpack(request.headers.get("accept")):
+        return obj
+    if many:
+        content = [schema.model_validate(item).model_dump() for item in obj]
+    else:
+        content = schema.model_validate(obj).model_dump()
+    return MsgPackResponse(content, headers={"Vary": "Accept"})
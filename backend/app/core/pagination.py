@@ -0,0 +1,59 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+# Response header carrying the cursor of the next page; absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Page size when the client doesn't pass a limit, and the most it can ask for
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+class CursorError(ValueError):
+    pass
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+def encode_cursor(key: str, values: Sequence[Any]) -> str:
+    """
+    Opaque cursor pointing after the row with the given sort values (the last one
+    being its id). key names the ordering the cursor belongs to, e.g. "created_at:desc".
+    """
+    payload = json.dumps([key, [_dump(value) for value in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, key: str, types: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """
+    Sort values of a cursor made by encode_cursor for the same key, each converted with
+    the matching callable of types (e.g. datetime.fromisoformat, UUID).
+    Raises CursorError for a malformed cursor or one made for another ordering.
+    """
+    try:
+        cursor_key, values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise CursorError("Invalid cursor") from e
+    if cursor_key != key or not isinstance(values, list) or len(values) != len(types):
+        raise CursorError("Cursor does not match this ordering")
+    try:
+        return [convert(value) for convert, value in zip(types, values)]
+    except (TypeError, ValueError) as e:
+        raise CursorError("Invalid cursor") from e
+
+def after(columns: Sequence[Any], values: Sequence[Any], descending: bool):
+    """
+    Keyset condition for the rows after values in ORDER BY columns (all in the same
+    direction). A row comparison, so an index on the same columns serves it directly
+    and any page costs the same as the first.
+    """
+    left = tuple_(*columns)
+    right = tuple_(*values)
+    return left < right if descending else left > right
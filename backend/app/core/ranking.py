@@ -0,0 +1,83 @@
+from typing import List, Optional
+
+# Base-62 digits in ASCII order, so keys compare correctly byte-wise (COLLATE "C")
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Keys longer than this make the column due for a rebalance
+MAX_RANK_LENGTH = 32
+
+def _midpoint(lo: str, hi: Optional[str]) -> str:
+    """
+    A key strictly between lo and hi (hi None meaning +infinity).
+    Missing trailing digits of lo count as "0"; hi must not end in "0".
+    """
+    if hi is not None:
+        # Copy the common prefix, then recurse on the rest
+        n = 0
+        while n < len(hi) and (lo[n] if n < len(lo) else "0") == hi[n]:
+            n += 1
+        if n > 0:
+            return hi[:n] + _midpoint(lo[n:], hi[n:])
+    lo_digit = DIGITS.index(lo[0]) if lo else 0
+    hi_digit = DIGITS.index(hi[0]) if hi is not None else BASE
+    if hi_digit - lo_digit > 1:
+        return DIGITS[(lo_digit + hi_digit + 1) // 2]
+    # Adjacent digits: the key continues past the first digit
+    if hi is not None and len(hi) > 1:
+        return hi[:1]
+    return DIGITS[lo_digit] + _midpoint(lo[1:], None)
+
+def _successor(lo: str) -> str:
+    """
+    The next key after a non-empty lo when nothing follows it, counting like an odometer
+    over the digits "1".."z": the last digit that isn't "z" goes up by one and the digits
+    after it restart at "1". Once every digit is "z" the key gets as many new digits as it
+    has, so each extension multiplies the room and appended keys grow like log62(n).
+    """
+    for i in range(len(lo) - 1, -1, -1):
+        if lo[i] != DIGITS[-1]:
+            return lo[:i] + DIGITS[DIGITS.index(lo[i]) + 1] + DIGITS[1] * (len(lo) - i - 1)
+    return lo + DIGITS[1] * len(lo)
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Rank key for a ticket placed between the keys before and after, either of which
+    may be None for the start / end of the column. Only the moved ticket needs a new key.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"{before!r} is not below {after!r}")
+    if after is None and before:
+        # Appending is the common case: step instead of halving the room left above
+        return _successor(before)
+    return _midpoint(before or "", after)
+
+def spread_ranks(count: int) -> List[str]:
+    """
+    count evenly spaced, increasing keys of the shortest length that fits them,
+    used when (re)numbering a whole column.
+    """
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width // (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value = step * i
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        # Trailing zeros don't change the ordering and would block inserting right before the key
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
+
+def ranks_after(last: Optional[str], count: int) -> List[str]:
+    """
+    count increasing keys after last, for appending many tickets at once.
+    They share one new prefix, so repeated batches grow the keys slowly.
+    """
+    start = rank_between(last, None)
+    if count == 1:
+        return [start]
+    return [start + rank for rank in spread_ranks(count)]
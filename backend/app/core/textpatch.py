@@ -0,0 +1,75 @@
+from typing import List, Sequence, Tuple
+
+# (start, end, text): replace the characters [start, end) of the base text with text.
+# Offsets count Unicode code points, as Python's str and PostgreSQL's text functions do.
+Op = Tuple[int, int, str]
+# (start, end, text, removed): an op that also carries base[start:end], so it can be undone
+ReversibleOp = Tuple[int, int, str, str]
+
+# More ops than this in one patch: the client should send the whole field instead
+MAX_PATCH_OPS = 100
+
+class PatchError(ValueError):
+    pass
+
+def check_ops(ops: Sequence[Op], length: int) -> List[Op]:
+    """
+    Validate ops against a base text of the given length and return them sorted by offset.
+    All offsets refer to the base text, so ops must not overlap.
+    """
+    if len(ops) > MAX_PATCH_OPS:
+        raise PatchError(f"A patch can have at most {MAX_PATCH_OPS} operations")
+    ordered = sorted(ops, key=lambda op: (op[0], op[1]))
+    previous_end = 0
+    for start, end, _ in ordered:
+        if start < 0 or end < start:
+            raise PatchError(f"Invalid range {start}-{end}")
+        if end > length:
+            raise PatchError(f"Range {start}-{end} is past the end of the text ({length})")
+        if start < previous_end:
+            raise PatchError(f"Range {start}-{end} overlaps another operation")
+        previous_end = end
+    return ordered
+
+def apply_ops(text: str, ops: Sequence[Op]) -> str:
+    parts = []
+    position = 0
+    for start, end, insert in check_ops(ops, len(text)):
+        parts += [text[position:start], insert]
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+def diff_ops(old: str, new: str) -> List[Op]:
+    """
+    A single op turning old into new: everything between their common prefix and suffix.
+    Empty when the texts are equal.
+    """
+    if old == new:
+        return []
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return [(prefix, len(old) - suffix, new[prefix:len(new) - suffix])]
+
+def reversible_ops(base: str, ops: Sequence[Op]) -> List[ReversibleOp]:
+    """
+    The ops (sorted) with the text each one replaces in base, as stored in history.
+    """
+    return [(start, end, text, base[start:end]) for start, end, text in check_ops(ops, len(base))]
+
+def revert_ops(text: str, ops: Sequence[ReversibleOp]) -> str:
+    """
+    Undo reversible ops: turn the text they produced back into their base text.
+    """
+    inverse = []
+    shift = 0
+    for start, end, insert, removed in sorted(ops, key=lambda op: (op[0], op[1])):
+        # Offsets in the produced text move by the growth of the ops before
+        inverse.append((start + shift, start + shift + len(insert), removed))
+        shift += len(insert) - (end - start)
+    return apply_ops(text, inverse)
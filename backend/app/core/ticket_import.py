@@ -0,0 +1,114 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+NDJSON_FORMAT = "ndjson"
+CSV_FORMAT = "csv"
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/jsonl", "application/json-lines", "application/ndjson"}
+CSV_MEDIA_TYPES = {"text/csv", "application/csv"}
+
+# A single record larger than this is rejected instead of being buffered further
+MAX_RECORD_BYTES = 1024 * 1024
+
+class RecordError(ValueError):
+    pass
+
+def detect_format(content_type: Optional[str], requested: Optional[str] = None) -> Optional[str]:
+    """
+    Pick the import format from an explicit ?format= value or the Content-Type header.
+    Returns None when neither names a supported format.
+    """
+    if requested:
+        requested = requested.lower()
+        return requested if requested in (NDJSON_FORMAT, CSV_FORMAT) else None
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        return NDJSON_FORMAT
+    if media_type in CSV_MEDIA_TYPES:
+        return CSV_FORMAT
+    return None
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a byte stream into text lines without holding more than one line in memory.
+    Lines keep no terminator; a UTF-8 BOM is dropped and invalid bytes are replaced.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    carry = ""
+    async for chunk in chunks:
+        carry += decoder.decode(chunk)
+        *lines, carry = carry.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(carry) > MAX_RECORD_BYTES:
+            raise RecordError("Line is too long")
+    carry += decoder.decode(b"", final=True)
+    if carry:
+        yield carry.rstrip("\r")
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], fmt: str
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Yield (line number, record, error) for every record of an NDJSON or CSV stream.
+    Exactly one of record and error is set. CSV needs a header row; quoted fields may
+    span lines, so a CSV record is only parsed once its quotes are balanced.
+    """
+    line_no = 0
+    if fmt == NDJSON_FORMAT:
+        async for line in iter_lines(chunks):
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_no, None, "Invalid JSON"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "Expected a JSON object"
+                continue
+            yield line_no, record, None
+        return
+
+    header = None
+    pending = []
+    pending_size = 0
+    start = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not pending:
+            start = line_no
+            if not line.strip():
+                continue
+        pending.append(line)
+        pending_size += len(line)
+        # Doubled quotes ("") count twice, so an odd total means a field is still open
+        if sum(part.count('"') for part in pending) % 2:
+            if pending_size > MAX_RECORD_BYTES:
+                raise RecordError(f"Record starting on line {start} is too long")
+            continue
+        try:
+            fields = next(csv.reader(["\n".join(pending)], strict=True))
+        except csv.Error as e:
+            fields = None
+            error = f"Invalid CSV: {e}"
+        pending = []
+        pending_size = 0
+
+        if header is None:
+            if fields is None:
+                raise RecordError(error)
+            header = [name.strip().lower() for name in fields]
+            continue
+        if fields is None:
+            yield start, None, error
+        elif len(fields) != len(header):
+            yield start, None, f"Expected {len(header)} fields, got {len(fields)}"
+        else:
+            yield start, dict(zip(header, fields)), None
+
+    if pending:
+        yield start, None, "Unterminated quoted field"
@@ -2,3 +2,4 @@ from .crud_user import user
 from .crud_board import board
 from .crud_ticket import ticket
 from .crud_preferences import preferences
+from .crud_template import template
@@ -1,14 +1,25 @@
-from typing import List, Optional
+import uuid
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import DateTime, case, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Session
+from app.core.utils import utcnow
 from app.models.board import Board, Column
+from app.models.ticket import Ticket
 from app.schemas.board import BoardCreate, BoardUpdate
+from app.crud.outbox import publish_board_event
+
+DEFAULT_COLUMNS = ["Backlog", "Ready for Dev", "In Development", "In QA", "Done"]
 
 class CRUDBoard:
     def get(self, db: Session, id: str) -> Optional[Board]:
-        return db.query(Board).filter(Board.id == id).first()
+        return db.query(Board).filter(Board.id == id, Board.deleted_at.is_(None)).first()
 
     def get_multi_by_owner(self, db: Session, owner_id: str, skip: int = 0, limit: int = 100) -> List[Board]:
-        return db.query(Board).filter(Board.owner_id == owner_id).offset(skip).limit(limit).all()
+        return db.query(Board).filter(
+            Board.owner_id == owner_id, Board.deleted_at.is_(None)
+        ).offset(skip).limit(limit).all()
 
     def get_multi_for_user(self, db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[Board]:
         from app.models.board_user import BoardUser
@@ -18,29 +29,87 @@ class CRUDBoard:
             or_(
                 Board.owner_id == user_id,
                 BoardUser.user_id == user_id
-            )
+            ),
+            Board.deleted_at.is_(None)
         ).distinct().offset(skip).limit(limit).all()
 
+    def has_access(self, db: Session, *, board_id: str, user_id: str) -> bool:
+        """
+        Check in a single query whether the user owns or is a member of the board.
+        """
+        from app.models.board_user import BoardUser
+        from sqlalchemy import or_
+
+        return db.query(Board.id).outerjoin(
+            BoardUser, (BoardUser.board_id == Board.id) & (BoardUser.user_id == user_id)
+        ).filter(
+            Board.id == board_id,
+            Board.deleted_at.is_(None),
+            or_(Board.owner_id == user_id, BoardUser.user_id.isnot(None))
+        ).first() is not None
+
     def create_with_owner(self, db: Session, *, obj_in: BoardCreate, owner_id: str) -> Board:
+        from app.models.board_user import BoardUser, BoardRole
+
+        # Note: Default columns are now created in the API endpoint
         db_obj = Board(
             name=obj_in.name,
             description=obj_in.description,
-            owner_id=owner_id
+            owner_id=owner_id,
+            # Add owner as Board Admin, inserted in the same flush
+            members=[BoardUser(user_id=owner_id, role=BoardRole.ADMIN)]
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
+        return db_obj
 
-        # Note: Default columns are now created in the API endpoint
-        
-        # Add owner as Board Admin
-        from app.models.board_user import BoardUser, BoardRole
-        board_user = BoardUser(board_id=db_obj.id, user_id=owner_id, role=BoardRole.ADMIN)
-        db.add(board_user)
+    def add_columns(self, db: Session, *, board: Board, names: List[str]) -> List[UUID]:
+        """
+        Append columns to the board with one multi-row INSERT. Returns their ids, in order.
+        """
+        start = db.scalar(select(func.coalesce(func.max(Column.order) + 1, 0)).where(Column.board_id == board.id))
+        rows = [
+            {"id": uuid.uuid4(), "board_id": board.id, "name": name, "order": start + index}
+            for index, name in enumerate(names)
+        ]
+        if rows:
+            db.execute(insert(Column).values(rows))
+        db.expire(board, ["columns"])
+        return [row["id"] for row in rows]
 
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+    def copy_columns(self, db: Session, *, source: Board, board: Board) -> Dict[UUID, UUID]:
+        """
+        Copy the columns of source into board with one INSERT ... SELECT.
+        Returns the map from each source column id to its copy's id.
+        """
+        column_ids = db.scalars(select(Column.id).where(Column.board_id == source.id)).all()
+        column_map = {column_id: uuid.uuid4() for column_id in column_ids}
+        if column_map:
+            copies = select(
+                case(column_map, value=Column.id),
+                literal(board.id, PG_UUID(as_uuid=True)),
+                Column.name,
+                Column.order
+            ).where(Column.board_id == source.id)
+            db.execute(insert(Column).from_select(["id", "board_id", "name", "order"], copies))
+        db.expire(board, ["columns"])
+        return column_map
+
+    def copy_members(self, db: Session, *, source: Board, board: Board) -> None:
+        """
+        Give board the members of source, with their roles, in one INSERT ... SELECT.
+        The new board's owner keeps the admin membership it already has.
+        """
+        from app.models.board_user import BoardUser
+
+        members = select(
+            literal(board.id, PG_UUID(as_uuid=True)),
+            BoardUser.user_id,
+            BoardUser.role,
+            literal(utcnow(), DateTime(timezone=True))
+        ).where(BoardUser.board_id == source.id, BoardUser.user_id != board.owner_id)
+        db.execute(insert(BoardUser).from_select(["board_id", "user_id", "role", "created_at"], members))
+        db.expire(board, ["members"])
 
     def update(
         self,
@@ -53,16 +122,67 @@ class CRUDBoard:
         for field in update_data:
             setattr(db_obj, field, update_data[field])
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        publish_board_event(db, db_obj.id, {"type": "BOARD_UPDATED"})
+        db.flush()
         return db_obj
 
     def remove(self, db: Session, *, id: str) -> Board:
+        """
+        Soft-delete the board: it disappears from every board lookup at once,
+        while its rows are removed later by purge_batch.
+        """
         obj = db.query(Board).get(id)
-        db.delete(obj)
-        db.commit()
+        obj.deleted_at = utcnow()
+        publish_board_event(db, obj.id, {"type": "BOARD_DELETED"})
+        db.flush()
         return obj
 
+    def get_deleted_ids(self, db: Session) -> List[UUID]:
+        return db.scalars(select(Board.id).where(Board.deleted_at.isnot(None))).all()
+
+    def purge_batch(self, db: Session, *, board_id: UUID, batch_size: int = 1000) -> int:
+        """
+        Delete up to batch_size tickets of a soft-deleted board; their comments,
+        history and watchers go with them through ON DELETE CASCADE.
+        Once no tickets are left the board row itself is deleted, cascading to its
+        columns and members. Returns the number of rows deleted, 0 when done.
+        Commit between calls to keep each transaction small.
+        """
+        batch = select(Ticket.id).where(Ticket.board_id == board_id).limit(batch_size)
+        deleted = db.execute(
+            delete(Ticket).where(Ticket.id.in_(batch)),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+        if deleted:
+            return deleted
+        return db.execute(
+            delete(Board).where(Board.id == board_id, Board.deleted_at.isnot(None)),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+    def reorder_columns(self, db: Session, *, board: Board, column_ids: List[UUID]) -> bool:
+        """
+        Set the order of every column of the board with one UPDATE ... CASE statement.
+        column_ids must list each column of the board exactly once; returns False otherwise.
+        The columns are locked first, so a concurrent add or reorder can't interleave.
+        """
+        current = db.scalars(
+            select(Column.id).where(Column.board_id == board.id).with_for_update()
+        ).all()
+        if len(column_ids) != len(current) or set(column_ids) != set(current):
+            return False
+        if column_ids:
+            db.execute(
+                update(Column)
+                .where(Column.board_id == board.id)
+                .values(order=case({column_id: order for order, column_id in enumerate(column_ids)}, value=Column.id)),
+                execution_options={"synchronize_session": False}
+            )
+        db.expire(board, ["columns"])
+        publish_board_event(db, board.id, {"type": "COLUMNS_REORDERED", "column_ids": [str(column_id) for column_id in column_ids]})
+        db.flush()
+        return True
+
     def add_member(self, db: Session, *, board: Board, user_id: str) -> Board:
         from app.models.board_user import BoardUser, BoardRole
         
@@ -71,8 +191,8 @@ class CRUDBoard:
         if not existing:
             member = BoardUser(board_id=board.id, user_id=user_id, role=BoardRole.MEMBER)
             db.add(member)
-            db.commit()
-            db.refresh(board)
+            db.flush()
+            db.expire(board, ["members"])
         return board
 
     def remove_member(self, db: Session, *, board: Board, user_id: str) -> Board:
@@ -81,8 +201,8 @@ class CRUDBoard:
         member = db.query(BoardUser).filter_by(board_id=board.id, user_id=user_id).first()
         if member:
             db.delete(member)
-            db.commit()
-            db.refresh(board)
+            db.flush()
+            db.expire(board, ["members"])
         return board
 
 board = CRUDBoard()
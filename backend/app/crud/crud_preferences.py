@@ -14,8 +14,7 @@ class CRUDPreferences:
             **obj_in.model_dump()
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(
@@ -31,8 +30,7 @@ class CRUDPreferences:
                 setattr(db_obj, field, update_data[field])
                 
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
 preferences = CRUDPreferences()
@@ -0,0 +1,68 @@
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.board import Board, Column
+from app.models.board_template import BoardTemplate
+from app.models.ticket import Ticket
+from app.schemas.template import BoardTemplateCreate
+
+class CRUDBoardTemplate:
+    def get(self, db: Session, id: str) -> Optional[BoardTemplate]:
+        return db.query(BoardTemplate).filter(BoardTemplate.id == id).first()
+
+    def get_multi_by_owner(self, db: Session, owner_id: str, skip: int = 0, limit: int = 100) -> List[BoardTemplate]:
+        return db.query(BoardTemplate).filter(
+            BoardTemplate.owner_id == owner_id
+        ).order_by(BoardTemplate.created_at.desc()).offset(skip).limit(limit).all()
+
+    def create_with_owner(self, db: Session, *, obj_in: BoardTemplateCreate, owner_id: str) -> BoardTemplate:
+        db_obj = BoardTemplate(
+            name=obj_in.name,
+            description=obj_in.description,
+            owner_id=owner_id,
+            columns=obj_in.columns,
+            tickets=[ticket.model_dump(mode="json") for ticket in obj_in.tickets]
+        )
+        db.add(db_obj)
+        db.flush()
+        return db_obj
+
+    def create_from_board(
+        self, db: Session, *, board: Board, name: str, description: Optional[str], include_tickets: bool, owner_id: str
+    ) -> BoardTemplate:
+        """
+        Snapshot the board's columns, and optionally its live tickets in board order, as a template.
+        """
+        columns = db.execute(
+            select(Column.id, Column.name).where(Column.board_id == board.id).order_by(Column.order)
+        ).all()
+        tickets = []
+        if include_tickets:
+            index = {column_id: i for i, (column_id, _) in enumerate(columns)}
+            rows = db.execute(
+                select(Ticket.title, Ticket.description, Ticket.priority, Ticket.column_id)
+                .where(Ticket.board_id == board.id, Ticket.deleted_at.is_(None))
+                .order_by(Ticket.column_id, Ticket.rank)
+            )
+            tickets = [
+                {"title": title, "description": description, "priority": priority.value, "column": index[column_id]}
+                for title, description, priority, column_id in rows
+            ]
+            tickets.sort(key=lambda ticket: ticket["column"])
+        db_obj = BoardTemplate(
+            name=name,
+            description=description,
+            owner_id=owner_id,
+            columns=[column_name for _, column_name in columns],
+            tickets=tickets
+        )
+        db.add(db_obj)
+        db.flush()
+        return db_obj
+
+    def remove(self, db: Session, *, db_obj: BoardTemplate) -> BoardTemplate:
+        db.delete(db_obj)
+        db.flush()
+        return db_obj
+
+template = CRUDBoardTemplate()
@@ -1,17 +1,109 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.ticket import Ticket
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import DateTime, Text, bindparam, case, delete, func, insert, literal, null, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session, selectinload
+from app.core.pagination import after as keyset_after
+from app.core.ranking import MAX_RANK_LENGTH, rank_between, ranks_after, spread_ranks
+from app.core.textpatch import Op
+from app.core.utils import utcnow
+from app.models.ticket import Ticket, TicketPriority
+from app.models.user import User
 from app.schemas.ticket import TicketCreate, TicketUpdate
-from app.models.history import TicketActionType
-from app.crud.history_log import log_ticket_history
+from app.models.history import HistoryEncoding, TicketActionType
+from app.crud.history_log import log_text_change, log_ticket_history
+from app.crud.outbox import publish_board_event
 from app.crud.crud_watcher import crud_watcher
 
+FIELD_ACTION_TYPES = {
+    "priority": TicketActionType.PRIORITY_CHANGED,
+    "assignee_id": TicketActionType.ASSIGNEE_CHANGED,
+    "column_id": TicketActionType.STATUS_CHANGED, # Assuming column_id change means status change
+}
+
+# Session.info key collecting the columns whose rank keys grew too long in this transaction
+REBALANCE_COLUMNS_KEY = "rank_rebalance_columns"
+
+# Orderings of get_multi_by_board, each backed by an index ending in (column, id)
+TICKET_SORTS = {
+    "created_at": Ticket.created_at,
+    "updated_at": Ticket.updated_at,
+    "rank": Ticket.rank,
+}
+
+def _check_rank_length(db: Session, column_id: UUID, rank: str) -> str:
+    if len(rank) > MAX_RANK_LENGTH:
+        db.info.setdefault(REBALANCE_COLUMNS_KEY, set()).add(column_id)
+    return rank
+
+def _appended_rank(column_id: UUID):
+    """
+    SQL expression placing the updated tickets below the last live ticket of column_id,
+    in their current relative order: that ticket's key prefixed to their own.
+    """
+    last = select(func.max(Ticket.rank)).where(
+        Ticket.column_id == column_id, Ticket.deleted_at.is_(None)
+    ).scalar_subquery()
+    return func.coalesce(last, "") + Ticket.rank
+
 class CRUDTicket:
-    def get(self, db: Session, id: str) -> Optional[Ticket]:
-        return db.query(Ticket).filter(Ticket.id == id).first()
+    def get(self, db: Session, id: str, include_deleted: bool = False) -> Optional[Ticket]:
+        query = db.query(Ticket).filter(Ticket.id == id)
+        if not include_deleted:
+            query = query.filter(Ticket.deleted_at.is_(None))
+        return query.first()
 
-    def get_multi_by_board(self, db: Session, board_id: str, skip: int = 0, limit: int = 100) -> List[Ticket]:
-        return db.query(Ticket).filter(Ticket.board_id == board_id).offset(skip).limit(limit).all()
+    def get_multi_by_board(
+        self,
+        db: Session,
+        board_id: UUID,
+        *,
+        column_id: Optional[UUID] = None,
+        assignee_id: Optional[UUID] = None,
+        priority: Optional[TicketPriority] = None,
+        created_by_id: Optional[UUID] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        sort: str = "created_at",
+        descending: bool = True,
+        after: Optional[List[Any]] = None,
+        limit: int = 50
+    ) -> List[Ticket]:
+        """
+        Live tickets of a board, filtered, ordered by sort (a TICKET_SORTS key) then id,
+        starting after the (sort value, id) pair given in after. Keyset pagination: with
+        at most one of the column/assignee/priority/reporter filters, every page is one
+        index range scan, however deep (rank order takes no filter but column_id);
+        further filters are checked on the rows of that scan.
+        Assignees and reporters are loaded in one query each.
+        """
+        sort_column = TICKET_SORTS[sort]
+        query = db.query(Ticket).options(
+            selectinload(Ticket.assignee).selectinload(User.preferences),
+            selectinload(Ticket.reporter).selectinload(User.preferences)
+        ).filter(Ticket.board_id == board_id, Ticket.deleted_at.is_(None))
+        if column_id is not None:
+            query = query.filter(Ticket.column_id == column_id)
+        if assignee_id is not None:
+            query = query.filter(Ticket.assignee_id == assignee_id)
+        if priority is not None:
+            query = query.filter(Ticket.priority == priority)
+        if created_by_id is not None:
+            query = query.filter(Ticket.created_by_id == created_by_id)
+        if updated_after is not None:
+            query = query.filter(Ticket.updated_at >= updated_after)
+        if updated_before is not None:
+            query = query.filter(Ticket.updated_at < updated_before)
+        if after is not None:
+            query = query.filter(keyset_after((sort_column, Ticket.id), after, descending))
+        if descending:
+            query = query.order_by(sort_column.desc(), Ticket.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Ticket.id.asc())
+        return query.limit(limit).all()
 
     def create_with_board(self, db: Session, *, obj_in: TicketCreate, board_id: str, creator_id: str) -> Ticket:
         db_obj = Ticket(
@@ -21,16 +113,21 @@ class CRUDTicket:
             board_id=board_id,
             column_id=obj_in.status_column_id,
             assignee_id=obj_in.assignee_id,
-            created_by_id=creator_id
+            created_by_id=creator_id,
+            # New tickets go to the bottom of their column
+            rank=self.rank_at_end(db, obj_in.status_column_id)
         )
         db.add(db_obj)
         db.flush() # Flush to get ID for history
 
+        # The first description is the base the later description patches start from
         log_ticket_history(
             db=db,
             ticket_id=db_obj.id,
             actor_id=creator_id,
-            action_type=TicketActionType.TICKET_CREATED
+            action_type=TicketActionType.TICKET_CREATED,
+            field_name="description" if db_obj.description else None,
+            new_value=db_obj.description or None
         )
 
         # Auto-watch: creator becomes a watcher
@@ -41,55 +138,181 @@ class CRUDTicket:
                 ticket_id=db_obj.id,
                 actor_id=creator_id,
                 action_type=TicketActionType.WATCHER_ADDED,
-                new_value=str(creator_id)
+                new_value=new_watcher.user_id
             )
 
-        db.commit()
-        db.refresh(db_obj)
+        publish_board_event(db, board_id, {"type": "TICKET_CREATED", "ticket_id": str(db_obj.id)})
+        db.flush()
         return db_obj
         
-    def update(self, db: Session, *, db_obj: Ticket, obj_in: TicketUpdate, actor_id: str) -> Ticket:
-        # Calculate changes before applying
+    def create_many(self, db: Session, *, board_id: UUID, rows: List[dict], creator_id: UUID) -> List[UUID]:
+        """
+        Insert a batch of tickets with one multi-row INSERT, for imports.
+        rows hold title, description, priority, column_id and assignee_id.
+        Logs TICKET_CREATED and auto-watches the creator like create_with_board,
+        but publishes no per-ticket events. Returns the new ticket ids.
+        """
+        if not rows:
+            return []
+        now = utcnow()
+        # Appended to the bottom of their columns in file order
+        ranks = {}
+        for column_id in {row["column_id"] for row in rows}:
+            count = sum(1 for row in rows if row["column_id"] == column_id)
+            ranks[column_id] = iter(ranks_after(self.last_rank(db, column_id), count))
+        tickets = [
+            {
+                "id": uuid.uuid4(),
+                "title": row["title"],
+                "description": row.get("description"),
+                "priority": row.get("priority") or TicketPriority.MEDIUM,
+                "board_id": board_id,
+                "column_id": row["column_id"],
+                "rank": _check_rank_length(db, row["column_id"], next(ranks[row["column_id"]])),
+                "assignee_id": row.get("assignee_id"),
+                "created_by_id": creator_id,
+                "created_at": now,
+                "updated_at": now,
+                "version": 1,
+            }
+            for row in rows
+        ]
+        # Core executemany: the driver batches it into multi-row VALUES
+        db.execute(insert(Ticket.__table__), tickets)
+        self._log_created(
+            db, board_id=board_id, tickets=[(ticket["id"], ticket["description"]) for ticket in tickets],
+            creator_id=creator_id
+        )
+        return [ticket["id"] for ticket in tickets]
+
+    def copy_from_board(
+        self,
+        db: Session,
+        *,
+        source_board_id: UUID,
+        board_id: UUID,
+        column_map: Dict[UUID, UUID],
+        creator_id: UUID,
+        keep_assignees: bool = False
+    ) -> List[UUID]:
+        """
+        Copy the live tickets of source_board_id into board_id with one INSERT ... SELECT.
+        column_map maps each source column to its copy; ranks are kept, so is the order.
+        Logs and auto-watches like create_many. Returns the new ticket ids.
+        """
+        if not column_map:
+            return []
+        now = literal(utcnow(), DateTime(timezone=True))
+        copies = select(
+            func.gen_random_uuid(),
+            Ticket.title,
+            Ticket.description,
+            Ticket.priority,
+            literal(board_id, PG_UUID(as_uuid=True)),
+            case(column_map, value=Ticket.column_id),
+            Ticket.assignee_id if keep_assignees else null(),
+            literal(creator_id, PG_UUID(as_uuid=True)),
+            now,
+            now,
+            Ticket.rank
+        ).where(Ticket.board_id == source_board_id, Ticket.deleted_at.is_(None))
+        stmt = insert(Ticket).from_select(
+            ["id", "title", "description", "priority", "board_id", "column_id",
+             "assignee_id", "created_by_id", "created_at", "updated_at", "rank"],
+            copies
+        ).returning(Ticket.id, Ticket.description)
+        tickets = db.execute(stmt).all()
+        self._log_created(db, board_id=board_id, tickets=tickets, creator_id=creator_id)
+        return [ticket_id for ticket_id, _ in tickets]
+
+    def _log_created(
+        self, db: Session, *, board_id: UUID, tickets: List[Tuple[UUID, Optional[str]]], creator_id: UUID
+    ) -> None:
+        """tickets holds (id, description) pairs; the descriptions are logged as the patch base."""
+        for ticket_id, description in tickets:
+            log_ticket_history(
+                db=db,
+                ticket_id=ticket_id,
+                actor_id=creator_id,
+                action_type=TicketActionType.TICKET_CREATED,
+                field_name="description" if description else None,
+                new_value=description or None
+            )
+        ticket_ids = [ticket_id for ticket_id, _ in tickets]
+        # Auto-watch: creator becomes a watcher
+        for ticket_id, user_id in crud_watcher.add_watchers(
+            db, board_id=board_id, user_ids=[creator_id], added_by=creator_id, ticket_ids=ticket_ids
+        ):
+            log_ticket_history(
+                db=db,
+                ticket_id=ticket_id,
+                actor_id=creator_id,
+                action_type=TicketActionType.WATCHER_ADDED,
+                new_value=user_id
+            )
+
+    def update(self, db: Session, *, db_obj: Ticket, obj_in: TicketUpdate, actor_id: str) -> Optional[Ticket]:
+        """
+        Apply the update in one conditional UPDATE ... RETURNING round trip.
+        The pre-update values come back from a CTE for the history log.
+        If obj_in.version is set the row is only written while it still has that version;
+        returns None when it doesn't (someone else changed or deleted the ticket).
+        """
         update_data = obj_in.model_dump(exclude_unset=True)
+        expected_version = update_data.pop("version", None)
         
         # Map schema fields to model fields
         if "status_column_id" in update_data:
             update_data["column_id"] = update_data.pop("status_column_id")
 
+        ignored_fields = {"updated_at", "created_at", "id", "board_id"}
+        update_data = {
+            field: value for field, value in update_data.items()
+            if field not in ignored_fields and hasattr(Ticket, field)
+        }
+
+        old = select(
+            Ticket.id, *(getattr(Ticket, field).label(f"old_{field}") for field in update_data)
+        ).where(Ticket.id == db_obj.id)
+        if expected_version is not None:
+            old = old.where(Ticket.version == expected_version)
+        old = old.cte("old")
+        stmt = update(Ticket).where(Ticket.id == old.c.id)
+        if expected_version is not None:
+            # Re-checked against the latest row version if a concurrent update commits first
+            stmt = stmt.where(Ticket.version == expected_version)
+        extra = {}
+        if "column_id" in update_data and update_data["column_id"] != db_obj.column_id:
+            # Moved to another column: bottom of it
+            extra["rank"] = self.rank_at_end(db, update_data["column_id"])
+        stmt = stmt.values(**update_data, **extra, version=Ticket.version + 1).returning(
+            Ticket, *(old.c[f"old_{field}"] for field in update_data)
+        )
+        row = db.execute(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).first()
+        if row is None:
+            return None
+        db_obj = row[0]
+
         # Track changes for history
         changes = []
-        ignored_fields = {"updated_at", "created_at", "id", "board_id"}
-        
-        for field, new_value in update_data.items():
-            if field in ignored_fields:
-                continue
-                
-            if hasattr(db_obj, field):
-                old_value = getattr(db_obj, field)
-                # Convert enums/uuids to strings for comparison if needed, or simple equality check
-                if old_value != new_value:
+        for field, old_value in zip(update_data, row[1:]):
+            new_value = update_data[field]
+            if old_value != new_value:
+                changes.append({
                     # Determine specific action type if applicable
-                    action_type = TicketActionType.TICKET_UPDATED
-                    if field == "priority":
-                        action_type = TicketActionType.PRIORITY_CHANGED
-                    elif field == "assignee_id":
-                        action_type = TicketActionType.ASSIGNEE_CHANGED
-                    elif field == "column_id": # Assuming column_id change means status change
-                        action_type = TicketActionType.STATUS_CHANGED
-                    
-                    changes.append({
-                        "action_type": action_type,
-                        "field_name": field,
-                        "old_value": old_value,
-                        "new_value": new_value
-                    })
-                    
-                    setattr(db_obj, field, new_value)
-
-        db.add(db_obj)
+                    "action_type": FIELD_ACTION_TYPES.get(field, TicketActionType.TICKET_UPDATED),
+                    "field_name": field,
+                    "old_value": old_value,
+                    "new_value": new_value
+                })
         
         # Log gathered changes
         for change in changes:
+            if change["field_name"] == "description":
+                log_text_change(db, db_obj.id, actor_id, "description", change["old_value"], change["new_value"])
+                continue
             log_ticket_history(
                 db=db,
                 ticket_id=db_obj.id,
@@ -108,26 +331,353 @@ class CRUDTicket:
                         ticket_id=db_obj.id,
                         actor_id=actor_id,
                         action_type=TicketActionType.WATCHER_ADDED,
-                        new_value=str(change["new_value"])
+                        new_value=new_watcher.user_id
                     )
 
-        db.commit()
-        db.refresh(db_obj)
+        publish_board_event(db, db_obj.board_id, {"type": "TICKET_UPDATED", "ticket_id": str(db_obj.id), "version": db_obj.version})
+        db.flush()
         return db_obj
 
-    def remove(self, db: Session, *, id: str, actor_id: str) -> Ticket:
-        obj = db.query(Ticket).get(id)
-        
-        # Log deletion before it happens (cascade will delete history too, but we log it anyway as per spec)
+    def patch_description(
+        self, db: Session, *, db_obj: Ticket, ops: List[Op], expected_version: int, actor_id: str
+    ) -> Optional[Ticket]:
+        """
+        Apply text ops (checked and sorted with check_ops) to the description inside
+        the UPDATE, so only the edits travel to the database.
+        The row is only written while it still has expected_version; returns None otherwise.
+        History and the broadcast carry the ops, not the text; history also keeps the
+        replaced slices, which come back from a CTE, so the ops can be undone.
+        """
+        # The replaced slices of the pre-update text
+        old = select(Ticket.id, *(
+            func.substr(func.coalesce(Ticket.description, ""), start + 1, end - start, type_=Text).label(f"removed_{i}")
+            for i, (start, end, _) in enumerate(ops)
+        )).where(Ticket.id == db_obj.id, Ticket.version == expected_version, Ticket.deleted_at.is_(None)).cte("old")
+        # Slices of the current text between the ops, joined with the ops' text
+        base = func.coalesce(Ticket.description, "")
+        description = literal("", Text)
+        position = 0
+        for start, end, text in ops:
+            description = description + func.substr(base, position + 1, start - position, type_=Text) + text
+            position = end
+        description = description + func.substr(base, position + 1, type_=Text)
+        stmt = update(Ticket).where(
+            # Re-checked against the latest row version if a concurrent update commits first
+            Ticket.id == old.c.id, Ticket.version == expected_version, Ticket.deleted_at.is_(None)
+        ).values(description=description, version=Ticket.version + 1).returning(
+            Ticket, *(old.c[f"removed_{i}"] for i in range(len(ops)))
+        )
+        row = db.execute(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).first()
+        if row is None:
+            return None
+        db_obj = row[0]
+
+        patch = [[start, end, text] for start, end, text in ops]
+        log_ticket_history(
+            db=db,
+            ticket_id=db_obj.id,
+            actor_id=actor_id,
+            action_type=TicketActionType.TICKET_UPDATED,
+            field_name="description",
+            new_value=json.dumps([op + [removed] for op, removed in zip(patch, row[1:])]),
+            encoding=HistoryEncoding.PATCH
+        )
+        publish_board_event(db, db_obj.board_id, {
+            "type": "TICKET_UPDATED",
+            "ticket_id": str(db_obj.id),
+            "version": db_obj.version,
+            # Clients holding base_version can apply the ops instead of refetching
+            "patch": {"field": "description", "base_version": expected_version, "ops": patch}
+        })
+        db.flush()
+        return db_obj
+
+    def last_rank(self, db: Session, column_id: UUID) -> Optional[str]:
+        return db.scalar(
+            select(func.max(Ticket.rank)).where(Ticket.column_id == column_id, Ticket.deleted_at.is_(None))
+        )
+
+    def rank_at_end(self, db: Session, column_id: UUID) -> str:
+        return _check_rank_length(db, column_id, rank_between(self.last_rank(db, column_id), None))
+
+    def rank_between_neighbours(
+        self,
+        db: Session,
+        *,
+        ticket_id: UUID,
+        column_id: UUID,
+        after_id: Optional[UUID] = None,
+        before_id: Optional[UUID] = None
+    ) -> Optional[str]:
+        """
+        Rank for placing a ticket in a column right after after_id, right before before_id,
+        or at the bottom when neither is given. Only the given neighbour is needed: the
+        other side is looked up on the (column_id, rank) index.
+        Returns None when the neighbour is not a ticket of that column.
+        """
+        others = select(Ticket.rank).where(
+            Ticket.column_id == column_id, Ticket.deleted_at.is_(None), Ticket.id != ticket_id
+        )
+        if after_id is not None or before_id is not None:
+            neighbour = db.scalar(select(Ticket.rank).where(
+                Ticket.id == (after_id or before_id), Ticket.column_id == column_id, Ticket.deleted_at.is_(None)
+            ))
+            if neighbour is None:
+                return None
+            if after_id is not None:
+                lo = neighbour
+                hi = db.scalar(others.where(Ticket.rank > lo).order_by(Ticket.rank).limit(1))
+            else:
+                hi = neighbour
+                lo = db.scalar(others.where(Ticket.rank < hi).order_by(Ticket.rank.desc()).limit(1))
+        else:
+            lo = db.scalar(others.order_by(Ticket.rank.desc()).limit(1))
+            hi = None
+        return _check_rank_length(db, column_id, rank_between(lo, hi))
+
+    def move(
+        self,
+        db: Session,
+        *,
+        db_obj: Ticket,
+        column_id: UUID,
+        rank: str,
+        expected_version: Optional[int] = None,
+        actor_id: str
+    ) -> Optional[Ticket]:
+        """
+        Write a ticket's new column and rank with one conditional UPDATE ... RETURNING.
+        No other row is touched. Returns None on a version conflict, as update does.
+        """
+        old_column_id = db_obj.column_id
+        stmt = update(Ticket).where(Ticket.id == db_obj.id)
+        if expected_version is not None:
+            stmt = stmt.where(Ticket.version == expected_version)
+        stmt = stmt.values(column_id=column_id, rank=rank, version=Ticket.version + 1).returning(Ticket)
+        db_obj = db.scalars(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).first()
+        if db_obj is None:
+            return None
+
+        if old_column_id != column_id:
+            log_ticket_history(
+                db=db,
+                ticket_id=db_obj.id,
+                actor_id=actor_id,
+                action_type=TicketActionType.STATUS_CHANGED,
+                field_name="column_id",
+                old_value=old_column_id,
+                new_value=column_id
+            )
+        publish_board_event(db, db_obj.board_id, {
+            "type": "TICKET_MOVED",
+            "ticket_id": str(db_obj.id),
+            "column_id": str(column_id),
+            "rank": rank,
+            "version": db_obj.version
+        })
+        db.flush()
+        return db_obj
+
+    def rebalance_column(self, db: Session, column_id: UUID) -> int:
+        """
+        Give every ticket of a column a short, evenly spaced rank, keeping the order.
+        The column's tickets are locked while this runs. Versions are not bumped:
+        the tickets' contents don't change. Clients get one COLUMN_REBALANCED event.
+        Returns the number of tickets renumbered.
+        """
+        rows = db.execute(
+            select(Ticket.id, Ticket.rank, Ticket.board_id)
+            .where(Ticket.column_id == column_id, Ticket.deleted_at.is_(None))
+            .order_by(Ticket.rank, Ticket.id).with_for_update()
+        ).all()
+        changes = [
+            {"ticket_id": ticket_id, "new_rank": new_rank}
+            for (ticket_id, rank, _), new_rank in zip(rows, spread_ranks(len(rows)))
+            if rank != new_rank
+        ]
+        if changes:
+            table = Ticket.__table__
+            db.execute(
+                update(table).where(table.c.id == bindparam("ticket_id"))
+                # Keep updated_at: only the position encoding changes
+                .values(rank=bindparam("new_rank"), updated_at=table.c.updated_at),
+                changes
+            )
+            publish_board_event(db, rows[0].board_id, {"type": "COLUMN_REBALANCED", "column_id": str(column_id)})
+        return len(changes)
+
+    def remove(self, db: Session, *, id: str, actor_id: str) -> Optional[Ticket]:
+        """
+        Soft-delete the ticket with a single-row UPDATE. Its comments, history and
+        watchers stay until purge_expired hard-deletes it, so it can be restored.
+        Returns None if the ticket is already deleted.
+        """
+        stmt = update(Ticket).where(Ticket.id == id, Ticket.deleted_at.is_(None)).values(
+            deleted_at=utcnow()
+        ).returning(Ticket)
+        obj = db.scalars(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).first()
+        if obj is None:
+            return None
+
         log_ticket_history(
             db=db,
             ticket_id=obj.id,
             actor_id=actor_id,
             action_type=TicketActionType.TICKET_DELETED
         )
-        
-        db.delete(obj)
-        db.commit()
+        publish_board_event(db, obj.board_id, {"type": "TICKET_DELETED", "ticket_id": str(obj.id)})
+        db.flush()
         return obj
 
+    def restore(self, db: Session, *, id: str, actor_id: str) -> Optional[Ticket]:
+        """
+        Undo a soft delete; the ticket returns to its previous column and position.
+        Returns None if the ticket isn't deleted (or was already purged).
+        """
+        stmt = update(Ticket).where(Ticket.id == id, Ticket.deleted_at.isnot(None)).values(
+            deleted_at=None
+        ).returning(Ticket)
+        obj = db.scalars(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).first()
+        if obj is None:
+            return None
+
+        log_ticket_history(
+            db=db,
+            ticket_id=obj.id,
+            actor_id=actor_id,
+            action_type=TicketActionType.TICKET_RESTORED
+        )
+        publish_board_event(db, obj.board_id, {"type": "TICKET_RESTORED", "ticket_id": str(obj.id)})
+        db.flush()
+        return obj
+
+    def purge_expired(self, db: Session, *, deleted_before: datetime, batch_size: int = 1000) -> int:
+        """
+        Hard-delete up to batch_size tickets soft-deleted before deleted_before, with
+        their comments, history and watchers (ON DELETE CASCADE). Rows locked by another
+        purger are skipped. Returns the number deleted; commit between calls.
+        """
+        batch = select(Ticket.id).where(
+            Ticket.deleted_at < deleted_before
+        ).limit(batch_size).with_for_update(skip_locked=True)
+        return db.execute(
+            delete(Ticket).where(Ticket.id.in_(batch)),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+    def bulk_set(
+        self, db: Session, *, board_id: UUID, ticket_ids: List[UUID], field: str, value: Any, actor_id: UUID
+    ) -> List[UUID]:
+        """
+        Set one field on many tickets of a board with a single UPDATE ... RETURNING.
+        Tickets that already hold the value are left untouched. History is logged,
+        and a new assignee auto-watches, for the tickets that changed; their ids are returned.
+        """
+        column = getattr(Ticket, field)
+        old = select(Ticket.id, column.label("old_value")).where(
+            Ticket.board_id == board_id,
+            Ticket.id.in_(ticket_ids),
+            Ticket.deleted_at.is_(None),
+            column.is_distinct_from(value)
+        ).cte("old")
+        values = {field: value, "version": Ticket.version + 1}
+        if field == "column_id":
+            values["rank"] = _appended_rank(value)
+        stmt = update(Ticket).where(Ticket.id == old.c.id).values(values).returning(
+            Ticket.id, old.c.old_value, Ticket.rank
+        )
+        rows = db.execute(stmt, execution_options={"synchronize_session": False}).all()
+        if field == "column_id":
+            for _, _, rank in rows:
+                _check_rank_length(db, value, rank)
+
+        for ticket_id, old_value, _ in rows:
+            log_ticket_history(
+                db=db,
+                ticket_id=ticket_id,
+                actor_id=actor_id,
+                action_type=FIELD_ACTION_TYPES.get(field, TicketActionType.TICKET_UPDATED),
+                field_name=field,
+                old_value=old_value,
+                new_value=value
+            )
+        changed = [ticket_id for ticket_id, _, _ in rows]
+
+        # Auto-watch: the new assignee watches every ticket handed to them
+        if field == "assignee_id" and value and changed:
+            added = crud_watcher.add_watchers(
+                db, board_id=board_id, user_ids=[value], added_by=actor_id, ticket_ids=changed
+            )
+            for ticket_id, user_id in added:
+                log_ticket_history(
+                    db=db,
+                    ticket_id=ticket_id,
+                    actor_id=actor_id,
+                    action_type=TicketActionType.WATCHER_ADDED,
+                    new_value=user_id
+                )
+        return changed
+
+    def move_column_tickets(
+        self, db: Session, *, column_id: UUID, target_column_id: UUID, actor_id: UUID
+    ) -> List[UUID]:
+        """
+        Move every ticket of a column to the bottom of another column with one UPDATE,
+        e.g. before the column is deleted. Deleted tickets move too, so they can still be
+        restored, but only live ones get a new version and a STATUS_CHANGED history row.
+        Returns the ids of the live tickets moved.
+        """
+        live = Ticket.deleted_at.is_(None)
+        stmt = update(Ticket).where(Ticket.column_id == column_id).values(
+            column_id=target_column_id,
+            rank=_appended_rank(target_column_id),
+            version=case((live, Ticket.version + 1), else_=Ticket.version)
+        ).returning(Ticket.id, Ticket.rank, live)
+        rows = db.execute(stmt, execution_options={"synchronize_session": False}).all()
+
+        moved = []
+        for ticket_id, rank, is_live in rows:
+            if not is_live:
+                continue
+            _check_rank_length(db, target_column_id, rank)
+            log_ticket_history(
+                db=db,
+                ticket_id=ticket_id,
+                actor_id=actor_id,
+                action_type=TicketActionType.STATUS_CHANGED,
+                field_name="column_id",
+                old_value=column_id,
+                new_value=target_column_id
+            )
+            moved.append(ticket_id)
+        return moved
+
+    def bulk_remove(self, db: Session, *, board_id: UUID, ticket_ids: List[UUID], actor_id: UUID) -> List[UUID]:
+        """
+        Soft-delete many tickets of a board with a single UPDATE ... RETURNING,
+        logging TICKET_DELETED for each. Returns the ids that were deleted.
+        """
+        stmt = update(Ticket).where(
+            Ticket.board_id == board_id,
+            Ticket.id.in_(ticket_ids),
+            Ticket.deleted_at.is_(None)
+        ).values(deleted_at=utcnow()).returning(Ticket.id)
+        deleted = list(db.scalars(stmt, execution_options={"synchronize_session": False}))
+        for ticket_id in deleted:
+            log_ticket_history(
+                db=db,
+                ticket_id=ticket_id,
+                actor_id=actor_id,
+                action_type=TicketActionType.TICKET_DELETED
+            )
+        return deleted
+
 ticket = CRUDTicket()
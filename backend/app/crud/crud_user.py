@@ -22,8 +22,7 @@ class CRUDUser:
             is_active=obj_in.is_active,
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(
@@ -44,8 +43,7 @@ class CRUDUser:
                 setattr(db_obj, field, update_data[field])
                 
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
 user = CRUDUser()
@@ -1,8 +1,11 @@
+from sqlalchemy import DateTime, and_, column as sa_column, delete, false, func, literal, or_, select, true, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from app.core.utils import utcnow
+from app.models.ticket import Ticket
 from app.models.ticket_watcher import TicketWatcher
 
 class CRUDWatcher:
@@ -20,29 +23,46 @@ class CRUDWatcher:
         """
         Add a watcher to a ticket.
         Returns the watcher if created, None if already exists.
+        A single INSERT ... ON CONFLICT DO NOTHING in the caller's transaction.
         """
-        # Check if already watching
-        existing = db.query(TicketWatcher).filter(
-            TicketWatcher.ticket_id == ticket_id,
-            TicketWatcher.user_id == user_id
-        ).first()
-        
-        if existing:
-            return None
-        
-        watcher = TicketWatcher(
+        stmt = insert(TicketWatcher).values(
             ticket_id=ticket_id,
             user_id=user_id,
             added_by=added_by
+        ).on_conflict_do_nothing(constraint="uq_ticket_user_watcher").returning(TicketWatcher)
+        return db.scalars(stmt).first()
+
+    def add_watchers(
+        self,
+        db: Session,
+        *,
+        board_id: UUID,
+        user_ids: List[UUID],
+        added_by: UUID,
+        ticket_ids: Optional[List[UUID]] = None,
+        column_id: Optional[UUID] = None
+    ) -> List[Tuple[UUID, UUID]]:
+        """
+        Make every user watch every selected ticket of the board in one INSERT ... SELECT.
+        Tickets are picked by id and/or by column. Returns the (ticket_id, user_id) pairs
+        that were actually added; existing watchers are skipped.
+        """
+        users = values(
+            sa_column("user_id", PG_UUID(as_uuid=True)), name="watcher_users"
+        ).data([(user_id,) for user_id in user_ids])
+        tickets = select(
+            func.gen_random_uuid(),
+            Ticket.id,
+            users.c.user_id,
+            literal(added_by, PG_UUID(as_uuid=True)),
+            literal(utcnow(), DateTime(timezone=True))
+        ).join(users, true()).where(self._ticket_filter(board_id, ticket_ids, column_id))
+        stmt = insert(TicketWatcher).from_select(
+            ["id", "ticket_id", "user_id", "added_by", "created_at"], tickets
+        ).on_conflict_do_nothing(constraint="uq_ticket_user_watcher").returning(
+            TicketWatcher.ticket_id, TicketWatcher.user_id
         )
-        db.add(watcher)
-        try:
-            db.commit()
-            db.refresh(watcher)
-            return watcher
-        except IntegrityError:
-            db.rollback()
-            return None
+        return [tuple(row) for row in db.execute(stmt)]
     
     def remove_watcher(
         self, 
@@ -51,17 +71,38 @@ class CRUDWatcher:
         user_id: UUID
     ) -> bool:
         """Remove a watcher from a ticket. Returns True if deleted, False if not found."""
-        watcher = db.query(TicketWatcher).filter(
+        stmt = delete(TicketWatcher).where(
             TicketWatcher.ticket_id == ticket_id,
             TicketWatcher.user_id == user_id
-        ).first()
-        
-        if not watcher:
-            return False
-        
-        db.delete(watcher)
-        db.commit()
-        return True
+        ).returning(TicketWatcher.id)
+        return db.execute(stmt, execution_options={"synchronize_session": False}).first() is not None
+
+    def remove_watchers(
+        self,
+        db: Session,
+        *,
+        board_id: UUID,
+        user_ids: List[UUID],
+        ticket_ids: Optional[List[UUID]] = None,
+        column_id: Optional[UUID] = None
+    ) -> List[Tuple[UUID, UUID]]:
+        """
+        Remove the users from the selected tickets of the board in one DELETE.
+        Returns the (ticket_id, user_id) pairs that were removed.
+        """
+        stmt = delete(TicketWatcher).where(
+            TicketWatcher.user_id.in_(user_ids),
+            TicketWatcher.ticket_id.in_(select(Ticket.id).where(self._ticket_filter(board_id, ticket_ids, column_id)))
+        ).returning(TicketWatcher.ticket_id, TicketWatcher.user_id)
+        return [tuple(row) for row in db.execute(stmt, execution_options={"synchronize_session": False})]
+
+    def _ticket_filter(self, board_id: UUID, ticket_ids: Optional[List[UUID]], column_id: Optional[UUID]):
+        selected = []
+        if ticket_ids:
+            selected.append(Ticket.id.in_(ticket_ids))
+        if column_id:
+            selected.append(Ticket.column_id == column_id)
+        return and_(Ticket.board_id == board_id, Ticket.deleted_at.is_(None), or_(*selected) if selected else false())
     
     def is_watching(self, db: Session, ticket_id: UUID, user_id: UUID) -> bool:
         """Check if a user is watching a ticket."""
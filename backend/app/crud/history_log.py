@@ -1,7 +1,21 @@
+import json
+import uuid
+import weakref
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, Any
-from app.models import TicketHistory, TicketActionType
+from app.core.textpatch import diff_ops, reversible_ops
+from app.core.utils import utcnow
+from app.db.base import SessionLocal
+from app.models import TicketHistory, TicketActionType, HistoryEncoding
+
+# Session.info key holding the history rows queued in the current transaction
+PENDING_HISTORY_KEY = "ticket_history_pending"
+# Text fields longer than this are logged as a patch from the old value, not both values
+DIFF_MIN_LENGTH = 200
+# {savepoint transaction: queue length when it began}
+_savepoint_marks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
 def log_ticket_history(
     db: Session,
@@ -10,25 +24,103 @@ def log_ticket_history(
     action_type: TicketActionType,
     field_name: Optional[str] = None,
     old_value: Optional[Any] = None,
-    new_value: Optional[Any] = None
-) -> TicketHistory:
+    new_value: Optional[Any] = None,
+    comment_id: Optional[UUID] = None,
+    encoding: Optional[HistoryEncoding] = None
+) -> dict:
     """
-    Log a ticket history event. 
+    Log a ticket history event.
     Does NOT commit the session to allow transaction bundling.
-    Values are stringified.
+    UUID values go to the old_ref/new_ref columns, other values are stringified.
+    The row is queued on the session and written with the rest of the request's
+    history as one batched INSERT when the session commits.
     """
-    
+    old_ref = new_ref = None
+    if isinstance(old_value, UUID):
+        old_ref, old_value = old_value, None
+    if isinstance(new_value, UUID):
+        new_ref, new_value = new_value, None
+
     # Handle converting values to string if they are not None
     old_val_str = str(old_value) if old_value is not None else None
     new_val_str = str(new_value) if new_value is not None else None
-    
-    history = TicketHistory(
+
+    history = {
+        "id": uuid.uuid4(),
+        "ticket_id": ticket_id,
+        "actor_id": actor_id,
+        "action_type": action_type,
+        "field_name": field_name,
+        "old_value": old_val_str,
+        "new_value": new_val_str,
+        "old_ref": old_ref,
+        "new_ref": new_ref,
+        "comment_id": comment_id,
+        "encoding": encoding,
+        "created_at": utcnow()
+    }
+    db.info.setdefault(PENDING_HISTORY_KEY, []).append(history)
+    return history
+
+def log_text_change(
+    db: Session, ticket_id: UUID, actor_id: UUID, field_name: str, old_text: Optional[str], new_text: Optional[str]
+) -> dict:
+    """
+    Log a change of a text field: both values while they are short, otherwise
+    only the ops turning the old text into the new one, with the text they removed.
+    Starting from the current value (or the TICKET_CREATED snapshot), the ops
+    rebuild every earlier (or later) version.
+    """
+    if max(len(old_text or ""), len(new_text or "")) <= DIFF_MIN_LENGTH:
+        return log_ticket_history(
+            db=db,
+            ticket_id=ticket_id,
+            actor_id=actor_id,
+            action_type=TicketActionType.TICKET_UPDATED,
+            field_name=field_name,
+            old_value=old_text,
+            new_value=new_text
+        )
+    return log_ticket_history(
+        db=db,
         ticket_id=ticket_id,
         actor_id=actor_id,
-        action_type=action_type,
+        action_type=TicketActionType.TICKET_UPDATED,
         field_name=field_name,
-        old_value=old_val_str,
-        new_value=new_val_str
+        new_value=json.dumps(reversible_ops(old_text or "", diff_ops(old_text or "", new_text or ""))),
+        encoding=HistoryEncoding.PATCH
     )
-    db.add(history)
-    return history
+
+def flush_ticket_history(db: Session) -> int:
+    """
+    Write the queued history rows now. Returns the number of rows written.
+    Called automatically before commit; call it directly when the rows must exist
+    earlier in the transaction (e.g. before deleting their ticket).
+    """
+    pending = db.info.pop(PENDING_HISTORY_KEY, None)
+    if not pending:
+        return 0
+    # Tickets created in this transaction must be inserted first
+    db.flush()
+    # Core executemany: the driver batches it into multi-row VALUES, no ORM objects involved
+    db.execute(insert(TicketHistory.__table__), pending)
+    return len(pending)
+
+@event.listens_for(SessionLocal, "before_commit")
+def _write_history_before_commit(session: Session):
+    flush_ticket_history(session)
+
+@event.listens_for(SessionLocal, "after_transaction_create")
+def _mark_history_at_savepoint(session: Session, transaction):
+    if transaction.nested:
+        _savepoint_marks[transaction] = len(session.info.get(PENDING_HISTORY_KEY, ()))
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _forget_history_after_rollback(session: Session, previous_transaction):
+    if previous_transaction.nested:
+        # Only drop what was logged inside the rolled back savepoint
+        mark = _savepoint_marks.pop(previous_transaction, None)
+        if mark is not None and PENDING_HISTORY_KEY in session.info:
+            del session.info[PENDING_HISTORY_KEY][mark:]
+        return
+    session.info.pop(PENDING_HISTORY_KEY, None)
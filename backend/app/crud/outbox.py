@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from uuid import UUID
+from typing import Union
+from app.models import OutboxEvent
+
+def publish_board_event(
+    db: Session,
+    board_id: Union[UUID, str],
+    message: dict
+) -> OutboxEvent:
+    """
+    Queue a board event in the outbox.
+    Does NOT commit the session: the event becomes visible to the relay only
+    if the surrounding mutation commits, and is discarded with it on rollback.
+    """
+    event = OutboxEvent(
+        board_id=board_id,
+        event_type=message["type"],
+        payload=message
+    )
+    db.add(event)
+    db.info["outbox_pending"] = True
+    return event
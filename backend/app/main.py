@@ -1,9 +1,34 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.pagination import NEXT_CURSOR_HEADER
+
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logging.getLogger("app").setLevel(settings.LOG_LEVEL)
+
+import asyncio
+from app.outbox import relay
+from app.purge import run_purge_jobs
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    relay.start()
+    purge_task = asyncio.create_task(run_purge_jobs())
+    yield
+    purge_task.cancel()
+    try:
+        await purge_task
+    except asyncio.CancelledError:
+        pass
+    await relay.stop()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,12 +42,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by clients paging through listings
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 @app.get("/")
 def read_root():
     return {"message": "Welcome to Boardly API"}
 
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    In-process metrics in the Prometheus text format, for scraping.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 
 from app.api.v1.api import api_router
 
@@ -3,7 +3,9 @@ from .board import Board, Column
 from .ticket import Ticket, TicketPriority
 from .board_user import BoardUser
 from .comment import Comment
-from .history import TicketHistory, TicketActionType
+from .history import TicketHistory, TicketActionType, HistoryEncoding
 from .ticket_watcher import TicketWatcher
 from .user_preferences import UserPreferences, ThemePreference
+from .outbox import OutboxEvent
 
+from .board_template import BoardTemplate
@@ -16,19 +16,28 @@ class Board(Base):
     
     created_at = Column(DateTime(timezone=True), default=utcnow)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    # Set when the board is deleted: it is hidden at once and purged in the background
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     owner = relationship("User", backref="boards")
-    columns = relationship("Column", back_populates="board", cascade="all, delete-orphan", order_by="Column.order")
-    tickets = relationship("Ticket", back_populates="board", cascade="all, delete-orphan")
-    members = relationship("BoardUser", back_populates="board", cascade="all, delete-orphan")
+    # passive_deletes: children are removed by the database's ON DELETE CASCADE, not loaded and deleted one by one
+    columns = relationship("Column", back_populates="board", cascade="all, delete-orphan", passive_deletes=True, order_by="Column.order")
+    tickets = relationship("Ticket", back_populates="board", cascade="all, delete-orphan", passive_deletes=True)
+    members = relationship("BoardUser", back_populates="board", cascade="all, delete-orphan", passive_deletes=True)
 
 class Column(Base):
     __tablename__ = "columns"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), nullable=False)
+    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     order = Column(Integer, nullable=False, default=0)
 
     board = relationship("Board", back_populates="columns")
-    tickets = relationship("Ticket", back_populates="column")
+    # Live tickets only; read-only since deleted tickets still reference the column
+    tickets = relationship(
+        "Ticket",
+        primaryjoin="and_(Column.id == Ticket.column_id, Ticket.deleted_at.is_(None))",
+        viewonly=True,
+        order_by="[Ticket.rank, Ticket.id]"
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import uuid
+from app.core.utils import utcnow
+from app.db.base import Base
+
+class BoardTemplate(Base):
+    __tablename__ = "board_templates"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    # Column names in board order
+    columns = Column(JSONB, nullable=False)
+    # Seed tickets: title, description, priority and the index of their column, in column order
+    tickets = Column(JSONB, nullable=False, default=list)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
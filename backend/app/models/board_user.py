@@ -13,7 +13,7 @@ class BoardRole(str, enum.Enum):
 class BoardUser(Base):
     __tablename__ = "board_users"
 
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), primary_key=True)
+    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
     role = Column(Enum(BoardRole), default=BoardRole.MEMBER, nullable=False)
     created_at = Column(DateTime(timezone=True), default=utcnow)
@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 from app.core.utils import utcnow
-from sqlalchemy import Column, String, ForeignKey, Enum, DateTime, Text
+from sqlalchemy import Column, String, ForeignKey, Enum, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -14,24 +14,44 @@ class TicketActionType(str, enum.Enum):
     ASSIGNEE_CHANGED = "ASSIGNEE_CHANGED"
     PRIORITY_CHANGED = "PRIORITY_CHANGED"
     TICKET_DELETED = "TICKET_DELETED"
+    TICKET_RESTORED = "TICKET_RESTORED"
     COMMENT_ADDED = "COMMENT_ADDED"
     COMMENT_EDITED = "COMMENT_EDITED"
     COMMENT_DELETED = "COMMENT_DELETED"
     WATCHER_ADDED = "WATCHER_ADDED"
     WATCHER_REMOVED = "WATCHER_REMOVED"
 
+class HistoryEncoding(str, enum.Enum):
+    # new_value is a JSON list of [start, end, text, removed] ops (app.core.textpatch.reversible_ops)
+    # from the previous text; they apply forwards and, with revert_ops, backwards
+    PATCH = "PATCH"
+
 class TicketHistory(Base):
     __tablename__ = "ticket_history"
+    __table_args__ = (
+        # A ticket's history newest first, paginated on (created_at, id); also serves
+        # lookups by ticket_id alone, including the cascade on ticket purge
+        Index("ix_ticket_history_ticket_id_created_at", "ticket_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, index=True)
+    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False)
     actor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     action_type = Column(Enum(TicketActionType), nullable=False)
     field_name = Column(String, nullable=True)
     old_value = Column(Text, nullable=True)
     new_value = Column(Text, nullable=True)
+    # Id values (columns, users) are stored here natively instead of as text in old/new_value
+    old_ref = Column(UUID(as_uuid=True), nullable=True)
+    new_ref = Column(UUID(as_uuid=True), nullable=True)
+    # Comment actions point at the comment instead of copying its content.
+    # No FK: the reference outlives a deleted comment
+    comment_id = Column(UUID(as_uuid=True), nullable=True)
+    # How old/new_value are encoded; NULL for plain text
+    encoding = Column(Enum(HistoryEncoding), nullable=True)
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
 
     # Relationships
     ticket = relationship("Ticket", back_populates="history_logs")
     actor = relationship("User")
+    comment = relationship("Comment", primaryjoin="foreign(TicketHistory.comment_id) == Comment.id", viewonly=True)
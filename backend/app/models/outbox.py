@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, BigInteger, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.core.utils import utcnow
+from app.db.base import Base
+
+class OutboxEvent(Base):
+    __tablename__ = "event_outbox"
+
+    # Monotonic id: the relay tails the table in id order
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # No FK: BOARD_DELETED must outlive its board
+    board_id = Column(UUID(as_uuid=True), nullable=False)
+    event_type = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_event_outbox_created_at", "created_at"),
+    )
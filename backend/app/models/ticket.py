@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Enum, DateTime, Text
+from sqlalchemy import Column, String, ForeignKey, Enum, DateTime, Text, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -20,18 +20,43 @@ class Ticket(Base):
     description = Column(Text, nullable=True)
     priority = Column(Enum(TicketPriority), default=TicketPriority.MEDIUM, nullable=False)
     
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), nullable=False)
+    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
     column_id = Column(UUID(as_uuid=True), ForeignKey("columns.id"), nullable=False)
     assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     
     created_at = Column(DateTime(timezone=True), default=utcnow)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    # Optimistic concurrency: bumped by every update, checked when the client sends it back
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Position within the column: fractional key from app.core.ranking, compared byte-wise
+    rank = Column(String(collation="C"), nullable=False)
+    # Soft delete: set tickets are hidden everywhere and hard-deleted once expired
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Partial indexes: live queries only ever look at live tickets, the purge only at deleted ones
+        Index("ix_tickets_column_id_rank", "column_id", "rank", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+        # Board listing (crud.ticket.get_multi_by_board): one index per filter and per
+        # created_at/updated_at sort, each ending in the sort column and id so keyset pages
+        # are plain range scans. Rank order only lists a whole column (ix_tickets_column_id_rank)
+        Index("ix_tickets_board_id_created_at", "board_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_updated_at", "board_id", "updated_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_column_id_created_at", "column_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_assignee_id", "board_id", "assignee_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_created_by_id", "board_id", "created_by_id", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_priority", "board_id", "priority", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_column_id_updated_at", "column_id", "updated_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_assignee_id_updated_at", "board_id", "assignee_id", "updated_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_created_by_id_updated_at", "board_id", "created_by_id", "updated_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tickets_board_id_priority_updated_at", "board_id", "priority", "updated_at", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     board = relationship("Board", back_populates="tickets")
-    column = relationship("Column", back_populates="tickets")
+    column = relationship("Column")
     assignee = relationship("User", foreign_keys=[assignee_id], backref="assigned_tickets")
     reporter = relationship("User", foreign_keys=[created_by_id], backref="reported_tickets")
-    comments = relationship("Comment", back_populates="ticket", cascade="all, delete-orphan")
-    history_logs = relationship("TicketHistory", back_populates="ticket", cascade="all, delete-orphan")
-    watchers = relationship("TicketWatcher", back_populates="ticket", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
+    history_logs = relationship("TicketHistory", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
+    watchers = relationship("TicketWatcher", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
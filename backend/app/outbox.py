@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta, timezone
+from typing import Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.utils import utcnow
+from app.db.base import SessionLocal
+from app.models.outbox import OutboxEvent
+from app.websockets import manager
+
+logger = logging.getLogger(__name__)
+
+# Holes wider than this are treated as sequence jumps rather than in-flight transactions
+MAX_TRACKED_GAP = 1000
+
+DISPATCHED = registry.counter(
+    "boardly_outbox_dispatched_total", "Outbox events handed to the broadcast layer"
+)
+DISPATCH_LAG_SECONDS = registry.histogram(
+    "boardly_outbox_lag_seconds", "Delay between an outbox event being written and broadcast",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+class OutboxRelay:
+    """
+    Tails the event outbox and feeds committed events to the connection manager.
+
+    Every process keeps its own cursor (the last id it delivered), since each one only
+    broadcasts to the sockets it holds. Ids are assigned at insert time but become
+    visible at commit time, so a transaction that commits late can leave a hole below the
+    cursor; such holes are re-checked until OUTBOX_GAP_TIMEOUT_SECONDS so late events are
+    still delivered instead of skipped. Events older than OUTBOX_RETENTION_HOURS are deleted
+    in batches.
+    """
+    def __init__(self):
+        self.last_id: Optional[int] = None
+        # gaps: {missing id: monotonic time it was first noticed}
+        self.gaps: Dict[int, float] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_cleanup = 0.0
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self):
+        """
+        Ask the relay to poll now. Safe to call from any thread.
+        """
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.dispatch_pending()
+                if time.monotonic() - self._last_cleanup > settings.OUTBOX_CLEANUP_SECONDS:
+                    self._last_cleanup = time.monotonic()
+                    await run_in_threadpool(self.cleanup)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("outbox.relay_failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_pending(self):
+        while True:
+            events = await run_in_threadpool(self._fetch_batch)
+            for outbox_event in events:
+                await manager.broadcast_to_board(str(outbox_event.board_id), outbox_event.payload)
+                created_at = outbox_event.created_at
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+                DISPATCH_LAG_SECONDS.observe(max((utcnow() - created_at).total_seconds(), 0.0))
+            DISPATCHED.inc(len(events))
+            if len(events) < settings.OUTBOX_BATCH_SIZE:
+                return
+
+    def _fetch_batch(self) -> List[OutboxEvent]:
+        with SessionLocal() as db:
+            if self.last_id is None:
+                # Events written before this process started had no sockets here to reach
+                self.last_id = db.scalar(select(func.max(OutboxEvent.id))) or 0
+                return []
+
+            events: List[OutboxEvent] = []
+            now = time.monotonic()
+            if self.gaps:
+                for gap_id, noticed in list(self.gaps.items()):
+                    if now - noticed > settings.OUTBOX_GAP_TIMEOUT_SECONDS:
+                        del self.gaps[gap_id]  # rolled back, or never coming
+                if self.gaps:
+                    events.extend(db.scalars(
+                        select(OutboxEvent).where(OutboxEvent.id.in_(list(self.gaps))).order_by(OutboxEvent.id)
+                    ))
+                    for late in events:
+                        self.gaps.pop(late.id, None)
+
+            batch = list(db.scalars(
+                select(OutboxEvent)
+                .where(OutboxEvent.id > self.last_id)
+                .order_by(OutboxEvent.id)
+                .limit(settings.OUTBOX_BATCH_SIZE)
+            ))
+            # With an empty table at startup there is no known floor to measure holes from
+            expected = self.last_id + 1 if self.last_id else None
+            for outbox_event in batch:
+                if expected is not None and outbox_event.id - expected <= MAX_TRACKED_GAP:
+                    for missing in range(expected, outbox_event.id):
+                        self.gaps.setdefault(missing, now)
+                expected = outbox_event.id + 1
+            if batch:
+                self.last_id = batch[-1].id
+            events.extend(batch)
+            db.expunge_all()
+            return events
+
+    def cleanup(self):
+        cutoff = utcnow() - timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+        with SessionLocal() as db:
+            while True:
+                expired = select(OutboxEvent.id).where(OutboxEvent.created_at < cutoff).limit(settings.OUTBOX_BATCH_SIZE)
+                result = db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(expired.scalar_subquery())))
+                db.commit()
+                if result.rowcount < settings.OUTBOX_BATCH_SIZE:
+                    return
+
+relay = OutboxRelay()
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_relay_after_commit(session: Session):
+    if session.info.pop("outbox_pending", False):
+        relay.wake()
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _forget_outbox_after_rollback(session: Session, previous_transaction):
+    # A savepoint rollback leaves earlier events of the transaction in place
+    if not previous_transaction.nested:
+        session.info.pop("outbox_pending", None)
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+
+from app import crud
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.db.base import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+# First key of the advisory locks taken on boards being purged; the second is hashtext(board id)
+BOARD_PURGE_LOCK = 1042
+
+def purge_board(board_id: UUID) -> None:
+    """
+    Remove a soft-deleted board and everything on it, one bounded batch per transaction,
+    so neither memory nor lock time grows with the board's size.
+    Skipped when another worker is already purging the board.
+    """
+    lock_key = (BOARD_PURGE_LOCK, func.hashtext(str(board_id)))
+    # A session-level advisory lock on a connection of its own, so it lasts across the
+    # batch commits; it is released below, or by the server if this process dies
+    with engine.connect() as lock_conn:
+        locked = lock_conn.scalar(select(func.pg_try_advisory_lock(*lock_key)))
+        lock_conn.commit()
+        if not locked:
+            logger.info("board.purge_skipped board_id=%s reason=locked", board_id)
+            return
+        try:
+            total = 0
+            with SessionLocal() as db:
+                while True:
+                    deleted = crud.board.purge_batch(db, board_id=board_id, batch_size=settings.BOARD_PURGE_BATCH_SIZE)
+                    db.commit()
+                    if not deleted:
+                        break
+                    total += deleted
+        finally:
+            lock_conn.scalar(select(func.pg_advisory_unlock(*lock_key)))
+            lock_conn.commit()
+    logger.info("board.purged board_id=%s rows=%d", board_id, total)
+
+def purge_deleted_boards() -> None:
+    """
+    Finish purging boards whose purge was interrupted, e.g. by a restart.
+    """
+    with SessionLocal() as db:
+        board_ids = crud.board.get_deleted_ids(db)
+    for board_id in board_ids:
+        try:
+            purge_board(board_id)
+        except Exception:
+            logger.exception("board.purge_failed board_id=%s", board_id)
+
+def purge_expired_tickets() -> int:
+    """
+    Hard-delete tickets soft-deleted more than TICKET_RETENTION_DAYS ago,
+    one bounded batch per transaction. Returns the number of tickets deleted.
+    """
+    deleted_before = utcnow() - timedelta(days=settings.TICKET_RETENTION_DAYS)
+    total = 0
+    with SessionLocal() as db:
+        while True:
+            deleted = crud.ticket.purge_expired(
+                db, deleted_before=deleted_before, batch_size=settings.TICKET_PURGE_BATCH_SIZE
+            )
+            db.commit()
+            total += deleted
+            if deleted < settings.TICKET_PURGE_BATCH_SIZE:
+                break
+    if total:
+        logger.info("ticket.purged rows=%d", total)
+    return total
+
+async def run_purge_jobs():
+    """
+    Background purging for the app's lifetime: finish interrupted board purges once,
+    then hard-delete expired tickets every TICKET_PURGE_INTERVAL_SECONDS.
+    """
+    await run_in_threadpool(purge_deleted_boards)
+    while True:
+        try:
+            await run_in_threadpool(purge_expired_tickets)
+        except Exception:
+            logger.exception("ticket.purge_failed")
+        await asyncio.sleep(settings.TICKET_PURGE_INTERVAL_SECONDS)
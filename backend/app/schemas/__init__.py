@@ -1,5 +1,6 @@
 from .user import User, UserCreate, UserUpdate
-from .board import Board, BoardCreate, BoardUpdate, BoardMemberAdd, Column, ColumnCreate, ColumnUpdate
-from .ticket import Ticket, TicketCreate, TicketUpdate
+from .board import Board, BoardCreate, BoardUpdate, BoardMemberAdd, BoardClone, Column, ColumnCreate, ColumnUpdate, ColumnOrder
+from .ticket import Ticket, TicketCreate, TicketUpdate, TicketMove, TicketDescriptionPatch, TicketBulkRequest, TicketBulkResult, TicketImportResult
 from .comment import Comment, CommentCreate, CommentUpdate, CommentResponse
 from .history import TicketHistory, TicketHistoryCreate
+from .template import BoardTemplate, BoardTemplateCreate, BoardTemplateFromBoard, TemplateTicket
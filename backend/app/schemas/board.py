@@ -14,6 +14,9 @@ class ColumnCreate(ColumnBase):
 class ColumnUpdate(ColumnBase):
     pass
 
+class ColumnOrder(BaseModel):
+    column_ids: List[UUID]  # every column of the board, in display order
+
 from .ticket import Ticket
 
 class Column(ColumnBase):
@@ -30,7 +33,7 @@ class BoardBase(BaseModel):
     description: Optional[str] = None
 
 class BoardCreate(BoardBase):
-    pass
+    template_id: Optional[UUID] = None  # columns and seed tickets; default columns otherwise
 
 class BoardUpdate(BoardBase):
     pass
@@ -45,5 +48,10 @@ class Board(BoardBase):
     class Config:
         from_attributes = True
 
+class BoardClone(BaseModel):
+    name: Optional[str] = None  # defaults to "<name> (copy)"
+    include_tickets: bool = True
+    include_members: bool = False  # also keeps ticket assignees
+
 class BoardMemberAdd(BaseModel):
     email: str
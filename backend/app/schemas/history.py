@@ -1,8 +1,8 @@
 from typing import Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from datetime import datetime
 from uuid import UUID
-from app.models.history import TicketActionType
+from app.models.history import HistoryEncoding, TicketActionType
 from .user import User
 
 class TicketHistoryBase(BaseModel):
@@ -16,6 +16,13 @@ class TicketHistoryCreate(TicketHistoryBase):
     old_value: Optional[str] = None
     new_value: Optional[str] = None
 
+class HistoryComment(BaseModel):
+    id: UUID
+    content: str
+
+    class Config:
+        from_attributes = True
+
 class TicketHistory(TicketHistoryBase):
     id: UUID
     ticket_id: UUID
@@ -24,9 +31,25 @@ class TicketHistory(TicketHistoryBase):
     field_name: Optional[str] = None
     old_value: Optional[str] = None
     new_value: Optional[str] = None
+    old_ref: Optional[UUID] = None
+    new_ref: Optional[UUID] = None
+    comment_id: Optional[UUID] = None
+    comment: Optional[HistoryComment] = None  # None once the comment is deleted
+    encoding: Optional[HistoryEncoding] = None
     created_at: datetime
     actor: User
 
+    @model_validator(mode="after")
+    def fill_values(self) -> "TicketHistory":
+        # Clients reading old/new_value keep seeing ids and comment text there
+        if self.old_value is None and self.old_ref is not None:
+            self.old_value = str(self.old_ref)
+        if self.new_value is None and self.new_ref is not None:
+            self.new_value = str(self.new_ref)
+        if self.new_value is None and self.action_type == TicketActionType.COMMENT_ADDED and self.comment:
+            self.new_value = self.comment.content
+        return self
+
     model_config = {
         "from_attributes": True,
         "json_encoders": {
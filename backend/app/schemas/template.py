@@ -0,0 +1,32 @@
+from typing import Optional, List
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from .ticket import TicketPriority
+
+class TemplateTicket(BaseModel):
+    title: str
+    description: Optional[str] = None
+    priority: TicketPriority = TicketPriority.MEDIUM
+    column: int  # index into the template's columns
+
+class BoardTemplateBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+class BoardTemplateCreate(BoardTemplateBase):
+    columns: List[str]
+    tickets: List[TemplateTicket] = []
+
+class BoardTemplateFromBoard(BoardTemplateBase):
+    include_tickets: bool = False
+
+class BoardTemplate(BoardTemplateBase):
+    id: UUID
+    owner_id: UUID
+    columns: List[str]
+    tickets: List[TemplateTicket] = []
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
@@ -27,17 +27,38 @@ class TicketUpdate(BaseModel):
     status_column_id: Optional[UUID] = None
     assignee_id: Optional[UUID] = None
     created_by_id: Optional[UUID] = None
+    version: Optional[int] = None  # expected current version; omit to overwrite unconditionally
+
+class TicketMove(BaseModel):
+    column_id: UUID
+    # Neighbour in the target column: place right after after_id or right before before_id.
+    # Neither means the bottom of the column.
+    after_id: Optional[UUID] = None
+    before_id: Optional[UUID] = None
+    version: Optional[int] = None  # expected current version, as in TicketUpdate
+
+class TextPatchOp(BaseModel):
+    # Replace characters [start, end) of the description with text; offsets in code points
+    start: int
+    end: int
+    text: str = ""
+
+class TicketDescriptionPatch(BaseModel):
+    version: int  # version of the ticket the ops were computed against
+    ops: List[TextPatchOp]
 
 class Ticket(TicketBase):
     id: UUID
     board_id: UUID
     column_id: UUID
+    rank: str
     assignee_id: Optional[UUID] = None
     assignee: Optional[User] = None
     created_by_id: Optional[UUID] = None
     reporter: Optional[User] = None
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = {
         "from_attributes": True,
@@ -45,3 +66,62 @@ class Ticket(TicketBase):
             datetime: lambda v: v.isoformat() if v else None
         }
     }
+
+class TicketSort(str, Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    RANK = "rank"  # board order within a column; needs column_id
+
+class SortOrder(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+class TicketBulkAction(str, Enum):
+    MOVE = "move"
+    ASSIGN = "assign"
+    SET_PRIORITY = "set_priority"
+    DELETE = "delete"
+
+# A bulk request runs in one transaction with a savepoint per operation, so both are
+# capped to bound the rows it locks; larger changes are split across requests
+MAX_BULK_TICKETS = 500
+MAX_BULK_OPERATIONS = 20
+
+class TicketBulkOperation(BaseModel):
+    action: TicketBulkAction
+    ticket_ids: List[UUID] = Field(..., max_length=MAX_BULK_TICKETS)
+    column_id: Optional[UUID] = None  # move
+    assignee_id: Optional[UUID] = None  # assign; null unassigns
+    priority: Optional[TicketPriority] = None  # set_priority
+
+class TicketBulkRequest(BaseModel):
+    operations: List[TicketBulkOperation] = Field(..., max_length=MAX_BULK_OPERATIONS)
+    # atomic: any failed operation rolls back the whole request.
+    # Otherwise each operation commits or fails on its own.
+    atomic: bool = True
+
+class TicketBulkStatus(str, Enum):
+    APPLIED = "applied"
+    FAILED = "failed"
+    ROLLED_BACK = "rolled_back"  # valid, but undone because another operation failed
+
+class TicketBulkOperationResult(BaseModel):
+    index: int
+    action: TicketBulkAction
+    status: TicketBulkStatus
+    ticket_ids: List[UUID] = []  # tickets actually changed or deleted
+    detail: Optional[str] = None
+
+class TicketBulkResult(BaseModel):
+    committed: bool
+    results: List[TicketBulkOperationResult]
+
+class TicketImportError(BaseModel):
+    line: int
+    detail: str
+
+class TicketImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TicketImportError] = []  # first errors only, see errors_truncated
+    errors_truncated: bool = False
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
@@ -24,3 +24,17 @@ class WatcherResponse(WatcherBase):
             datetime: lambda v: v.isoformat() if v else None
         }
     }
+
+class WatcherBulkUpdate(BaseModel):
+    user_ids: List[UUID]
+    # Tickets are selected by id, by column, or both
+    ticket_ids: List[UUID] = []
+    column_id: Optional[UUID] = None
+
+class WatcherRef(BaseModel):
+    ticket_id: UUID
+    user_id: UUID
+
+class WatcherBulkResult(BaseModel):
+    count: int
+    watchers: List[WatcherRef]
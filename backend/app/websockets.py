@@ -1,38 +1,366 @@
-from typing import Dict, List
-from fastapi import WebSocket
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from fastapi import WebSocket, WebSocketDisconnect
+from app.core.config import settings
+from app.core.encoding import JSON_SUBPROTOCOL, MSGPACK_SUBPROTOCOL, dumps_json, packb, unpackb
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+HANDSHAKE_SECONDS = registry.histogram(
+    "boardly_ws_handshake_seconds", "WebSocket handshake latency by phase (auth, db, accept, total)", ["endpoint", "phase"]
+)
+BROADCAST_SECONDS = registry.histogram(
+    "boardly_broadcast_seconds", "Time to fan one board event out to every recipient"
+)
+BROADCAST_RECIPIENTS = registry.histogram(
+    "boardly_broadcast_recipients", "WebSocket recipients per board event",
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000),
+)
+SEND_SECONDS = registry.histogram(
+    "boardly_ws_send_seconds", "Latency of a single WebSocket frame send", ["encoding"]
+)
+SEND_FAILURES = registry.counter(
+    "boardly_ws_send_failures_total", "WebSocket sends that raised"
+)
+SSE_DROPPED = registry.counter(
+    "boardly_sse_events_dropped_total", "SSE events discarded because a client queue was full"
+)
+
+BOARD_CHANNEL = "board"
+TICKET_CHANNEL = "ticket"
+USER_CHANNEL = "user"
+
+def channel_name(kind: str, id: str) -> str:
+    return f"{kind}:{id}"
+
+RESYNC_EVENT = {"type": "RESYNC"}
+# Board event telling that event's user_id lost access to the board
+MEMBER_REMOVED = "MEMBER_REMOVED"
+
+class EventStream:
+    """
+    A bounded queue of (event_id, message) pairs for one SSE client. When the client
+    falls too far behind, pending events are discarded and it is told to resync instead.
+    """
+    def __init__(self, board_id: str):
+        self.board_id = board_id
+        self.queue: "asyncio.Queue[Tuple[Optional[int], dict]]" = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
+
+    def push(self, event_id: Optional[int], message: dict):
+        try:
+            self.queue.put_nowait((event_id, message))
+        except asyncio.QueueFull:
+            SSE_DROPPED.inc(self.queue.qsize() + 1)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait((None, RESYNC_EVENT))
+
+    async def get(self) -> Tuple[Optional[int], dict]:
+        return await self.queue.get()
 
 class ConnectionManager:
     def __init__(self):
-        # active_connections: {board_id: [WebSocket, ...]}
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-
-    async def connect(self, websocket: WebSocket, board_id: str):
-        await websocket.accept()
-        print(f"WebSocket connected to board: {board_id}")
-        if board_id not in self.active_connections:
-            self.active_connections[board_id] = []
-        self.active_connections[board_id].append(websocket)
-
-    def disconnect(self, websocket: WebSocket, board_id: str):
-        print(f"WebSocket disconnected from board: {board_id}")
-        if board_id in self.active_connections:
-            if websocket in self.active_connections[board_id]:
-                self.active_connections[board_id].remove(websocket)
-            if not self.active_connections[board_id]:
-                del self.active_connections[board_id]
+        # channels: {"board:<id>" | "ticket:<id>" | "user:<id>": {WebSocket, ...}}
+        self.channels: Dict[str, Set[WebSocket]] = {}
+        # subscriptions: {WebSocket: {channel, ...}}, used to clean up a socket in one pass
+        self.subscriptions: Dict[WebSocket, Set[str]] = {}
+        # msgpack_sockets: sockets that negotiated the MessagePack subprotocol, everyone else speaks JSON
+        self.msgpack_sockets: Set[WebSocket] = set()
+        # channel_boards: {"ticket:<id>": board_id}, so losing a board also drops its ticket channels
+        self.channel_boards: Dict[str, str] = {}
+        # socket_users: {WebSocket: user_id}
+        self.socket_users: Dict[WebSocket, str] = {}
+        # presence: {board_id: {user_id: number of that user's sockets subscribed to the board}}
+        self.presence: Dict[str, Dict[str, int]] = {}
+        # pending_presence: {board_id: {user_id: +1 joined / -1 left}} waiting for the next coalesced frame
+        self.pending_presence: Dict[str, Dict[str, int]] = {}
+        # presence_flushes: {board_id: TimerHandle until the window ends, then the flush Task}.
+        # Held here because the event loop only keeps weak references to tasks.
+        self.presence_flushes: Dict[str, Union[asyncio.TimerHandle, "asyncio.Task[None]"]] = {}
+        # event_backlog: {board_id: deque([(event_id, message), ...])}, most recently active board last
+        self.event_backlog: "OrderedDict[str, Deque[Tuple[int, dict]]]" = OrderedDict()
+        # last_event_ids: {board_id: event_id}. Seeded from the clock so ids keep increasing across restarts.
+        self.last_event_ids: Dict[str, int] = {}
+        # event_streams: {board_id: {EventStream, ...}} for SSE clients
+        self.event_streams: Dict[str, Set[EventStream]] = {}
+
+    async def connect(self, websocket: WebSocket, board_id: Optional[str] = None, user_id: Optional[str] = None):
+        requested = websocket.scope.get("subprotocols") or []
+        if MSGPACK_SUBPROTOCOL in requested:
+            await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+            self.msgpack_sockets.add(websocket)
+        else:
+            await websocket.accept(subprotocol=JSON_SUBPROTOCOL if JSON_SUBPROTOCOL in requested else None)
+        self.subscriptions.setdefault(websocket, set())
+        if user_id is not None:
+            self.socket_users[websocket] = str(user_id)
+        logger.debug("ws.connect user=%s board=%s encoding=%s", user_id, board_id,
+                     "msgpack" if websocket in self.msgpack_sockets else "json")
+        if board_id is not None:
+            self.subscribe(websocket, channel_name(BOARD_CHANNEL, board_id))
+
+    def disconnect(self, websocket: WebSocket, board_id: Optional[str] = None):
+        for channel in self.subscriptions.pop(websocket, set()):
+            self._remove_from_channel(websocket, channel)
+        self.msgpack_sockets.discard(websocket)
+        user_id = self.socket_users.pop(websocket, None)
+        logger.debug("ws.disconnect user=%s", user_id)
+
+    def subscribe(self, websocket: WebSocket, channel: str, board_id: Optional[str] = None):
+        subscriptions = self.subscriptions.setdefault(websocket, set())
+        if channel in subscriptions:
+            return
+        if board_id is not None and not channel.startswith(BOARD_CHANNEL + ":"):
+            self.channel_boards[channel] = str(board_id)
+        self.channels.setdefault(channel, set()).add(websocket)
+        subscriptions.add(channel)
+        self._track_presence(websocket, channel, 1)
+
+    def unsubscribe(self, websocket: WebSocket, channel: str):
+        subscriptions = self.subscriptions.get(websocket, set())
+        if channel not in subscriptions:
+            return
+        subscriptions.discard(channel)
+        self._remove_from_channel(websocket, channel)
+
+    def is_subscribed(self, websocket: WebSocket, channel: str) -> bool:
+        return channel in self.subscriptions.get(websocket, ())
+
+    def _remove_from_channel(self, websocket: WebSocket, channel: str):
+        self._track_presence(websocket, channel, -1)
+        sockets = self.channels.get(channel)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self.channels[channel]
+            self.channel_boards.pop(channel, None)
+
+    def revoke_board(self, user_id: str, board_id: str):
+        """
+        Unsubscribe every socket of the user from the board and from its tickets' channels.
+        """
+        board_channel = channel_name(BOARD_CHANNEL, board_id)
+        for websocket, socket_user in list(self.socket_users.items()):
+            if socket_user != user_id:
+                continue
+            for channel in list(self.subscriptions.get(websocket, ())):
+                if channel == board_channel or self.channel_boards.get(channel) == board_id:
+                    self.unsubscribe(websocket, channel)
+
+    def _track_presence(self, websocket: WebSocket, channel: str, delta: int):
+        """
+        Count a user's sockets per board. Only the first join and the last leave of a user
+        change presence; those changes are queued and flushed as one diff per window.
+        """
+        user_id = self.socket_users.get(websocket)
+        kind, _, board_id = channel.partition(":")
+        if user_id is None or kind != BOARD_CHANNEL:
+            return
+        users = self.presence.setdefault(board_id, {})
+        count = users.get(user_id, 0) + delta
+        if count > 0:
+            users[user_id] = count
+        else:
+            users.pop(user_id, None)
+            if not users:
+                del self.presence[board_id]
+        if (delta > 0 and count == 1) or (delta < 0 and count == 0):
+            pending = self.pending_presence.get(board_id)
+            if pending is None:
+                # Only queue changes that a scheduled flush will deliver
+                if not self._schedule_presence_flush(board_id):
+                    return
+                pending = self.pending_presence[board_id] = {}
+            net = pending.get(user_id, 0) + delta
+            if net:
+                pending[user_id] = net
+            else:
+                pending.pop(user_id, None)  # joined and left within the window
+
+    def _schedule_presence_flush(self, board_id: str) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False  # no loop to send from, e.g. during shutdown
+        self.presence_flushes[board_id] = loop.call_later(
+            settings.PRESENCE_COALESCE_SECONDS, self._start_presence_flush, board_id
+        )
+        return True
+
+    def _start_presence_flush(self, board_id: str):
+        task = asyncio.ensure_future(self._flush_presence(board_id))
+        self.presence_flushes[board_id] = task
+
+        def done(_):
+            # A newer window may have started while this flush was sending
+            if self.presence_flushes.get(board_id) is task:
+                del self.presence_flushes[board_id]
+        task.add_done_callback(done)
+
+    async def _flush_presence(self, board_id: str):
+        pending = self.pending_presence.pop(board_id, None)
+        if not pending:
+            return
+        targets = self.channels.get(channel_name(BOARD_CHANNEL, board_id))
+        if targets:
+            await self._send(set(targets), {
+                "type": "PRESENCE_DIFF",
+                "board_id": board_id,
+                "joined": [user_id for user_id, net in pending.items() if net > 0],
+                "left": [user_id for user_id, net in pending.items() if net < 0],
+            })
+
+    def presence_snapshot(self, board_id: str) -> dict:
+        return {"type": "PRESENCE", "board_id": str(board_id), "user_ids": list(self.presence.get(str(board_id), ()))}
 
     async def broadcast_to_board(self, board_id: str, message: dict):
-        print(f"Broadcasting to board {board_id}: {message}")
-        if board_id in self.active_connections:
-            print(f"Found {len(self.active_connections[board_id])} active connections")
-            for connection in self.active_connections[board_id]:
-                try:
-                    await connection.send_json(message)
-                    print(f"Sent message to connection")
-                except Exception as e:
-                    print(f"Error sending message: {e}")
-                    pass
+        """
+        Send a board event to everyone subscribed to the board, plus anyone
+        following the event's ticket from another board's context.
+        A socket subscribed through several channels receives the event once.
+        """
+        start = time.perf_counter()
+        board_id = str(board_id)
+        message = {**message, "board_id": board_id}
+        event_id = self._record_event(board_id, message)
+        for stream in self.event_streams.get(board_id, ()):
+            stream.push(event_id, message)
+        targets = set(self.channels.get(channel_name(BOARD_CHANNEL, str(board_id)), ()))
+        ticket_id = message.get("ticket_id")
+        if ticket_id:
+            targets.update(self.channels.get(channel_name(TICKET_CHANNEL, str(ticket_id)), ()))
+        if targets:
+            await self._send(targets, message)
+        if message.get("type") == MEMBER_REMOVED and message.get("user_id"):
+            # After sending, so the removed user's client is told why events stop
+            self.revoke_board(str(message["user_id"]), board_id)
+        BROADCAST_RECIPIENTS.observe(len(targets))
+        BROADCAST_SECONDS.observe(time.perf_counter() - start)
+        logger.debug("ws.broadcast board=%s type=%s recipients=%d", board_id, message.get("type"), len(targets))
+
+    def _record_event(self, board_id: str, message: dict) -> int:
+        event_id = max(self.last_event_ids.get(board_id, 0) + 1, int(time.time() * 1000))
+        self.last_event_ids[board_id] = event_id
+        backlog = self.event_backlog.get(board_id)
+        if backlog is None:
+            backlog = self.event_backlog[board_id] = deque(maxlen=settings.SSE_BACKLOG_SIZE)
+            while len(self.event_backlog) > settings.SSE_BACKLOG_BOARDS:
+                evicted, _ = self.event_backlog.popitem(last=False)
+                self.last_event_ids.pop(evicted, None)
         else:
-            print(f"No active connections for board {board_id}")
+            self.event_backlog.move_to_end(board_id)
+        backlog.append((event_id, message))
+        return event_id
+
+    def events_since(self, board_id: str, last_event_id: int) -> Optional[List[Tuple[int, dict]]]:
+        """
+        Events recorded for the board after last_event_id, oldest first.
+        Returns None when the backlog no longer covers that point and the client must resync.
+        """
+        backlog = self.event_backlog.get(str(board_id))
+        # The client must have seen an event still in the backlog, otherwise something may have been evicted
+        # (or the id comes from a previous process) and replaying would silently skip events.
+        if not backlog or not backlog[0][0] <= last_event_id <= backlog[-1][0]:
+            return None
+        return [(event_id, message) for event_id, message in backlog if event_id > last_event_id]
+
+    def open_event_stream(self, board_id: str) -> EventStream:
+        stream = EventStream(str(board_id))
+        self.event_streams.setdefault(stream.board_id, set()).add(stream)
+        return stream
+
+    def close_event_stream(self, stream: EventStream):
+        streams = self.event_streams.get(stream.board_id)
+        if streams is None:
+            return
+        streams.discard(stream)
+        if not streams:
+            del self.event_streams[stream.board_id]
+
+    async def send_to_user(self, user_id: str, message: dict):
+        """
+        Send a personal notification to every socket the user has open.
+        """
+        targets = self.channels.get(channel_name(USER_CHANNEL, str(user_id)))
+        if targets:
+            await self._send(set(targets), message)
+
+    async def send(self, websocket: WebSocket, message: dict):
+        """
+        Send a single frame in the encoding the socket negotiated.
+        """
+        if websocket in self.msgpack_sockets:
+            await websocket.send_bytes(packb(message))
+        else:
+            await websocket.send_text(dumps_json(message))
+
+    async def receive(self, websocket: WebSocket):
+        """
+        Receive and decode one client frame. Raises ValueError for undecodable frames.
+        """
+        data = await websocket.receive()
+        if data["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(data.get("code", 1000))
+        try:
+            if data.get("bytes") is not None:
+                return unpackb(data["bytes"])
+            return json.loads(data.get("text") or "")
+        except Exception as e:
+            raise ValueError("Invalid frame") from e
+
+    async def _send(self, targets: Iterable[WebSocket], message: dict):
+        # Encode once per wire format rather than once per socket
+        text: Optional[str] = None
+        binary: Optional[bytes] = None
+        for connection in targets:
+            start = time.perf_counter()
+            try:
+                if connection in self.msgpack_sockets:
+                    if binary is None:
+                        binary = packb(message)
+                    await connection.send_bytes(binary)
+                    SEND_SECONDS.observe(time.perf_counter() - start, encoding="msgpack")
+                else:
+                    if text is None:
+                        text = dumps_json(message)
+                    await connection.send_text(text)
+                    SEND_SECONDS.observe(time.perf_counter() - start, encoding="json")
+            except Exception as e:
+                SEND_FAILURES.inc()
+                logger.warning("ws.send_failed user=%s type=%s error=%r",
+                               self.socket_users.get(connection), message.get("type"), e)
 
 manager = ConnectionManager()
+
+registry.gauge(
+    "boardly_ws_connections", "Open WebSocket connections",
+    lambda: [((), len(manager.subscriptions))],
+)
+registry.gauge(
+    "boardly_ws_board_connections", "WebSocket connections subscribed to each board",
+    lambda: [((channel.partition(":")[2],), len(sockets))
+             for channel, sockets in list(manager.channels.items()) if channel.startswith(BOARD_CHANNEL + ":")],
+    ["board_id"],
+)
+registry.gauge(
+    "boardly_sse_streams", "Open Server-Sent Events streams",
+    lambda: [((), sum(len(streams) for streams in list(manager.event_streams.values())))],
+)
+def _sse_queue_depths():
+    depths = [stream.queue.qsize() for streams in list(manager.event_streams.values()) for stream in streams]
+    return [(("total",), sum(depths)), (("max",), max(depths, default=0))]
+
+registry.gauge(
+    "boardly_sse_queue_depth", "Events waiting in SSE client queues (total and deepest queue)",
+    _sse_queue_depths, ["stat"],
+)
+registry.gauge(
+    "boardly_presence_pending_boards", "Boards with presence changes waiting for the next coalesced frame",
+    lambda: [((), len(manager.pending_presence))],
+)
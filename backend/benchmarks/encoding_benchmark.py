@@ -0,0 +1,133 @@
+"""
+Compare JSON and MessagePack payloads for a large board snapshot.
+
+Reports bytes on the wire (raw and after permessage-deflate style compression)
+and encode time for the GET /boards/{id} response in both formats.
+
+Usage (from the backend directory):
+
+    python benchmarks/encoding_benchmark.py --columns 8 --tickets 2000 --json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+import zlib
+from datetime import timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from app import schemas  # noqa: E402
+from app.core.encoding import dumps_json, packb  # noqa: E402
+from app.core.utils import utcnow  # noqa: E402
+
+def build_board(columns: int, tickets: int, users: int) -> schemas.Board:
+    now = utcnow()
+    people = []
+    for i in range(users):
+        user_id = uuid.uuid4()
+        people.append({
+            "id": user_id,
+            "email": f"user{i}@example.com",
+            "full_name": f"User Number {i}",
+            "display_name": f"user{i}",
+            "timezone": "Europe/Berlin",
+            "is_active": True,
+            "avatar_url": f"https://avatars.example.com/{user_id}.png",
+            "created_at": now - timedelta(days=300),
+            "updated_at": now - timedelta(days=3),
+            "preferences": {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "theme_preference": "system",
+                "email_notifications_enabled": False,
+                "in_app_notifications_enabled": True,
+                "created_at": now - timedelta(days=300),
+                "updated_at": now - timedelta(days=30),
+            },
+        })
+
+    board_id = uuid.uuid4()
+    board_columns = [{"id": uuid.uuid4(), "board_id": board_id, "name": f"Column {i}", "order": i, "tickets": []}
+                     for i in range(columns)]
+    rng = random.Random(42)
+    for i in range(tickets):
+        column = board_columns[i % columns]
+        assignee = rng.choice(people) if rng.random() < 0.8 else None
+        reporter = rng.choice(people)
+        created = now - timedelta(minutes=rng.randint(0, 500_000))
+        column["tickets"].append({
+            "id": uuid.uuid4(),
+            "title": f"Ticket {i}: implement the thing that was discussed",
+            "description": "As a user I want to do something useful so that I get value. " * rng.randint(0, 4) or None,
+            "priority": rng.choice(["low", "medium", "high"]),
+            "board_id": board_id,
+            "column_id": column["id"],
+            "assignee_id": assignee["id"] if assignee else None,
+            "assignee": assignee,
+            "created_by_id": reporter["id"],
+            "reporter": reporter,
+            "created_at": created,
+            "updated_at": created + timedelta(minutes=rng.randint(0, 10_000)),
+        })
+
+    return schemas.Board.model_validate({
+        "id": board_id,
+        "name": "Benchmark board",
+        "description": "A board sized like a long-running team project",
+        "owner_id": people[0]["id"],
+        "created_at": now - timedelta(days=365),
+        "updated_at": now,
+        "columns": board_columns,
+    })
+
+def measure(encode, repeat: int) -> dict:
+    timings = []
+    payload = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = encode()
+        timings.append((time.perf_counter() - start) * 1000)
+    if isinstance(payload, str):
+        payload = payload.encode()
+    # permessage-deflate uses raw DEFLATE (negative wbits)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    deflated = compressor.compress(payload) + compressor.flush()
+    return {
+        "bytes": len(payload),
+        "deflate_bytes": len(deflated),
+        "encode_ms_median": round(statistics.median(timings), 3),
+        "encode_ms_min": round(min(timings), 3),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--tickets", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    board = build_board(args.columns, args.tickets, args.users)
+    # Both paths include model serialization, as the endpoint does per request
+    results = {
+        "board": {"columns": args.columns, "tickets": args.tickets, "users": args.users},
+        "json": measure(lambda: dumps_json(board.model_dump(mode="json")), args.repeat),
+        "msgpack": measure(lambda: packb(board.model_dump()), args.repeat),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"Board: {args.columns} columns, {args.tickets} tickets, {args.users} users")
+    print(f"{'format':<10}{'bytes':>12}{'deflated':>12}{'median ms':>12}{'min ms':>10}")
+    for name in ("json", "msgpack"):
+        r = results[name]
+        print(f"{name:<10}{r['bytes']:>12}{r['deflate_bytes']:>12}{r['encode_ms_median']:>12}{r['encode_ms_min']:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Measure how the realtime layer behaves with many board WebSockets.
+
+Starts the API with uvicorn against a local PostgreSQL (already migrated with
+`alembic upgrade head`), signs up benchmark users, creates boards, opens N
+authenticated board connections, then drives ticket updates through the REST
+endpoints and reports:
+
+- end-to-end event latency (request sent -> TICKET_UPDATED received) percentiles
+- fan-out throughput (event deliveries per second across all sockets)
+- server memory per connection (RSS growth while connecting / connections)
+- server CPU (cores used during the connect and mutation phases)
+
+The client runs in a single process, so its own CPU time is reported too: when it
+is close to one core the numbers measure the client rather than the server.
+
+Usage (from the backend directory; needs `websockets` and `httpx`):
+
+    python benchmarks/ws_scale.py --connections 5000 --boards 50 --mutations 500 --json
+
+Raise the open file limit (`ulimit -n`) above the connection count first.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+try:
+    import httpx
+    import websockets
+except ImportError:
+    sys.exit("ws_scale.py needs the 'websockets' and 'httpx' packages: pip install websockets httpx")
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+def read_rss_bytes(pid: int) -> int:
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+def read_cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        # comm may contain spaces; fields after the closing paren are fixed
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+def percentiles(samples: list) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(pick(0.50) * 1000, 3),
+        "p90_ms": round(pick(0.90) * 1000, 3),
+        "p99_ms": round(pick(0.99) * 1000, 3),
+        "p999_ms": round(pick(0.999) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+class Server:
+    """
+    The API under test, run as a uvicorn subprocess so its RSS and CPU can be read from /proc.
+    """
+    def __init__(self, port: int, database_url: str, deflate: bool):
+        self.port = port
+        self.database_url = database_url
+        self.deflate = deflate
+        self.process = None
+
+    def start(self):
+        env = dict(os.environ, LOG_LEVEL="WARNING")
+        if self.database_url:
+            env["DATABASE_URL"] = self.database_url
+        command = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(self.port),
+            "--log-level", "warning", "--no-access-log",
+            "--ws", "websockets", "--ws-per-message-deflate", str(self.deflate).lower(),
+        ]
+        self.process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+
+    async def wait_ready(self, client: httpx.AsyncClient, timeout: float = 30.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {self.process.returncode}")
+            try:
+                if (await client.get("/metrics")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+        raise RuntimeError("uvicorn did not become ready")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+class Bench:
+    def __init__(self, args):
+        self.args = args
+        self.base_url = f"http://127.0.0.1:{args.port}"
+        self.ws_url = f"ws://127.0.0.1:{args.port}/api/v1/ws"
+        # pending: {board_id: (ticket_id, sent_at, deliveries left, done event)}
+        self.pending = {}
+        self.latencies = []
+        self.deliveries = 0
+        self.handshake_seconds = []
+        self.sockets = []
+
+    async def setup(self, client: httpx.AsyncClient):
+        run = uuid.uuid4().hex[:8]
+        tokens = []
+        emails = []
+        for i in range(self.args.users):
+            email = f"bench-{run}-{i}@example.com"
+            r = await client.post("/api/v1/users/", json={"email": email, "password": "bench-password", "full_name": f"Bench {i}"})
+            r.raise_for_status()
+            r = await client.post("/api/v1/login/access-token", data={"username": email, "password": "bench-password"})
+            r.raise_for_status()
+            tokens.append(r.json()["access_token"])
+            emails.append(email)
+
+        owner = {"Authorization": f"Bearer {tokens[0]}"}
+        boards = []
+        for i in range(self.args.boards):
+            r = await client.post("/api/v1/boards/", json={"name": f"Bench board {i}"}, headers=owner)
+            r.raise_for_status()
+            board = r.json()
+            for email in emails[1:]:
+                (await client.post(f"/api/v1/boards/{board['id']}/members", json={"email": email}, headers=owner)).raise_for_status()
+            r = await client.post("/api/v1/tickets/", headers=owner, json={
+                "title": "Bench ticket",
+                "board_id": board["id"],
+                "status_column_id": board["columns"][0]["id"],
+            })
+            r.raise_for_status()
+            boards.append({"id": board["id"], "ticket_id": r.json()["id"], "sockets": 0})
+        return tokens, boards
+
+    async def reader(self, ws, board_id: str):
+        async for raw in ws:
+            received = time.perf_counter()
+            message = json.loads(raw)
+            if message.get("type") != "TICKET_UPDATED":
+                continue
+            pending = self.pending.get(board_id)
+            if not pending or pending[0] != message.get("ticket_id"):
+                continue
+            ticket_id, sent_at, left, done = pending
+            self.latencies.append(received - sent_at)
+            self.deliveries += 1
+            left -= 1
+            self.pending[board_id] = (ticket_id, sent_at, left, done)
+            if left == 0:
+                done.set()
+
+    async def connect(self, tokens: list, boards: list):
+        limit = asyncio.Semaphore(self.args.connect_concurrency)
+
+        async def open_one(i: int):
+            board = boards[i % len(boards)]
+            token = tokens[i % len(tokens)]
+            async with limit:
+                start = time.perf_counter()
+                ws = await websockets.connect(
+                    f"{self.ws_url}/{board['id']}?token={token}",
+                    compression="deflate" if self.args.deflate else None,
+                    max_queue=None, open_timeout=60,
+                )
+                self.handshake_seconds.append(time.perf_counter() - start)
+            board["sockets"] += 1
+            self.sockets.append((ws, asyncio.create_task(self.reader(ws, board["id"]))))
+
+        results = await asyncio.gather(*(open_one(i) for i in range(self.args.connections)), return_exceptions=True)
+        return sum(1 for r in results if isinstance(r, BaseException))
+
+    async def mutate(self, client: httpx.AsyncClient, token: str, boards: list):
+        headers = {"Authorization": f"Bearer {token}"}
+        timeouts = 0
+        per_board = self.args.mutations // len(boards) or 1
+
+        async def drive(board: dict):
+            nonlocal timeouts
+            for seq in range(per_board):
+                done = asyncio.Event()
+                self.pending[board["id"]] = (board["ticket_id"], time.perf_counter(), board["sockets"], done)
+                r = await client.put(f"/api/v1/tickets/{board['ticket_id']}", json={"title": f"Bench ticket {seq}"}, headers=headers)
+                r.raise_for_status()
+                if board["sockets"]:
+                    try:
+                        await asyncio.wait_for(done.wait(), timeout=self.args.event_timeout)
+                    except asyncio.TimeoutError:
+                        timeouts += 1
+                if self.args.interval:
+                    await asyncio.sleep(self.args.interval)
+
+        await asyncio.gather(*(drive(board) for board in boards))
+        return per_board * len(boards), timeouts
+
+    async def run(self) -> dict:
+        args = self.args
+        server = Server(args.port, args.database_url, args.deflate)
+        server.start()
+        try:
+            limits = httpx.Limits(max_connections=args.http_concurrency)
+            async with httpx.AsyncClient(base_url=self.base_url, timeout=60, limits=limits) as client:
+                await server.wait_ready(client)
+                tokens, boards = await self.setup(client)
+                pid = server.process.pid
+
+                rss_before = read_rss_bytes(pid)
+                cpu_before = read_cpu_seconds(pid)
+                start = time.perf_counter()
+                failed = await self.connect(tokens, boards)
+                connect_wall = time.perf_counter() - start
+                connected = len(self.sockets)
+                # Let presence frames for the joins drain before measuring
+                await asyncio.sleep(args.settle)
+                rss_connected = read_rss_bytes(pid)
+                cpu_connected = read_cpu_seconds(pid)
+
+                client_cpu_before = resource.getrusage(resource.RUSAGE_SELF)
+                start = time.perf_counter()
+                mutations, timeouts = await self.mutate(client, tokens[0], boards)
+                mutate_wall = time.perf_counter() - start
+                client_cpu_after = resource.getrusage(resource.RUSAGE_SELF)
+                cpu_mutated = read_cpu_seconds(pid)
+                rss_after = read_rss_bytes(pid)
+
+                for ws, task in self.sockets:
+                    task.cancel()
+                await asyncio.gather(*(ws.close() for ws, _ in self.sockets), return_exceptions=True)
+        finally:
+            server.stop()
+
+        client_cpu = (client_cpu_after.ru_utime + client_cpu_after.ru_stime) - (client_cpu_before.ru_utime + client_cpu_before.ru_stime)
+        return {
+            "config": {
+                "connections": args.connections,
+                "boards": args.boards,
+                "users": args.users,
+                "mutations": mutations,
+                "deflate": args.deflate,
+            },
+            "connect": {
+                "connected": connected,
+                "failed": failed,
+                "wall_seconds": round(connect_wall, 3),
+                "connections_per_second": round(connected / connect_wall, 1) if connect_wall else None,
+                "handshake": percentiles(self.handshake_seconds),
+                "server_cpu_cores": round((cpu_connected - cpu_before) / connect_wall, 3) if connect_wall else None,
+            },
+            "memory": {
+                "server_rss_idle_bytes": rss_before,
+                "server_rss_connected_bytes": rss_connected,
+                "server_rss_after_bytes": rss_after,
+                "bytes_per_connection": round((rss_connected - rss_before) / connected) if connected else None,
+            },
+            "fanout": {
+                "deliveries": self.deliveries,
+                "expected_deliveries": mutations // len(boards) * sum(b["sockets"] for b in boards),
+                "timeouts": timeouts,
+                "wall_seconds": round(mutate_wall, 3),
+                "mutations_per_second": round(mutations / mutate_wall, 1) if mutate_wall else None,
+                "deliveries_per_second": round(self.deliveries / mutate_wall, 1) if mutate_wall else None,
+                "latency": percentiles(self.latencies),
+                "server_cpu_cores": round((cpu_mutated - cpu_connected) / mutate_wall, 3) if mutate_wall else None,
+                "client_cpu_cores": round(client_cpu / mutate_wall, 3) if mutate_wall else None,
+            },
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--users", type=int, default=10, help="sockets are spread over these users round-robin")
+    parser.add_argument("--mutations", type=int, default=200, help="ticket updates in total, spread evenly over the boards")
+    parser.add_argument("--interval", type=float, default=0.0, help="pause between updates on the same board, in seconds")
+    parser.add_argument("--event-timeout", type=float, default=10.0, help="give up waiting for an update's deliveries after this long")
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--http-concurrency", type=int, default=100)
+    parser.add_argument("--settle", type=float, default=2.0, help="seconds to wait after connecting before measuring")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"), help="defaults to the app settings")
+    parser.add_argument("--deflate", action="store_true", help="negotiate permessage-deflate")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.connections + 100:
+        sys.exit(f"open file limit is {soft}; raise it with `ulimit -n` to at least {args.connections + 100}")
+
+    results = asyncio.run(Bench(args).run())
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    connect, memory, fanout = results["connect"], results["memory"], results["fanout"]
+    print(f"Connections: {connect['connected']} open, {connect['failed']} failed, {connect['connections_per_second']}/s")
+    print(f"Handshake p50/p99: {connect['handshake'].get('p50_ms')} / {connect['handshake'].get('p99_ms')} ms")
+    print(f"Server memory: {memory['bytes_per_connection']} bytes per connection")
+    print(f"Fan-out: {fanout['deliveries']}/{fanout['expected_deliveries']} deliveries, {fanout['deliveries_per_second']}/s, {fanout['timeouts']} timeouts")
+    latency = fanout["latency"]
+    print(f"Event latency p50/p90/p99/max: {latency.get('p50_ms')} / {latency.get('p90_ms')} / {latency.get('p99_ms')} / {latency.get('max_ms')} ms")
+    print(f"CPU cores: server {fanout['server_cpu_cores']}, client {fanout['client_cpu_cores']}")
+
+if __name__ == "__main__":
+    main()
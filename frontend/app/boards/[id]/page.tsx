@@ -40,6 +40,7 @@ import { BoardSettingsDialog } from "@/components/board/BoardSettingsDialog"
 import { ConfirmationDialog } from "@/components/ui/confirmation-dialog"
 import { toast } from "sonner"
 import { useWebSocket } from "@/hooks/useWebSocket"
+import { applyTextPatch } from "@/lib/textpatch"
 
 export default function BoardDetailPage() {
     const params = useParams()
@@ -61,13 +62,21 @@ export default function BoardDetailPage() {
     // Real-time synchronization
     useWebSocket(boardId, (message) => {
         // We handle updates silently as requested
-        if (message.type === 'TICKET_CREATED' || message.type === 'TICKET_UPDATED' || message.type === 'TICKET_DELETED') {
+        if (message.type === 'TICKET_UPDATED' && message.patch) {
+            // Apply description edits to an open ticket instead of refetching it
+            queryClient.setQueryData(['ticket', message.ticket_id], (ticket: any) =>
+                ticket && ticket.version === message.patch.base_version
+                    ? { ...ticket, description: applyTextPatch(ticket.description || "", message.patch.ops), version: message.version }
+                    : ticket
+            )
+        }
+        if (message.type === 'TICKET_CREATED' || message.type === 'TICKET_UPDATED' || message.type === 'TICKET_DELETED' || message.type === 'TICKET_RESTORED' || message.type === 'TICKET_MOVED' || message.type === 'COLUMN_REBALANCED' || message.type === 'TICKETS_BULK_UPDATED' || (message.type === 'TICKETS_IMPORTED' && message.done)) {
             queryClient.invalidateQueries({ queryKey: ['board', boardId] })
         }
         if (message.type === 'COMMENT_ADDED' || message.type === 'COMMENT_UPDATED' || message.type === 'COMMENT_DELETED') {
             queryClient.invalidateQueries({ queryKey: ['ticket', message.ticket_id] })
         }
-        if (message.type === 'BOARD_UPDATED') {
+        if (message.type === 'BOARD_UPDATED' || message.type === 'COLUMNS_REORDERED' || message.type === 'COLUMN_DELETED' || message.type === 'MEMBER_REMOVED') {
             queryClient.invalidateQueries({ queryKey: ['board', boardId] })
         }
         if (message.type === 'BOARD_DELETED') {
@@ -249,9 +249,26 @@ export function BoardSettingsDialog({ boardId, isOpen, onClose }: BoardSettingsD
         }
     })
 
+    const reorderColumnsMutation = useMutation({
+        mutationFn: async (columnIds: string[]) => {
+            return await api.put(`/boards/${boardId}/columns/order`, { column_ids: columnIds })
+        },
+        onSuccess: () => {
+            queryClient.invalidateQueries({ queryKey: ['board', boardId] })
+        },
+        onError: (error: any) => {
+            toast.error(`❌ ${error.response?.data?.detail || "Failed to reorder columns"}`)
+        }
+    })
+
     const deleteColumnMutation = useMutation({
         mutationFn: async (columnId: string) => {
-            return await api.delete(`/columns/${columnId}`)
+            // Tickets of the deleted column move to the column on its left (or right for the first one)
+            const index = localColumns.findIndex(c => c.id === columnId)
+            const target = localColumns[index - 1] ?? localColumns[index + 1]
+            return await api.delete(`/columns/${columnId}`, {
+                params: target ? { target_column_id: target.id } : undefined
+            })
         },
         onSuccess: () => {
             queryClient.invalidateQueries({ queryKey: ['board', boardId] })
@@ -275,12 +292,8 @@ export function BoardSettingsDialog({ boardId, isOpen, onClose }: BoardSettingsD
                 const newIndex = items.findIndex((item) => item.id === over.id)
                 const newItems = arrayMove(items, oldIndex, newIndex)
 
-                // Update order on backend
-                newItems.forEach((col, index) => {
-                    if (col.order !== index) {
-                        updateColumnMutation.mutate({ columnId: col.id, name: col.name, order: index })
-                    }
-                })
+                // Update order on backend, all columns in one request
+                reorderColumnsMutation.mutate(newItems.map((col) => col.id))
 
                 return newItems.map((col, index) => ({ ...col, order: index }))
             })
@@ -464,7 +477,7 @@ export function BoardSettingsDialog({ boardId, isOpen, onClose }: BoardSettingsD
                 open={columnToDelete !== null}
                 onOpenChange={(open) => !open && setColumnToDelete(null)}
                 title="Delete Column?"
-                description="Are you sure you want to delete this column? All tickets in this column will also be deleted. This action cannot be undone."
+                description="Are you sure you want to delete this column? Its tickets will be moved to the neighbouring column. This action cannot be undone."
                 variant="destructive"
                 actionLabel="Delete Column"
                 onConfirm={confirmDeleteColumn}
@@ -1,10 +1,10 @@
 "use client"
 
 import { useState } from "react"
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query"
+import { useInfiniteQuery, useMutation, useQueryClient } from "@tanstack/react-query"
 import { Send } from "lucide-react"
 import { toast } from "sonner"
-import { api } from "@/lib/api"
+import { api, getPage } from "@/lib/api"
 
 import { Button } from "@/components/ui/button"
 import { Textarea } from "@/components/ui/textarea"
@@ -14,6 +14,9 @@ import { Skeleton } from "@/components/ui/skeleton"
 import { CommentItem } from "./CommentItem"
 import { Comment, User } from "./board.types"
 
+// Comments shown when the ticket opens; earlier ones load on demand
+const COMMENTS_PAGE_SIZE = 20
+
 interface CommentSectionProps {
     ticketId: string
     currentUser: User | null
@@ -23,13 +26,19 @@ export function CommentSection({ ticketId, currentUser }: CommentSectionProps) {
     const queryClient = useQueryClient()
     const [newComment, setNewComment] = useState("")
 
-    const { data: comments, isLoading } = useQuery({
+    // Latest comments first, each page going further back (but oldest first within the page)
+    const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = useInfiniteQuery({
         queryKey: ['comments', ticketId],
-        queryFn: async () => {
-            const res = await api.get(`/tickets/${ticketId}/comments`)
-            return res.data as Comment[]
-        }
+        queryFn: ({ pageParam }) =>
+            getPage<Comment>(`/tickets/${ticketId}/comments`, {
+                latest: true,
+                limit: COMMENTS_PAGE_SIZE,
+                ...(pageParam ? { cursor: pageParam } : {}),
+            }),
+        initialPageParam: null as string | null,
+        getNextPageParam: (lastPage) => lastPage.nextCursor,
     })
+    const comments = data?.pages.slice().reverse().flatMap((page) => page.items)
 
     const createCommentMutation = useMutation({
         mutationFn: async (content: string) => {
@@ -74,11 +83,19 @@ export function CommentSection({ ticketId, currentUser }: CommentSectionProps) {
             <h3 className="font-semibold text-sm flex items-center gap-2">
                 Comments
                 <span className="text-xs bg-muted px-2 py-0.5 rounded-full text-muted-foreground">
-                    {comments?.length || 0}
+                    {comments?.length || 0}{hasNextPage && "+"}
                 </span>
             </h3>
 
             <div className="space-y-6">
+                {hasNextPage && (
+                    <div className="flex justify-center">
+                        <Button variant="ghost" size="sm" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+                            {isFetchingNextPage ? "Loading..." : "Show earlier comments"}
+                        </Button>
+                    </div>
+                )}
+
                 {comments?.map((comment) => (
                     <CommentItem
                         key={comment.id}
@@ -1,10 +1,11 @@
 "use client"
 
-import { useQuery } from "@tanstack/react-query"
+import { useInfiniteQuery } from "@tanstack/react-query"
 import { format } from "date-fns"
-import { api } from "@/lib/api"
+import { getPage } from "@/lib/api"
 import { TicketHistory, TicketActionType } from "./board.types"
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar"
+import { Button } from "@/components/ui/button"
 import { Skeleton } from "@/components/ui/skeleton"
 
 interface HistoryTabProps {
@@ -12,13 +13,15 @@ interface HistoryTabProps {
 }
 
 export function HistoryTab({ ticketId }: HistoryTabProps) {
-    const { data: history, isLoading } = useQuery({
+    // Newest first, one page at a time
+    const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = useInfiniteQuery({
         queryKey: ['ticket-history', ticketId],
-        queryFn: async () => {
-            const res = await api.get(`/tickets/${ticketId}/history`)
-            return res.data as TicketHistory[]
-        }
+        queryFn: ({ pageParam }) =>
+            getPage<TicketHistory>(`/tickets/${ticketId}/history`, pageParam ? { cursor: pageParam } : {}),
+        initialPageParam: null as string | null,
+        getNextPageParam: (lastPage) => lastPage.nextCursor,
     })
+    const history = data?.pages.flatMap((page) => page.items)
 
     if (isLoading) {
         return (
@@ -74,6 +77,13 @@ export function HistoryTab({ ticketId }: HistoryTabProps) {
                     </div>
                 ))}
             </div>
+            {hasNextPage && (
+                <div className="flex justify-center pb-4">
+                    <Button variant="ghost" size="sm" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+                        {isFetchingNextPage ? "Loading..." : "Show older"}
+                    </Button>
+                </div>
+            )}
         </div>
     )
 }
@@ -92,6 +102,8 @@ function formatActionText(record: TicketHistory): string {
             return "changed priority"
         case TicketActionType.TICKET_DELETED:
             return "deleted this ticket"
+        case TicketActionType.TICKET_RESTORED:
+            return "restored this ticket"
         case TicketActionType.COMMENT_ADDED:
             return "commented"
         case TicketActionType.COMMENT_EDITED:
@@ -45,11 +45,13 @@ export function KanbanBoard({ initialBoard }: KanbanBoardProps) {
         })
     )
 
-    // Mutation to update ticket status in backend
-    const updateTicketMutation = useMutation({
-        mutationFn: async (vars: { ticketId: string; status_column_id: string }) => {
-            return await api.put(`/tickets/${vars.ticketId}`, {
-                status_column_id: vars.status_column_id
+    // Mutation to persist a ticket's column and position in backend
+    const moveTicketMutation = useMutation({
+        mutationFn: async (vars: { ticketId: string; column_id: string; after_id: string | null; before_id: string | null }) => {
+            return await api.post(`/tickets/${vars.ticketId}/move`, {
+                column_id: vars.column_id,
+                after_id: vars.after_id,
+                before_id: vars.before_id
             })
         },
         onSuccess: () => {
@@ -59,6 +61,19 @@ export function KanbanBoard({ initialBoard }: KanbanBoardProps) {
     })
 
 
+    // Mutation to persist the column order in backend
+    const reorderColumnsMutation = useMutation({
+        mutationFn: async (columnIds: string[]) => {
+            return await api.put(`/boards/${initialBoard.id}/columns/order`, {
+                column_ids: columnIds
+            })
+        },
+        onSuccess: () => {
+            queryClient.invalidateQueries({ queryKey: ['board', initialBoard.id] })
+        }
+    })
+
+
     function onDragStart(event: DragStartEvent) {
         if (event.active.data.current?.type === "Column") {
             setActiveColumn(event.active.data.current.column)
@@ -161,14 +176,13 @@ export function KanbanBoard({ initialBoard }: KanbanBoardProps) {
 
         // Column Sorting
         if (active.data.current?.type === "Column") {
-            // Note: Backend doesn't support column column ordering yet in this MVP phase update logic
-            // But we can update local state
             if (activeId !== overId) {
-                setColumns((columns) => {
-                    const activeIndex = columns.findIndex((col) => col.id === activeId)
-                    const overIndex = columns.findIndex((col) => col.id === overId)
-                    return arrayMove(columns, activeIndex, overIndex)
-                })
+                const activeIndex = columns.findIndex((col) => col.id === activeId)
+                const overIndex = columns.findIndex((col) => col.id === overId)
+                const newColumns = arrayMove(columns, activeIndex, overIndex)
+                setColumns(newColumns)
+                // The whole order is saved in one request
+                reorderColumnsMutation.mutate(newColumns.map((col) => col.id))
             }
             return
         }
@@ -188,30 +202,35 @@ export function KanbanBoard({ initialBoard }: KanbanBoardProps) {
             if (activeColumnIndex !== -1 && overColumnIndex !== -1) {
                 const overColumn = columns[overColumnIndex]
                 // activeTicket is set on DragStart and holds the original state
-                const originalColumnId = activeTicket?.status_column_id
-
-                if (activeTicket && originalColumnId !== overColumn.id) {
-                    // Changed Column - Call Backend
-                    // Also update the local ticket's status_column_id to prevent re-triggering if we were using it elsewhere
-                    // activeTicket.status_column_id = overColumn.id; // Not strictly needed as we reset activeTicket null right after
-
-                    updateTicketMutation.mutate({
-                        ticketId: activeTicket.id,
-                        status_column_id: overColumn.id
-                    })
-                }
-                else if (activeTicket && activeColumnIndex === overColumnIndex && activeId !== overId) {
-                    // Reordered in same column (Backend doesn't support order field on ticket yet)
-                    // Just local state update for now
+                const originalColumnId = activeTicket?.column_id ?? activeTicket?.status_column_id
+                const changedColumn = originalColumnId !== overColumn.id
+
+                if (!activeTicket || (!changedColumn && activeId === overId)) return
+
+                // Cross-column drops were already placed by DragOver; same-column ones are placed here
+                let tickets = overColumn.tickets
+                if (!changedColumn) {
+                    const oldIndex = tickets.findIndex(t => t.id === activeId)
+                    const newIndex = tickets.findIndex(t => t.id === overId)
+                    if (newIndex === -1 || oldIndex === newIndex) return
+                    tickets = arrayMove(tickets, oldIndex, newIndex)
                     setColumns((columns) => {
                         const newColumns = [...columns]
-                        const column = newColumns[activeColumnIndex]
-                        const oldIndex = column.tickets.findIndex(t => t.id === activeId)
-                        const newIndex = column.tickets.findIndex(t => t.id === overId)
-                        column.tickets = arrayMove(column.tickets, oldIndex, newIndex)
+                        newColumns[activeColumnIndex] = { ...newColumns[activeColumnIndex], tickets }
                         return newColumns
                     })
                 }
+
+                // The backend only needs one neighbour to compute the new rank
+                const index = tickets.findIndex(t => t.id === activeId)
+                const previous = index > 0 ? tickets[index - 1] : null
+                const next = index < tickets.length - 1 ? tickets[index + 1] : null
+                moveTicketMutation.mutate({
+                    ticketId: activeTicket.id,
+                    column_id: overColumn.id,
+                    after_id: previous ? previous.id : null,
+                    before_id: previous ? null : next ? next.id : null
+                })
             }
         }
     }
@@ -50,12 +50,26 @@ export function TicketActionsMenu({ ticket, className }: TicketActionsMenuProps)
             queryClient.invalidateQueries({ queryKey: ['board', targetBoardId] })
             setIsDeleteDialogOpen(false)
             toast.error("🗑️ Ticket deleted", {
-                description: "The ticket has been permanently removed",
-                style: { background: "hsl(var(--destructive))", color: "hsl(var(--destructive-foreground))" }
+                description: "The ticket has been removed from the board",
+                style: { background: "hsl(var(--destructive))", color: "hsl(var(--destructive-foreground))" },
+                action: {
+                    label: "Undo",
+                    onClick: () => restoreTicketMutation.mutate()
+                }
             })
         }
     })
 
+    const restoreTicketMutation = useMutation({
+        mutationFn: async () => {
+            return await api.post(`/tickets/${ticket.id}/restore`)
+        },
+        onSuccess: () => {
+            queryClient.invalidateQueries({ queryKey: ['board', ticket.board_id] })
+            toast.success("Ticket restored")
+        }
+    })
+
     return (
         <>
             <div className={className} onPointerDown={(e) => e.stopPropagation()} onClick={(e) => e.stopPropagation()}>
@@ -87,7 +101,7 @@ export function TicketActionsMenu({ ticket, className }: TicketActionsMenuProps)
                 open={isDeleteDialogOpen}
                 onOpenChange={setIsDeleteDialogOpen}
                 title="Delete Ticket?"
-                description="Are you sure you want to delete this ticket? This action cannot be undone."
+                description="Are you sure you want to delete this ticket?"
                 variant="destructive"
                 actionLabel="Delete"
                 onConfirm={() => deleteTicketMutation.mutate()}
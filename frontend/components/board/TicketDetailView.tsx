@@ -3,6 +3,7 @@
 import { useState, useEffect } from "react"
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query"
 import { api } from "@/lib/api"
+import { diffText } from "@/lib/textpatch"
 import { toast } from "sonner"
 import { Input } from "@/components/ui/input"
 import { Label } from "@/components/ui/label"
@@ -95,6 +96,18 @@ export function TicketDetailView({ ticketId, onClose }: TicketDetailViewProps) {
                 ...data,
                 assignee_id: data.assignee_id === "unassigned" ? null : data.assignee_id,
             }
+            const onlyDescriptionChanged = data.title === ticket.title
+                && data.priority === ticket.priority
+                && payload.assignee_id === (ticket.assignee_id || null)
+                && data.created_by_id === (ticket.reporter?.id || "")
+            if (onlyDescriptionChanged) {
+                // Send just the edited range of the description
+                const ops = diffText(ticket.description || "", data.description)
+                return await api.patch(`/tickets/${ticketId}/description`, {
+                    version: ticket.version,
+                    ops: ops.map(([start, end, text]) => ({ start, end, text }))
+                })
+            }
             return await api.put(`/tickets/${ticketId}`, payload)
         },
         onSuccess: () => {
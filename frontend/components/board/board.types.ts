@@ -40,6 +40,7 @@ export enum TicketActionType {
     ASSIGNEE_CHANGED = "ASSIGNEE_CHANGED",
     PRIORITY_CHANGED = "PRIORITY_CHANGED",
     TICKET_DELETED = "TICKET_DELETED",
+    TICKET_RESTORED = "TICKET_RESTORED",
     COMMENT_ADDED = "COMMENT_ADDED",
     COMMENT_EDITED = "COMMENT_EDITED",
     COMMENT_DELETED = "COMMENT_DELETED",
@@ -55,6 +56,11 @@ export interface TicketHistory {
     field_name?: string
     old_value?: string
     new_value?: string
+    old_ref?: string
+    new_ref?: string
+    comment_id?: string
+    comment?: { id: string, content: string } | null
+    encoding?: 'PATCH' | null  // PATCH: new_value holds [start, end, text, removed] ops, not the text
     created_at: string
     actor: User
 }
@@ -75,10 +81,13 @@ export interface Ticket {
     priority: "low" | "medium" | "high" | string
     board_id: string
     status_column_id: string
+    column_id?: string
     assignee_id?: string | null
     assignee?: User
     reporter?: User
     created_at?: string
+    rank?: string
+    version?: number
 }
 
 export interface Column {
@@ -61,3 +61,14 @@ api.interceptors.response.use(
 );
 
 export default api;
+
+// A page of a cursor-paginated list; nextCursor is null on the last page
+export interface CursorPage<T> {
+    items: T[];
+    nextCursor: string | null;
+}
+
+export async function getPage<T>(url: string, params: Record<string, unknown> = {}): Promise<CursorPage<T>> {
+    const res = await api.get(url, { params });
+    return { items: res.data as T[], nextCursor: res.headers["x-next-cursor"] ?? null };
+}
@@ -0,0 +1,27 @@
+// [start, end, text]: replace the characters [start, end) of the base text with text.
+// Offsets count code points, like the backend, not UTF-16 units.
+export type TextPatchOp = [number, number, string]
+
+export function diffText(oldText: string, newText: string): TextPatchOp[] {
+    if (oldText === newText) return []
+    const a = Array.from(oldText)
+    const b = Array.from(newText)
+    const limit = Math.min(a.length, b.length)
+    let prefix = 0
+    while (prefix < limit && a[prefix] === b[prefix]) prefix++
+    let suffix = 0
+    while (suffix < limit - prefix && a[a.length - 1 - suffix] === b[b.length - 1 - suffix]) suffix++
+    return [[prefix, a.length - suffix, b.slice(prefix, b.length - suffix).join("")]]
+}
+
+export function applyTextPatch(text: string, ops: TextPatchOp[]): string {
+    const chars = Array.from(text)
+    const parts: string[] = []
+    let position = 0
+    for (const [start, end, insert] of [...ops].sort((x, y) => x[0] - y[0] || x[1] - y[1])) {
+        parts.push(chars.slice(position, start).join(""), insert)
+        position = end
+    }
+    parts.push(chars.slice(position).join(""))
+    return parts.join("")
+}